@@ -622,7 +622,8 @@ def hex_to_rgb(hex_color: str) -> RGBColor:
         hex_color = "".join(c * 2 for c in hex_color)
     if len(hex_color) != 6 or not re.match(r"^[0-9A-Fa-f]{6}$", hex_color):
         raise ValueError(f"无效的 HEX 颜色格式: {hex_color}")
-    return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))  # type: ignore
+    value = int(hex_color, 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
 
 
 def rgb_to_hex(rgb: RGBColor) -> str:
@@ -210,7 +210,9 @@ class LayerElement(BaseModel):
     visible: bool = Field(default=True, description="是否可见")
     locked: bool = Field(default=False, description="是否锁定")
 
-    model_config = ConfigDict(use_enum_values=False)  # 保留枚举对象
+    # 保留枚举对象；赋值不做校验（数据在加载/构造时已校验，
+    # 拖拽等高频赋值路径不承担校验开销）
+    model_config = ConfigDict(use_enum_values=False, validate_assignment=False)
 
     @property
     def bounds(self) -> tuple[int, int, int, int]:
@@ -695,6 +697,14 @@ class ImageLayer(LayerElement):
 # 用于类型检查的联合类型
 AnyLayer = Union[TextLayer, ShapeLayer, ImageLayer]
 
+# 图层类型 -> 图层模型类（LayerType 为 str 枚举，枚举值与字符串均可命中）
+_LAYER_CLASSES: dict[str, type] = {
+    LayerType.TEXT.value: TextLayer,
+    LayerType.RECTANGLE.value: ShapeLayer,
+    LayerType.ELLIPSE.value: ShapeLayer,
+    LayerType.IMAGE.value: ImageLayer,
+}
+
 
 # ===================
 # 模板配置
@@ -783,19 +793,38 @@ class TemplateConfig(BaseModel):
                 result.append(layer)
         return result
 
-    def get_layer_by_id(self, layer_id: str) -> Optional[AnyLayer]:
+    def find_layer_index(self, layer_id: str, hint: int = -1) -> int:
+        """查找图层在 layers 中的索引.
+
+        Args:
+            layer_id: 图层ID
+            hint: 上次查找到的索引，命中时无需遍历
+
+        Returns:
+            索引，不存在返回 -1
+        """
+        layers = self.layers
+        if 0 <= hint < len(layers) and layers[hint].get("id") == layer_id:
+            return hint
+        for i, layer_data in enumerate(layers):
+            if layer_data.get("id") == layer_id:
+                return i
+        return -1
+
+    def get_layer_by_id(self, layer_id: str, index_hint: int = -1) -> Optional[AnyLayer]:
         """根据ID获取图层.
 
         Args:
             layer_id: 图层ID
+            index_hint: 索引提示（见 find_layer_index）
 
         Returns:
             图层对象，不存在返回None
         """
-        for layer_data in self.layers:
-            if layer_data.get("id") == layer_id:
-                return self._deserialize_layer(layer_data)
-        return None
+        index = self.find_layer_index(layer_id, index_hint)
+        if index < 0:
+            return None
+        return self._deserialize_layer(self.layers[index])
 
     def add_layer(self, layer: AnyLayer) -> None:
         """添加图层.
@@ -825,20 +854,21 @@ class TemplateConfig(BaseModel):
                 return True
         return False
 
-    def update_layer(self, layer: AnyLayer) -> bool:
+    def update_layer(self, layer: AnyLayer, index_hint: int = -1) -> bool:
         """更新图层.
 
         Args:
             layer: 更新后的图层对象
+            index_hint: 索引提示（见 find_layer_index）
 
         Returns:
             是否更新成功
         """
-        for i, layer_data in enumerate(self.layers):
-            if layer_data.get("id") == layer.id:
-                self.layers[i] = layer.model_dump()
-                return True
-        return False
+        index = self.find_layer_index(layer.id, index_hint)
+        if index < 0:
+            return False
+        self.layers[index] = layer.model_dump()
+        return True
 
     def move_layer(self, layer_id: str, new_z_index: int) -> bool:
         """移动图层层级.
@@ -869,11 +899,16 @@ class TemplateConfig(BaseModel):
         """清空所有图层."""
         self.layers.clear()
 
-    def _deserialize_layer(self, data: dict[str, Any]) -> Optional[AnyLayer]:
+    def _deserialize_layer(
+        self,
+        data: dict[str, Any],
+        _dispatch: Any = _LAYER_CLASSES.get,
+    ) -> Optional[AnyLayer]:
         """反序列化图层数据.
 
         Args:
             data: 图层字典数据
+            _dispatch: 类型查找函数（默认参数绑定，避免每次查找全局变量）
 
         Returns:
             图层对象，失败返回None
@@ -883,12 +918,9 @@ class TemplateConfig(BaseModel):
             return None
 
         try:
-            if layer_type == LayerType.TEXT or layer_type == "text":
-                return TextLayer(**data)
-            elif layer_type in (LayerType.RECTANGLE, LayerType.ELLIPSE, "rectangle", "ellipse"):
-                return ShapeLayer(**data)
-            elif layer_type == LayerType.IMAGE or layer_type == "image":
-                return ImageLayer(**data)
+            layer_cls = _dispatch(layer_type)
+            if layer_cls is not None:
+                return layer_cls(**data)
         except Exception:
             return None
 
@@ -1328,7 +1328,7 @@ class ImageService:
         # 创建背景
         background = Image.new("RGB", image.size, color)
         # 合成
-        background.paste(image, mask=image.split()[3])
+        background.paste(image, mask=image.getchannel("A"))
         return background
 
     def _add_border(
@@ -17,7 +17,7 @@ import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from src.models.template_config import (
     TemplateConfig,
@@ -143,6 +143,9 @@ class TemplateManager:
 
         self._presets_dir = self._templates_dir / PRESET_TEMPLATES_DIR
 
+        # 预设模板元数据缓存（预设为只读资源）
+        self._preset_meta_cache: Optional[List[TemplateMetadata]] = None
+
         # 确保目录存在
         self._ensure_directories()
 
@@ -382,6 +385,27 @@ class TemplateManager:
                 result.append(TemplateMetadata.from_template(template, str(file_path)))
         return result
 
+    def get_all_metas(
+        self,
+        reload_presets: bool = False,
+    ) -> Tuple[List[TemplateMetadata], List[TemplateMetadata]]:
+        """一次获取预设模板和用户模板元数据.
+
+        预设模板为只读资源，首次读取后缓存。
+
+        Args:
+            reload_presets: 是否重新读取预设模板
+
+        Returns:
+            (预设模板列表, 用户模板列表)
+        """
+        if reload_presets or self._preset_meta_cache is None:
+            self._preset_meta_cache = self.get_preset_templates()
+        return (
+            list(self._preset_meta_cache),
+            self.get_template_list(include_presets=False),
+        )
+
     def duplicate_template(self, template_id: str) -> Optional[TemplateConfig]:
         """复制模板.
 
@@ -578,7 +578,7 @@ class TemplateRenderer:
 
         # 应用透明度
         if layer.opacity < 100:
-            alpha = temp.split()[3]
+            alpha = temp.getchannel("A")
             alpha = alpha.point(lambda p: int(p * layer.opacity / 100))
             temp.putalpha(alpha)
 
@@ -679,7 +679,7 @@ class TemplateRenderer:
 
             # 应用透明度
             if layer.opacity < 100:
-                alpha = overlay.split()[3]
+                alpha = overlay.getchannel("A")
                 alpha = alpha.point(lambda p: int(p * layer.opacity / 100))
                 overlay.putalpha(alpha)
 
@@ -488,13 +488,8 @@ class TemplateEditorWindow(QMainWindow):
         if self._canvas:
             self._undo_manager = UndoRedoManager(self._canvas, self)
 
-            # 连接信号更新UI
-            self._undo_manager._stack.can_undo_changed.connect(
-                self._update_undo_actions
-            )
-            self._undo_manager._stack.can_redo_changed.connect(
-                self._update_undo_actions
-            )
+            # 连接信号更新UI（每次栈变化都需刷新撤销/重做提示文字）
+            self._undo_manager.state_changed.connect(self._update_undo_actions)
 
     def _update_undo_actions(self) -> None:
         """更新撤销/重做按钮状态."""
@@ -28,6 +28,7 @@ from PyQt6.QtWidgets import (
 )
 
 from src.utils.constants import SUPPORTED_IMAGE_FORMATS, THUMBNAIL_SIZE
+from src.utils.file_utils import is_image_file
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -276,7 +277,7 @@ class DropZone(QFrame):
             return False
 
         # 检查文件格式
-        if path.suffix.lower() not in SUPPORTED_IMAGE_FORMATS:
+        if not is_image_file(path):
             logger.warning(f"不支持的图片格式: {path.suffix}")
             return False
 
@@ -30,6 +30,7 @@ from PyQt6.QtWidgets import (
 )
 
 from src.utils.constants import SUPPORTED_IMAGE_FORMATS, MAX_TASK_IMAGES
+from src.utils.file_utils import is_image_file
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -495,7 +496,7 @@ class MultiImageDropZone(QFrame):
             logger.warning(f"文件不存在: {file_path}")
             return False
         
-        if path.suffix.lower() not in SUPPORTED_IMAGE_FORMATS:
+        if not is_image_file(path):
             logger.warning(f"不支持的图片格式: {path.suffix}")
             return False
         
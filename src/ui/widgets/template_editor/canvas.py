@@ -14,7 +14,7 @@ from __future__ import annotations
 
 from typing import Optional, List, Dict
 
-from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal, QLineF
+from PyQt6.QtCore import Qt, QRectF, QPointF, QTimer, pyqtSignal, QLineF
 from PyQt6.QtGui import (
     QPainter,
     QPen,
@@ -304,6 +304,16 @@ class TemplateCanvas(QGraphicsView):
         self._template: Optional[TemplateConfig] = None
         self._layer_items: Dict[str, LayerGraphicsItem] = {}
 
+        # 延迟刷新的图层（layer_id -> 新图层数据），同一轮事件循环内合并为一次刷新
+        self._pending_updates: Dict[str, Optional[AnyLayer]] = {}
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self.flush_layer_updates)
+
+        # 批量更新嵌套深度，期间不刷新
+        self._batch_depth = 0
+
         # 交互状态
         self._is_panning = False
         self._pan_start_pos: Optional[QPointF] = None
@@ -540,13 +550,52 @@ class TemplateCanvas(QGraphicsView):
         """
         return self._layer_items.get(layer_id)
 
+    def begin_batch(self) -> None:
+        """开始批量更新，期间的 update_layer 延迟到 end_batch 统一刷新."""
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """结束批量更新，最外层结束时每个图层只刷新一次."""
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush_layer_updates()
+
     def update_layer(self, layer_id: str, new_layer: Optional[AnyLayer] = None) -> None:
         """更新图层显示.
 
+        刷新延迟到下一轮事件循环（或最外层 end_batch），
+        同一图层多次更新只刷新一次。
+
         Args:
             layer_id: 图层ID
             new_layer: 可选的新图层数据对象
         """
+        # 保留最近一次提供的图层数据
+        if new_layer is not None or layer_id not in self._pending_updates:
+            self._pending_updates[layer_id] = new_layer
+        if not self._batch_depth:
+            self._update_timer.start()
+
+    def flush_layer_updates(self) -> None:
+        """立即刷新所有延迟的图层更新（批量更新期间不刷新）."""
+        if self._batch_depth:
+            return
+        self._update_timer.stop()
+        if not self._pending_updates:
+            return
+        pending = self._pending_updates
+        self._pending_updates = {}
+        for layer_id, new_layer in pending.items():
+            self._apply_layer_update(layer_id, new_layer)
+
+    def _apply_layer_update(
+        self,
+        layer_id: str,
+        new_layer: Optional[AnyLayer] = None,
+    ) -> None:
+        """刷新单个图层项的显示."""
         if layer_id in self._layer_items:
             item = self._layer_items[layer_id]
             if new_layer:
@@ -10,14 +10,18 @@ Features:
 
 from __future__ import annotations
 
-from typing import Optional, List
+from collections import OrderedDict
+from datetime import datetime
+from functools import partial
+from typing import Dict, Optional, List, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QAction
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QAction, QBrush, QShowEvent
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QLabel,
@@ -25,6 +29,7 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QMenu,
     QMessageBox,
+    QDialog,
     QInputDialog,
     QFileDialog,
     QFrame,
@@ -36,6 +41,44 @@ from src.services.template_manager import TemplateManager, TemplateMetadata
 from src.models.template_config import TemplateConfig
 
 
+# 列表分批布局的每批行数
+LIST_BATCH_SIZE = 50
+
+# 列表项中保存模板 ID 的数据角色
+TEMPLATE_ID_ROLE = Qt.ItemDataRole.UserRole
+
+# 列表项显示文本缓存上限
+DISPLAY_CACHE_SIZE = 256
+
+# (template_id, 名称, modified_at) -> (显示文本, 提示文本)
+_DISPLAY_CACHE: "OrderedDict[Tuple[str, str, datetime], Tuple[str, str]]" = OrderedDict()
+
+# 预设模板前景色（共享同一画刷）
+_PRESET_FOREGROUND = QBrush(Qt.GlobalColor.darkBlue)
+
+
+def _get_display_strings(m: TemplateMetadata) -> Tuple[str, str]:
+    """获取列表项的显示文本和提示文本（按模板 ID、名称与修改时间缓存）."""
+    key = (m.id, m.name, m.modified_at)
+    cached = _DISPLAY_CACHE.get(key)
+    if cached is not None:
+        _DISPLAY_CACHE.move_to_end(key)
+        return cached
+
+    prefix = "📋 " if m.is_preset else "📄 "
+    cached = (
+        f"{prefix}{m.name}",
+        f"名称: {m.name}\n"
+        f"尺寸: {m.canvas_width}×{m.canvas_height}\n"
+        f"图层数: {m.layer_count}\n"
+        f"描述: {m.description or '无'}",
+    )
+    _DISPLAY_CACHE[key] = cached
+    if len(_DISPLAY_CACHE) > DISPLAY_CACHE_SIZE:
+        _DISPLAY_CACHE.popitem(last=False)
+    return cached
+
+
 # ===================
 # 模板列表项
 # ===================
@@ -48,6 +91,7 @@ class TemplateListItem(QListWidgetItem):
         """初始化."""
         super().__init__()
         self._metadata = metadata
+        self.setData(TEMPLATE_ID_ROLE, metadata.id)
         self._update_display()
 
     @property
@@ -60,20 +104,20 @@ class TemplateListItem(QListWidgetItem):
         """获取模板 ID."""
         return self._metadata.id
 
+    def set_metadata(self, metadata: TemplateMetadata) -> None:
+        """更新元数据并刷新显示."""
+        self._metadata = metadata
+        self._update_display()
+
     def _update_display(self) -> None:
         """更新显示."""
         m = self._metadata
-        prefix = "📋 " if m.is_preset else "📄 "
-        self.setText(f"{prefix}{m.name}")
-        self.setToolTip(
-            f"名称: {m.name}\n"
-            f"尺寸: {m.canvas_width}×{m.canvas_height}\n"
-            f"图层数: {m.layer_count}\n"
-            f"描述: {m.description or '无'}"
-        )
+        text, tooltip = _get_display_strings(m)
+        self.setText(text)
+        self.setToolTip(tooltip)
         # 预设模板使用不同样式
         if m.is_preset:
-            self.setForeground(Qt.GlobalColor.darkBlue)
+            self.setForeground(_PRESET_FOREGROUND)
 
 
 # ===================
@@ -93,6 +137,9 @@ class TemplateListWidget(QFrame):
     template_deleted = pyqtSignal(str)  # template_id
     template_renamed = pyqtSignal(str)  # template_id
 
+    # 标题栏工具按钮边长
+    TOOL_BUTTON_SIZE = 24
+
     def __init__(
         self,
         manager: Optional[TemplateManager] = None,
@@ -106,8 +153,21 @@ class TemplateListWidget(QFrame):
         """
         super().__init__(parent)
         self._manager = manager or TemplateManager()
+        # 列表待刷新标记（首次显示时再加载）
+        self._dirty = True
+        # 下次刷新时是否重新读取预设模板（预设由管理器缓存）
+        self._reload_presets = False
+        # template_id -> 列表项索引（按项而非行号索引，插入/删除时无需重排）
+        self._my_index: Dict[str, TemplateListItem] = {}
+        self._preset_index: Dict[str, TemplateListItem] = {}
+        # 名称输入对话框（首次使用时创建，之后复用）
+        self._name_dialog: Optional[QInputDialog] = None
+        # 合并同一事件循环内的多次刷新请求
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh_list)
         self._setup_ui()
-        self._refresh_list()
 
     def _setup_ui(self) -> None:
         """设置 UI."""
@@ -123,17 +183,11 @@ class TemplateListWidget(QFrame):
         header.addStretch()
 
         # 新建按钮
-        self._new_btn = QPushButton("+")
-        self._new_btn.setFixedSize(24, 24)
-        self._new_btn.setToolTip("新建模板")
-        self._new_btn.clicked.connect(self._on_new_template)
+        self._new_btn = self._create_tool_button("+", "新建模板", self._on_new_template)
         header.addWidget(self._new_btn)
 
         # 刷新按钮
-        self._refresh_btn = QPushButton("⟳")
-        self._refresh_btn.setFixedSize(24, 24)
-        self._refresh_btn.setToolTip("刷新列表")
-        self._refresh_btn.clicked.connect(self._refresh_list)
+        self._refresh_btn = self._create_tool_button("⟳", "刷新列表", self._on_refresh)
         header.addWidget(self._refresh_btn)
 
         layout.addLayout(header)
@@ -144,6 +198,7 @@ class TemplateListWidget(QFrame):
         preset_layout.setContentsMargins(4, 4, 4, 4)
 
         self._preset_list = QListWidget()
+        self._configure_list_view(self._preset_list)
         self._preset_list.setMaximumHeight(150)
         self._preset_list.itemClicked.connect(self._on_preset_clicked)
         self._preset_list.itemDoubleClicked.connect(self._on_preset_double_clicked)
@@ -157,6 +212,7 @@ class TemplateListWidget(QFrame):
         my_layout.setContentsMargins(4, 4, 4, 4)
 
         self._my_list = QListWidget()
+        self._configure_list_view(self._my_list)
         self._my_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self._my_list.customContextMenuRequested.connect(self._show_context_menu)
         self._my_list.itemClicked.connect(self._on_my_template_clicked)
@@ -184,24 +240,130 @@ class TemplateListWidget(QFrame):
 
         layout.addLayout(btn_layout)
 
+    def _create_tool_button(self, text: str, tooltip: str, slot) -> QPushButton:
+        """创建标题栏工具按钮."""
+        btn = QPushButton(text)
+        btn.setFixedSize(self.TOOL_BUTTON_SIZE, self.TOOL_BUTTON_SIZE)
+        btn.setToolTip(tooltip)
+        btn.clicked.connect(slot)
+        return btn
+
+    def _prompt_name(self, title: str, label: str, text: str) -> Tuple[str, bool]:
+        """弹出名称输入框（复用同一个对话框）.
+
+        Returns:
+            (输入文本, 是否确认)
+        """
+        if self._name_dialog is None:
+            self._name_dialog = QInputDialog(self)
+            self._name_dialog.setInputMode(QInputDialog.InputMode.TextInput)
+        dialog = self._name_dialog
+        dialog.setWindowTitle(title)
+        dialog.setLabelText(label)
+        dialog.setTextValue(text)
+        ok = dialog.exec() == QDialog.DialogCode.Accepted
+        return dialog.textValue(), ok
+
+    @staticmethod
+    def _configure_list_view(list_widget: QListWidget) -> None:
+        """配置列表视图：行高一致，分批布局."""
+        # 所有行高度相同，Qt 无需逐行测量
+        list_widget.setUniformItemSizes(True)
+        # 分批布局，大列表时每批之间返回事件循环
+        list_widget.setLayoutMode(QListView.LayoutMode.Batched)
+        list_widget.setBatchSize(LIST_BATCH_SIZE)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """显示时补做被推迟的刷新."""
+        super().showEvent(event)
+        if self._dirty:
+            self._refresh_list()
+
+    def _mark_dirty(self) -> None:
+        """标记列表需要刷新，不可见时推迟到下次显示."""
+        self._dirty = True
+        if self.isVisible():
+            self._refresh_list()
+
+    def _on_refresh(self) -> None:
+        """刷新按钮 - 同时重新加载预设模板."""
+        self._reload_presets = True
+        self._mark_dirty()
+
+    def _ensure_populated(self) -> None:
+        """确保列表已加载（立即执行待处理的刷新）."""
+        if self._dirty:
+            self._refresh_timer.stop()
+            self._do_refresh_list()
+
     def _refresh_list(self) -> None:
+        """请求刷新模板列表（下一轮事件循环执行）."""
+        self._refresh_timer.start()
+
+    def _do_refresh_list(self) -> None:
         """刷新模板列表."""
-        # 清空列表
-        self._preset_list.clear()
-        self._my_list.clear()
-
-        # 预设模板
-        presets = self._manager.get_preset_templates()
-        for meta in presets:
-            item = TemplateListItem(meta)
-            self._preset_list.addItem(item)
-
-        # 用户模板
-        all_templates = self._manager.get_template_list(include_presets=False)
-        for meta in all_templates:
-            if not meta.is_preset:
-                item = TemplateListItem(meta)
-                self._my_list.addItem(item)
+        self._dirty = False
+
+        # 一次查询同时获取预设和用户模板
+        presets, mine = self._manager.get_all_metas(reload_presets=self._reload_presets)
+        self._reload_presets = False
+
+        self._preset_index = self._populate(self._preset_list, presets)
+        self._my_index = self._populate(self._my_list, mine)
+
+    @staticmethod
+    def _populate(
+        list_widget: QListWidget,
+        metas: List[TemplateMetadata],
+    ) -> Dict[str, TemplateListItem]:
+        """批量重建列表内容，期间暂停重绘.
+
+        Returns:
+            template_id 到列表项的索引
+        """
+        items = [TemplateListItem(meta) for meta in metas]
+        list_widget.setUpdatesEnabled(False)
+        try:
+            list_widget.clear()
+            for item in items:
+                list_widget.addItem(item)
+        finally:
+            list_widget.setUpdatesEnabled(True)
+        list_widget.viewport().update()
+        return {item.template_id: item for item in items}
+
+    # ========================
+    # 增量更新
+    # ========================
+
+    def _insert_row(self, meta: TemplateMetadata, row: int = 0) -> TemplateListItem:
+        """插入用户模板行（默认插入顶部，与按修改时间倒序一致）."""
+        item = TemplateListItem(meta)
+        self._my_list.insertItem(row, item)
+        self._my_index[item.template_id] = item
+        return item
+
+    def _remove_row(self, template_id: str) -> bool:
+        """移除用户模板行."""
+        item = self._my_index.pop(template_id, None)
+        if item is None:
+            return False
+        self._my_list.takeItem(self._my_list.row(item))
+        return True
+
+    def _update_row(self, template_id: str, meta: TemplateMetadata) -> bool:
+        """更新用户模板行的显示."""
+        item = self._my_index.get(template_id)
+        if item is None:
+            return False
+        item.set_metadata(meta)
+        return True
+
+    def _add_and_select(self, template: TemplateConfig) -> None:
+        """插入新模板行并选中."""
+        item = self._insert_row(TemplateMetadata.from_template(template))
+        self._my_list.setCurrentItem(item)
+        self._preset_list.clearSelection()
 
     def _on_preset_clicked(self, item: TemplateListItem) -> None:
         """预设模板点击."""
@@ -212,8 +374,7 @@ class TemplateListWidget(QFrame):
         template = self._manager.load_template(item.template_id)
         if template:
             # 另存为新模板
-            name, ok = QInputDialog.getText(
-                self,
+            name, ok = self._prompt_name(
                 "新建模板",
                 "请输入模板名称:",
                 text=f"{template.name} - 我的版本",
@@ -221,7 +382,7 @@ class TemplateListWidget(QFrame):
             if ok and name:
                 new_template = self._manager.save_template_as(template, name)
                 if new_template:
-                    self._refresh_list()
+                    self._add_and_select(new_template)
                     self.template_created.emit(new_template.id)
                     self.template_selected.emit(new_template.id)
 
@@ -243,15 +404,15 @@ class TemplateListWidget(QFrame):
         menu = QMenu(self)
 
         open_action = menu.addAction("打开")
-        open_action.triggered.connect(lambda: self._on_my_template_double_clicked(item))
+        open_action.triggered.connect(partial(self._on_my_template_double_clicked, item))
 
         rename_action = menu.addAction("重命名")
-        rename_action.triggered.connect(lambda: self._on_rename(item))
+        rename_action.triggered.connect(partial(self._on_rename, item))
 
         menu.addSeparator()
 
         duplicate_action = menu.addAction("复制")
-        duplicate_action.triggered.connect(lambda: self._on_duplicate(item))
+        duplicate_action.triggered.connect(partial(self._on_duplicate, item))
 
         export_action = menu.addAction("导出")
         export_action.triggered.connect(self._on_export)
@@ -265,8 +426,7 @@ class TemplateListWidget(QFrame):
 
     def _on_new_template(self) -> None:
         """新建模板."""
-        name, ok = QInputDialog.getText(
-            self,
+        name, ok = self._prompt_name(
             "新建模板",
             "请输入模板名称:",
             text="未命名模板",
@@ -274,29 +434,37 @@ class TemplateListWidget(QFrame):
         if ok and name:
             template = TemplateConfig.create(name)
             if self._manager.save_template(template):
-                self._refresh_list()
+                self._add_and_select(template)
                 self.template_created.emit(template.id)
                 self.template_selected.emit(template.id)
 
     def _on_rename(self, item: TemplateListItem) -> None:
         """重命名模板."""
-        name, ok = QInputDialog.getText(
-            self,
+        name, ok = self._prompt_name(
             "重命名",
             "请输入新名称:",
             text=item.metadata.name,
         )
-        if ok and name and name != item.metadata.name:
-            if self._manager.rename_template(item.template_id, name):
-                self._refresh_list()
-                # 发射重命名信号
-                self.template_renamed.emit(item.template_id)
+        name = name.strip()
+        # 取消、空名称或名称未变化时不触碰管理器
+        if not ok or not name or name == item.metadata.name:
+            return
+
+        if not self._manager.rename_template(item.template_id, name):
+            return
+
+        meta = item.metadata
+        meta.name = name
+        meta.modified_at = datetime.now()
+        self._update_row(item.template_id, meta)
+        # 发射重命名信号
+        self.template_renamed.emit(item.template_id)
 
     def _on_duplicate(self, item: TemplateListItem) -> None:
         """复制模板."""
         new_template = self._manager.duplicate_template(item.template_id)
         if new_template:
-            self._refresh_list()
+            self._add_and_select(new_template)
             self.template_created.emit(new_template.id)
 
     def _on_delete(self) -> None:
@@ -316,7 +484,7 @@ class TemplateListWidget(QFrame):
         if reply == QMessageBox.StandardButton.Yes:
             template_id = item.template_id
             if self._manager.delete_template(template_id):
-                self._refresh_list()
+                self._remove_row(template_id)
                 self.template_deleted.emit(template_id)
 
     def _on_import(self) -> None:
@@ -330,7 +498,7 @@ class TemplateListWidget(QFrame):
         if path:
             template = self._manager.import_template(path)
             if template:
-                self._refresh_list()
+                self._add_and_select(template)
                 self.template_created.emit(template.id)
                 QMessageBox.information(
                     self,
@@ -378,22 +546,19 @@ class TemplateListWidget(QFrame):
 
     def select_template(self, template_id: str) -> None:
         """选中指定模板."""
-        # 先在用户模板中查找
-        for i in range(self._my_list.count()):
-            item = self._my_list.item(i)
-            if isinstance(item, TemplateListItem) and item.template_id == template_id:
-                self._my_list.setCurrentItem(item)
-                self._preset_list.clearSelection()
-                return
-
-        # 再在预设模板中查找
-        for i in range(self._preset_list.count()):
-            item = self._preset_list.item(i)
-            if isinstance(item, TemplateListItem) and item.template_id == template_id:
-                self._preset_list.setCurrentItem(item)
-                self._my_list.clearSelection()
-                return
+        self._ensure_populated()
+
+        item = self._my_index.get(template_id)
+        if item is not None:
+            self._my_list.setCurrentItem(item)
+            self._preset_list.clearSelection()
+            return
+
+        item = self._preset_index.get(template_id)
+        if item is not None:
+            self._preset_list.setCurrentItem(item)
+            self._my_list.clearSelection()
 
     def refresh(self) -> None:
         """刷新列表."""
-        self._refresh_list()
+        self._mark_dirty()
@@ -44,10 +44,21 @@ class TextEditWidget(QTextEdit):
     # 编辑取消信号
     editing_cancelled = pyqtSignal()
 
+    # 对齐方式映射
+    _ALIGN_MAP = {
+        TextAlign.LEFT: Qt.AlignmentFlag.AlignLeft,
+        TextAlign.CENTER: Qt.AlignmentFlag.AlignCenter,
+        TextAlign.RIGHT: Qt.AlignmentFlag.AlignRight,
+    }
+
     def __init__(self, parent=None) -> None:
         """初始化文字编辑组件."""
         super().__init__(parent)
 
+        # 复用的字体对象（每次编辑时原地修改）
+        self._font = QFont()
+        self._default_family = self._font.family()
+
         # 设置基本属性
         self.setFrameStyle(0)  # 无边框
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -70,9 +81,8 @@ class TextEditWidget(QTextEdit):
             layer: 文字图层数据
         """
         # 设置字体
-        font = QFont()
-        if layer.font_family:
-            font.setFamily(layer.font_family)
+        font = self._font
+        font.setFamily(layer.font_family or self._default_family)
         font.setPointSize(layer.font_size)
         font.setBold(layer.bold)
         font.setItalic(layer.italic)
@@ -86,12 +96,7 @@ class TextEditWidget(QTextEdit):
         self.setPalette(palette)
 
         # 设置对齐
-        align_map = {
-            TextAlign.LEFT: Qt.AlignmentFlag.AlignLeft,
-            TextAlign.CENTER: Qt.AlignmentFlag.AlignCenter,
-            TextAlign.RIGHT: Qt.AlignmentFlag.AlignRight,
-        }
-        alignment = align_map.get(layer.align, Qt.AlignmentFlag.AlignLeft)
+        alignment = self._ALIGN_MAP.get(layer.align, Qt.AlignmentFlag.AlignLeft)
         self.setAlignment(alignment)
 
         # 设置自动换行
@@ -149,6 +154,8 @@ class TextEditOverlay(QGraphicsProxyWidget):
 
         self._layer_id: Optional[str] = None
         self._layer_item: Optional["TextLayerItem"] = None
+        # 上次配置编辑器时的图层签名，未变化时跳过重新配置
+        self._last_sig: Optional[tuple] = None
 
         # 创建编辑器
         self._editor = TextEditWidget()
@@ -178,22 +185,30 @@ class TextEditOverlay(QGraphicsProxyWidget):
         self._layer_id = layer_item.layer_id
         self._layer_item = layer_item
         layer = layer_item.text_layer
-
-        # 配置编辑器
-        self._editor.setup_from_layer(layer)
-
-        # 设置位置和大小（与图层对齐）
         padding = layer.background_padding
-        rect = QRectF(
-            padding,
-            padding,
-            layer.width - padding * 2,
-            layer.height - padding * 2,
-        )
-        self.setGeometry(rect)
+
+        sig = self._layer_signature(layer)
+        if sig == self._last_sig:
+            # 同一图层且样式未变：只恢复内容和选区
+            if self._editor.toPlainText() != layer.content:
+                self._editor.setPlainText(layer.content)
+            self._editor.selectAll()
+        else:
+            # 配置编辑器
+            self._editor.setup_from_layer(layer)
+
+            # 设置位置和大小（与图层对齐）
+            rect = QRectF(
+                padding,
+                padding,
+                layer.width - padding * 2,
+                layer.height - padding * 2,
+            )
+            self.setGeometry(rect)
+            self._last_sig = sig
 
         # 设置位置到图层
-        self.setPos(layer_item.pos() + QRectF(0, 0, padding, padding).topLeft())
+        self.setPos(layer_item.pos())
 
         # 显示并获取焦点
         self.show()
@@ -203,6 +218,25 @@ class TextEditOverlay(QGraphicsProxyWidget):
         # 强制激活编辑器
         self._editor.activateWindow()
 
+    @staticmethod
+    def _layer_signature(layer: "TextLayer") -> tuple:
+        """影响编辑器配置的图层属性签名."""
+        return (
+            layer.id,
+            layer.content,
+            layer.font_family,
+            layer.font_size,
+            layer.bold,
+            layer.italic,
+            layer.underline,
+            tuple(layer.font_color),
+            layer.align,
+            layer.word_wrap,
+            layer.width,
+            layer.height,
+            layer.background_padding,
+        )
+
     def finish_editing(self) -> str:
         """完成编辑并返回新内容.
 
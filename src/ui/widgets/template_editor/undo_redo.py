@@ -12,17 +12,14 @@ Features:
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from collections import deque
+from typing import Optional, List, Dict, Any, Deque, Hashable, TYPE_CHECKING
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
-from src.models.template_config import (
-    AnyLayer,
-    TextLayer,
-    ShapeLayer,
-    ImageLayer,
-)
+from src.models.template_config import AnyLayer
 from src.utils.logger import setup_logger
 
 if TYPE_CHECKING:
@@ -51,6 +48,8 @@ class Command(ABC):
         ...         pass
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def execute(self) -> None:
         """执行命令."""
@@ -65,6 +64,27 @@ class Command(ABC):
         """重做命令（默认调用 execute）."""
         self.execute()
 
+    def merge_id(self) -> Optional[Hashable]:
+        """合并标识.
+
+        相同标识的相邻命令在短时间内入栈时可合并为一条。
+
+        Returns:
+            合并标识，None 表示不可合并
+        """
+        return None
+
+    def merge_with(self, other: "Command") -> bool:
+        """将后续命令合并到当前命令.
+
+        Args:
+            other: 后入栈的同标识命令（已执行）
+
+        Returns:
+            是否合并成功
+        """
+        return False
+
     @property
     def description(self) -> str:
         """命令描述（用于显示）."""
@@ -101,6 +121,9 @@ class CommandStack(QObject):
     # 默认最大栈深度
     DEFAULT_MAX_DEPTH = 50
 
+    # 连续命令合并的时间窗口（秒）
+    MERGE_INTERVAL = 0.5
+
     def __init__(
         self,
         max_depth: int = DEFAULT_MAX_DEPTH,
@@ -114,11 +137,19 @@ class CommandStack(QObject):
         """
         super().__init__(parent)
 
-        self._undo_stack: List[Command] = []
+        # 达到最大深度时 deque 自动丢弃最旧的命令
+        self._undo_stack: Deque[Command] = deque(maxlen=max_depth)
         self._redo_stack: List[Command] = []
         self._max_depth = max_depth
         self._is_executing = False
 
+        # 上次发出的状态，仅在变化时发送 can_*_changed 信号
+        self._last_can_undo = False
+        self._last_can_redo = False
+
+        # 上次入栈时间，用于判断是否合并连续命令
+        self._last_push_time = 0.0
+
     @property
     def can_undo(self) -> bool:
         """是否可以撤销."""
@@ -160,7 +191,8 @@ class CommandStack(QObject):
             command: 命令对象
             execute: 是否立即执行
         """
-        if self._is_executing:
+        # 空批量命令不入栈
+        if self._is_executing or command is _NOOP_COMMAND:
             return
 
         self._is_executing = True
@@ -170,24 +202,33 @@ class CommandStack(QObject):
             if execute:
                 command.execute()
 
-            # 添加到撤销栈
-            self._undo_stack.append(command)
+            # 与栈顶命令合并，或添加到撤销栈
+            now = time.monotonic()
+            if not self._try_merge(command, now):
+                self._undo_stack.append(command)
+            self._last_push_time = now
 
             # 清空重做栈
             self._redo_stack.clear()
 
-            # 限制栈深度
-            while len(self._undo_stack) > self._max_depth:
-                self._undo_stack.pop(0)
-
             # 发送信号
             self._emit_state_changed()
 
-            logger.debug(f"命令入栈: {command.description}")
+            logger.debug("命令入栈: %s", command.description)
 
         finally:
             self._is_executing = False
 
+    def _try_merge(self, command: Command, now: float) -> bool:
+        """尝试将命令合并到栈顶命令."""
+        if not self._undo_stack or now - self._last_push_time >= self.MERGE_INTERVAL:
+            return False
+        merge_id = command.merge_id()
+        if merge_id is None:
+            return False
+        top = self._undo_stack[-1]
+        return merge_id == top.merge_id() and top.merge_with(command)
+
     def undo(self) -> bool:
         """撤销.
 
@@ -203,10 +244,11 @@ class CommandStack(QObject):
             command = self._undo_stack.pop()
             command.undo()
             self._redo_stack.append(command)
+            self._last_push_time = 0.0
 
             self._emit_state_changed()
 
-            logger.debug(f"撤销: {command.description}")
+            logger.debug("撤销: %s", command.description)
             return True
 
         finally:
@@ -227,10 +269,11 @@ class CommandStack(QObject):
             command = self._redo_stack.pop()
             command.redo()
             self._undo_stack.append(command)
+            self._last_push_time = 0.0
 
             self._emit_state_changed()
 
-            logger.debug(f"重做: {command.description}")
+            logger.debug("重做: %s", command.description)
             return True
 
         finally:
@@ -240,13 +283,26 @@ class CommandStack(QObject):
         """清空所有命令栈."""
         self._undo_stack.clear()
         self._redo_stack.clear()
+        self._last_push_time = 0.0
         self._emit_state_changed()
         logger.debug("命令栈已清空")
 
     def _emit_state_changed(self) -> None:
-        """发送状态改变信号."""
-        self.can_undo_changed.emit(self.can_undo)
-        self.can_redo_changed.emit(self.can_redo)
+        """发送状态改变信号.
+
+        can_undo_changed/can_redo_changed 仅在状态翻转时发送；
+        stack_changed 每次都发送（栈顶描述可能已变化）。
+        """
+        can_undo = self.can_undo
+        if can_undo != self._last_can_undo:
+            self._last_can_undo = can_undo
+            self.can_undo_changed.emit(can_undo)
+
+        can_redo = self.can_redo
+        if can_redo != self._last_can_redo:
+            self._last_can_redo = can_redo
+            self.can_redo_changed.emit(can_redo)
+
         self.stack_changed.emit()
 
 
@@ -258,6 +314,8 @@ class CommandStack(QObject):
 class AddLayerCommand(Command):
     """添加图层命令."""
 
+    __slots__ = ("_canvas", "_layer")
+
     def __init__(self, canvas: "TemplateCanvas", layer: AnyLayer) -> None:
         """初始化添加图层命令.
 
@@ -266,8 +324,9 @@ class AddLayerCommand(Command):
             layer: 图层数据
         """
         self._canvas = canvas
-        self._layer = layer
-        self._layer_data = layer.model_dump()
+        # 保存快照：画布图形项会直接修改传入的图层对象（拖拽/缩放），
+        # 重做时必须恢复添加时的状态
+        self._layer = layer.model_copy(deep=True)
 
     def execute(self) -> None:
         """执行：添加图层."""
@@ -288,20 +347,15 @@ class AddLayerCommand(Command):
         return f"添加图层 '{self._layer.name}'"
 
     def _recreate_layer(self) -> Optional[AnyLayer]:
-        """重新创建图层."""
-        layer_type = self._layer_data.get("type")
-        if layer_type == "text":
-            return TextLayer(**self._layer_data)
-        elif layer_type in ("rectangle", "ellipse"):
-            return ShapeLayer(**self._layer_data)
-        elif layer_type == "image":
-            return ImageLayer(**self._layer_data)
-        return None
+        """重新创建图层（深拷贝，无需重新校验）."""
+        return self._layer.model_copy(deep=True)
 
 
 class RemoveLayerCommand(Command):
     """删除图层命令."""
 
+    __slots__ = ("_canvas", "_layer_id", "_layer_snapshot")
+
     def __init__(self, canvas: "TemplateCanvas", layer_id: str) -> None:
         """初始化删除图层命令.
 
@@ -311,13 +365,11 @@ class RemoveLayerCommand(Command):
         """
         self._canvas = canvas
         self._layer_id = layer_id
-        self._layer_data: Optional[dict] = None
+        self._layer_snapshot: Optional[AnyLayer] = None
 
-        # 保存图层数据
+        # 保存图层快照（get_layer_by_id 返回的是独立的新对象）
         if canvas.template:
-            layer = canvas.template.get_layer_by_id(layer_id)
-            if layer:
-                self._layer_data = layer.model_dump()
+            self._layer_snapshot = canvas.template.get_layer_by_id(layer_id)
 
     def execute(self) -> None:
         """执行：删除图层."""
@@ -325,36 +377,55 @@ class RemoveLayerCommand(Command):
 
     def undo(self) -> None:
         """撤销：恢复图层."""
-        if self._layer_data and self._canvas.template:
-            layer = self._recreate_layer()
-            if layer:
-                self._canvas.template.add_layer(layer)
-                self._canvas._add_layer_item(layer)
+        if self._layer_snapshot and self._canvas.template:
+            # 浅拷贝即可：图层字段均为不可变值，拷贝避免图形项修改快照
+            layer = self._layer_snapshot.model_copy()
+            self._canvas.template.add_layer(layer)
+            self._canvas._add_layer_item(layer)
 
     @property
     def description(self) -> str:
         """命令描述."""
-        name = self._layer_data.get("name", "") if self._layer_data else ""
+        name = self._layer_snapshot.name if self._layer_snapshot else ""
         return f"删除图层 '{name}'"
 
-    def _recreate_layer(self) -> Optional[AnyLayer]:
-        """重新创建图层."""
-        if not self._layer_data:
-            return None
-
-        layer_type = self._layer_data.get("type")
-        if layer_type == "text":
-            return TextLayer(**self._layer_data)
-        elif layer_type in ("rectangle", "ellipse"):
-            return ShapeLayer(**self._layer_data)
-        elif layer_type == "image":
-            return ImageLayer(**self._layer_data)
-        return None
 
+class _LayerCommand(Command):
+    """作用于单个已存在图层的命令基类.
+
+    缓存图层在模板 layers 中的索引，重复执行/撤销时无需线性查找。
+    """
+
+    __slots__ = ("_canvas", "_layer_id", "_layer_index")
+
+    def __init__(self, canvas: "TemplateCanvas", layer_id: str) -> None:
+        """初始化.
+
+        Args:
+            canvas: 画布组件
+            layer_id: 图层ID
+        """
+        self._canvas = canvas
+        self._layer_id = layer_id
+        self._layer_index = -1
 
-class ModifyLayerCommand(Command):
+    def _get_layer(self) -> Optional[AnyLayer]:
+        """获取目标图层（刷新索引缓存）."""
+        template = self._canvas.template
+        self._layer_index = template.find_layer_index(self._layer_id, self._layer_index)
+        return template.get_layer_by_id(self._layer_id, self._layer_index)
+
+    def _commit_layer(self, layer: AnyLayer) -> None:
+        """写回图层并刷新画布."""
+        self._canvas.template.update_layer(layer, self._layer_index)
+        self._canvas.update_layer(self._layer_id)
+
+
+class ModifyLayerCommand(_LayerCommand):
     """修改图层属性命令."""
 
+    __slots__ = ("_property_name", "_old_value", "_new_value")
+
     def __init__(
         self,
         canvas: "TemplateCanvas",
@@ -372,8 +443,7 @@ class ModifyLayerCommand(Command):
             old_value: 旧值
             new_value: 新值
         """
-        self._canvas = canvas
-        self._layer_id = layer_id
+        super().__init__(canvas, layer_id)
         self._property_name = property_name
         self._old_value = old_value
         self._new_value = new_value
@@ -391,19 +461,31 @@ class ModifyLayerCommand(Command):
         """命令描述."""
         return f"修改 {self._property_name}"
 
+    def merge_id(self) -> Optional[Hashable]:
+        """同一图层同一属性的连续修改可合并."""
+        return ("modify_layer", self._layer_id, self._property_name)
+
+    def merge_with(self, other: Command) -> bool:
+        """保留最早的旧值，采用最新的新值."""
+        if not isinstance(other, ModifyLayerCommand):
+            return False
+        self._new_value = other._new_value
+        return True
+
     def _set_property(self, value: Any) -> None:
         """设置属性值."""
         if self._canvas.template:
-            layer = self._canvas.template.get_layer_by_id(self._layer_id)
+            layer = self._get_layer()
             if layer:
                 setattr(layer, self._property_name, value)
-                self._canvas.template.update_layer(layer)
-                self._canvas.update_layer(self._layer_id)
+                self._commit_layer(layer)
 
 
-class MoveLayerCommand(Command):
+class MoveLayerCommand(_LayerCommand):
     """移动图层命令."""
 
+    __slots__ = ("_old_x", "_old_y", "_new_x", "_new_y")
+
     def __init__(
         self,
         canvas: "TemplateCanvas",
@@ -423,8 +505,7 @@ class MoveLayerCommand(Command):
             new_x: 新X坐标
             new_y: 新Y坐标
         """
-        self._canvas = canvas
-        self._layer_id = layer_id
+        super().__init__(canvas, layer_id)
         self._old_x = old_x
         self._old_y = old_y
         self._new_x = new_x
@@ -443,20 +524,42 @@ class MoveLayerCommand(Command):
         """命令描述."""
         return "移动图层"
 
+    def merge_id(self) -> Optional[Hashable]:
+        """同一图层的连续移动（拖拽）可合并."""
+        return ("move_layer", self._layer_id)
+
+    def merge_with(self, other: Command) -> bool:
+        """保留最早的旧坐标，采用最新的新坐标."""
+        if not isinstance(other, MoveLayerCommand):
+            return False
+        self._new_x = other._new_x
+        self._new_y = other._new_y
+        return True
+
     def _set_position(self, x: int, y: int) -> None:
         """设置图层位置."""
         if self._canvas.template:
-            layer = self._canvas.template.get_layer_by_id(self._layer_id)
+            layer = self._get_layer()
             if layer:
-                layer.x = x
-                layer.y = y
-                self._canvas.template.update_layer(layer)
-                self._canvas.update_layer(self._layer_id)
+                # 坐标来自画布交互，直接写入字段，跳过 BaseModel.__setattr__
+                layer.__dict__.update(x=x, y=y)
+                self._commit_layer(layer)
 
 
-class ResizeLayerCommand(Command):
+class ResizeLayerCommand(_LayerCommand):
     """调整图层大小命令."""
 
+    __slots__ = (
+        "_old_width",
+        "_old_height",
+        "_new_width",
+        "_new_height",
+        "_old_x",
+        "_old_y",
+        "_new_x",
+        "_new_y",
+    )
+
     def __init__(
         self,
         canvas: "TemplateCanvas",
@@ -484,8 +587,7 @@ class ResizeLayerCommand(Command):
             new_x: 新X坐标
             new_y: 新Y坐标
         """
-        self._canvas = canvas
-        self._layer_id = layer_id
+        super().__init__(canvas, layer_id)
         self._old_width = old_width
         self._old_height = old_height
         self._new_width = new_width
@@ -518,6 +620,25 @@ class ResizeLayerCommand(Command):
         """命令描述."""
         return "调整图层大小"
 
+    def merge_id(self) -> Optional[Hashable]:
+        """同一图层的连续调整大小可合并."""
+        return ("resize_layer", self._layer_id)
+
+    def merge_with(self, other: Command) -> bool:
+        """保留最早的旧尺寸，采用最新的新尺寸."""
+        if not isinstance(other, ResizeLayerCommand):
+            return False
+        # 是否记录坐标必须一致，否则合并后无法完整撤销
+        if (self._new_x is None) != (other._new_x is None) or (
+            self._new_y is None
+        ) != (other._new_y is None):
+            return False
+        self._new_width = other._new_width
+        self._new_height = other._new_height
+        self._new_x = other._new_x
+        self._new_y = other._new_y
+        return True
+
     def _set_size(
         self,
         width: int,
@@ -527,7 +648,7 @@ class ResizeLayerCommand(Command):
     ) -> None:
         """设置图层大小."""
         if self._canvas.template:
-            layer = self._canvas.template.get_layer_by_id(self._layer_id)
+            layer = self._get_layer()
             if layer:
                 layer.width = width
                 layer.height = height
@@ -535,35 +656,107 @@ class ResizeLayerCommand(Command):
                     layer.x = x
                 if y is not None:
                     layer.y = y
-                self._canvas.template.update_layer(layer)
-                self._canvas.update_layer(self._layer_id)
+                self._commit_layer(layer)
+
+
+class _NoopCommand(Command):
+    """空命令（执行/撤销均无操作），不会被推入命令栈."""
+
+    __slots__ = ()
+
+    def execute(self) -> None:
+        """无操作."""
+
+    def undo(self) -> None:
+        """无操作."""
+
+    @property
+    def description(self) -> str:
+        """命令描述."""
+        return ""
+
+
+_NOOP_COMMAND = _NoopCommand()
 
 
 class BatchCommand(Command):
     """批量命令.
 
     将多个命令组合为一个命令，一起撤销/重做。
+
+    空列表返回空命令；只有一个命令且描述与该命令相同时直接返回该命令本身，
+    避免多余的循环和画布批量更新。描述不同时仍返回包装命令，
+    以保留调用方指定的撤销描述。
     """
 
-    def __init__(self, commands: List[Command], description: str = "批量操作") -> None:
+    __slots__ = ("_commands", "_description", "_canvas")
+
+    def __new__(
+        cls,
+        commands: List[Command],
+        description: str = "批量操作",
+        canvas: Optional["TemplateCanvas"] = None,
+    ) -> Command:
+        if not commands:
+            return _NOOP_COMMAND
+        # 嵌套的 BatchCommand 不能直接返回，否则会被再次 __init__
+        if (
+            len(commands) == 1
+            and not isinstance(commands[0], BatchCommand)
+            and commands[0].description == description
+        ):
+            return commands[0]
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        commands: List[Command],
+        description: str = "批量操作",
+        canvas: Optional["TemplateCanvas"] = None,
+    ) -> None:
         """初始化批量命令.
 
         Args:
             commands: 命令列表
             description: 命令描述
+            canvas: 画布组件，用于合并重绘；默认取子命令的画布
         """
         self._commands = commands
         self._description = description
+        if canvas is None:
+            canvas = next(
+                (c for c in (getattr(cmd, "_canvas", None) for cmd in commands) if c),
+                None,
+            )
+        self._canvas = canvas
 
     def execute(self) -> None:
         """执行所有命令."""
-        for cmd in self._commands:
-            cmd.execute()
+        self._begin_batch()
+        try:
+            for cmd in self._commands:
+                cmd.execute()
+        finally:
+            self._end_batch()
 
     def undo(self) -> None:
         """撤销所有命令（逆序）."""
-        for cmd in reversed(self._commands):
-            cmd.undo()
+        self._begin_batch()
+        try:
+            for cmd in reversed(self._commands):
+                cmd.undo()
+        finally:
+            self._end_batch()
+
+    def _begin_batch(self) -> None:
+        """通知画布开始批量更新."""
+        if self._canvas is not None:
+            self._canvas.begin_batch()
+
+    def _end_batch(self) -> None:
+        """通知画布结束批量更新."""
+        if self._canvas is not None:
+            self._canvas.end_batch()
 
     @property
     def description(self) -> str:
@@ -571,9 +764,36 @@ class BatchCommand(Command):
         return self._description
 
 
+def _apply_canvas_width(canvas: "TemplateCanvas", value: Any) -> None:
+    """设置画布宽度."""
+    canvas.template.canvas_width = value
+    canvas._scene.set_canvas_size(value, canvas.template.canvas_height)
+
+
+def _apply_canvas_height(canvas: "TemplateCanvas", value: Any) -> None:
+    """设置画布高度."""
+    canvas.template.canvas_height = value
+    canvas._scene.set_canvas_size(canvas.template.canvas_width, value)
+
+
+def _apply_background_color(canvas: "TemplateCanvas", value: Any) -> None:
+    """设置画布背景色."""
+    canvas.template.background_color = value
+    canvas._scene.set_background_color(value)
+
+
 class ModifyCanvasCommand(Command):
     """修改画布属性命令."""
 
+    __slots__ = ("_canvas", "_property_name", "_old_value", "_new_value", "_apply")
+
+    # 属性名 -> 设置函数
+    _APPLIERS = {
+        "canvas_width": _apply_canvas_width,
+        "canvas_height": _apply_canvas_height,
+        "background_color": _apply_background_color,
+    }
+
     def __init__(
         self,
         canvas: "TemplateCanvas",
@@ -593,6 +813,8 @@ class ModifyCanvasCommand(Command):
         self._property_name = property_name
         self._old_value = old_value
         self._new_value = new_value
+        # 构造时确定设置函数，执行/撤销时不再逐个比较属性名
+        self._apply = self._APPLIERS.get(property_name)
 
     def execute(self) -> None:
         """执行：设置新值."""
@@ -609,22 +831,8 @@ class ModifyCanvasCommand(Command):
 
     def _set_property(self, value: Any) -> None:
         """设置画布属性."""
-        if self._canvas.template:
-            if self._property_name == "canvas_width":
-                self._canvas.template.canvas_width = value
-                self._canvas._scene.set_canvas_size(
-                    value,
-                    self._canvas.template.canvas_height,
-                )
-            elif self._property_name == "canvas_height":
-                self._canvas.template.canvas_height = value
-                self._canvas._scene.set_canvas_size(
-                    self._canvas.template.canvas_width,
-                    value,
-                )
-            elif self._property_name == "background_color":
-                self._canvas.template.background_color = value
-                self._canvas._scene.set_background_color(value)
+        if self._apply is not None and self._canvas.template:
+            self._apply(self._canvas, value)
 
 
 # ===================
@@ -665,8 +873,14 @@ class UndoRedoManager(QObject):
         self._canvas = canvas
         self._stack = CommandStack(parent=self)
 
+        # 同一轮事件循环内的多次栈变化合并为一次 state_changed
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self.state_changed.emit)
+
         # 连接信号
-        self._stack.stack_changed.connect(self.state_changed.emit)
+        self._stack.stack_changed.connect(self._emit_timer.start)
 
     @property
     def can_undo(self) -> bool:
@@ -11,18 +11,22 @@ Features:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from typing import Optional
 
 from PyQt6.QtCore import (
+    QElapsedTimer,
     QPropertyAnimation,
     QTimer,
+    QVariantAnimation,
     Qt,
     pyqtSignal,
     QEasingCurve,
     QPoint,
 )
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QShowEvent
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -73,6 +77,47 @@ TOAST_STYLES = {
     },
 }
 
+FADE_DURATION = 300  # 淡出动画时长（毫秒）
+
+# 各类型的样式表在导入时生成一次，避免每次显示都重新格式化
+_FRAME_QSS = {
+    toast_type: (
+        "ToastNotification {"
+        f"background-color: {style['background']};"
+        f"border: 1px solid {style['border']};"
+        "border-radius: 8px;"
+        "}"
+    )
+    for toast_type, style in TOAST_STYLES.items()
+}
+_ICON_QSS = {
+    toast_type: f"font-size: 18px; color: {style['icon_color']};"
+    for toast_type, style in TOAST_STYLES.items()
+}
+
+# 与类型无关的固定样式表
+_TITLE_QSS = "font-weight: bold; font-size: 14px; color: #262626;"
+_MESSAGE_QSS = "font-size: 13px; color: #595959;"
+_CLOSE_BTN_QSS = (
+    "QPushButton {"
+    "border: none; background: transparent; color: #8c8c8c;"
+    "font-size: 16px; font-weight: bold;"
+    "}"
+    "QPushButton:hover { color: #595959; }"
+)
+
+
+@dataclass
+class _PendingToast:
+    """排队等待显示的通知（只保存参数，显示时才创建组件）."""
+
+    __slots__ = ("title", "message", "toast_type", "duration")
+
+    title: str
+    message: str
+    toast_type: ToastType
+    duration: int
+
 
 class ToastNotification(QFrame):
     """单个 Toast 通知组件.
@@ -118,15 +163,26 @@ class ToastNotification(QFrame):
         self._toast_type = toast_type
         self._duration = duration
         self._closable = closable
+        # 透明度效果只在淡出期间安装：效果存在时每次重绘都要离屏渲染
         self._opacity_effect: Optional[QGraphicsOpacityEffect] = None
         self._fade_animation: Optional[QPropertyAnimation] = None
+        self._fading = False
+        self._fade_started_at = 0
+        # 相同通知重复出现的次数
+        self._repeat_count = 1
+        # 所属管理器：由管理器统一驱动淡出，关闭后回收到对象池而不是销毁
+        self._manager: Optional[ToastManager] = None
+        # 加入管理器时测量的高度，用于计算管理器窗口高度
+        self._cached_height = 0
+
+        # 自动关闭计时器（复用时重新启动，避免旧计时器误触发）
+        self._close_timer = QTimer(self)
+        self._close_timer.setSingleShot(True)
+        self._close_timer.timeout.connect(self._start_fade_out)
 
         self._setup_ui()
         self._apply_style()
-
-        # 设置自动关闭计时器
-        if duration > 0:
-            QTimer.singleShot(duration, self._start_fade_out)
+        self._update_content()
 
     def _setup_ui(self) -> None:
         """设置 UI."""
@@ -139,94 +195,151 @@ class ToastNotification(QFrame):
         main_layout.setSpacing(12)
 
         # 图标
-        style = TOAST_STYLES[self._toast_type]
-        icon_label = QLabel(style["icon"])
-        icon_label.setStyleSheet(f"""
-            font-size: 18px;
-            color: {style["icon_color"]};
-        """)
-        icon_label.setFixedWidth(24)
-        main_layout.addWidget(icon_label)
+        self._icon_label = QLabel()
+        self._icon_label.setFixedWidth(24)
+        main_layout.addWidget(self._icon_label)
 
         # 内容区域
         content_layout = QVBoxLayout()
         content_layout.setSpacing(4)
 
         # 标题
-        title_label = QLabel(self._title)
-        title_label.setStyleSheet("""
-            font-weight: bold;
-            font-size: 14px;
-            color: #262626;
-        """)
-        title_label.setWordWrap(True)
-        content_layout.addWidget(title_label)
-
-        # 消息内容
-        if self._message:
-            message_label = QLabel(self._message)
-            message_label.setStyleSheet("""
-                font-size: 13px;
-                color: #595959;
-            """)
-            message_label.setWordWrap(True)
-            content_layout.addWidget(message_label)
+        self._title_label = QLabel()
+        self._title_label.setStyleSheet(_TITLE_QSS)
+        self._title_label.setWordWrap(True)
+        content_layout.addWidget(self._title_label)
+
+        # 消息内容（无内容时隐藏）
+        self._message_label = QLabel()
+        self._message_label.setStyleSheet(_MESSAGE_QSS)
+        self._message_label.setWordWrap(True)
+        content_layout.addWidget(self._message_label)
 
         main_layout.addLayout(content_layout, 1)
 
-        # 关闭按钮
-        if self._closable:
-            close_btn = QPushButton("×")
-            close_btn.setFixedSize(20, 20)
-            close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            close_btn.setStyleSheet("""
-                QPushButton {
-                    border: none;
-                    background: transparent;
-                    color: #8c8c8c;
-                    font-size: 16px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    color: #595959;
-                }
-            """)
-            close_btn.clicked.connect(self._start_fade_out)
-            main_layout.addWidget(close_btn, 0, Qt.AlignmentFlag.AlignTop)
-
-        # 设置透明度效果
-        self._opacity_effect = QGraphicsOpacityEffect(self)
-        self._opacity_effect.setOpacity(1.0)
-        self.setGraphicsEffect(self._opacity_effect)
+        # 关闭按钮（不可关闭时隐藏）
+        self._close_btn = QPushButton("×")
+        self._close_btn.setFixedSize(20, 20)
+        self._close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._close_btn.setStyleSheet(_CLOSE_BTN_QSS)
+        self._close_btn.clicked.connect(self._start_fade_out)
+        main_layout.addWidget(self._close_btn, 0, Qt.AlignmentFlag.AlignTop)
 
     def _apply_style(self) -> None:
         """应用样式."""
-        style = TOAST_STYLES[self._toast_type]
-        self.setStyleSheet(f"""
-            ToastNotification {{
-                background-color: {style["background"]};
-                border: 1px solid {style["border"]};
-                border-radius: 8px;
-            }}
-        """)
+        self._icon_label.setText(TOAST_STYLES[self._toast_type]["icon"])
+        self._icon_label.setStyleSheet(_ICON_QSS[self._toast_type])
+        self.setStyleSheet(_FRAME_QSS[self._toast_type])
+
+    def _update_content(self) -> None:
+        """更新文字内容和关闭按钮."""
+        self._title_label.setText(self._title)
+        self._message_label.setText(self._message)
+        self._message_label.setVisible(bool(self._message))
+        self._close_btn.setVisible(self._closable)
+
+    def reconfigure(
+        self,
+        title: str,
+        message: str,
+        toast_type: ToastType = ToastType.INFO,
+        duration: int = 4000,
+        closable: bool = True,
+    ) -> None:
+        """重新配置通知（复用已关闭的通知组件）.
+
+        只更新文字内容，类型变化时才重新应用样式表。
+
+        Args:
+            title: 通知标题
+            message: 通知内容
+            toast_type: 通知类型
+            duration: 显示时长（毫秒），0 表示不自动关闭
+            closable: 是否可手动关闭
+        """
+        type_changed = toast_type != self._toast_type
+        self._title = title
+        self._message = message
+        self._toast_type = toast_type
+        self._duration = duration
+        self._closable = closable
+
+        if type_changed:
+            self._apply_style()
+        self._update_content()
+
+        # 重置淡出状态
+        self._close_timer.stop()
+        self._fading = False
+        self._repeat_count = 1
+        if self._fade_animation is not None:
+            self._fade_animation.stop()
+            self._fade_animation = None
+        self._clear_fade_effect()
+
+    @property
+    def dedupe_key(self) -> tuple[str, str, ToastType]:
+        """去重键（标题、内容、类型）."""
+        return (self._title, self._message, self._toast_type)
+
+    def bump_repeat(self) -> None:
+        """相同通知再次出现：标题显示次数并重新计时."""
+        self._repeat_count += 1
+        self._title_label.setText(f"{self._title} (×{self._repeat_count})")
+        if self._duration > 0:
+            self._close_timer.start(self._duration)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """显示时启动自动关闭计时器."""
+        super().showEvent(event)
+        if self._duration > 0 and not self._fading:
+            self._close_timer.start(self._duration)
 
     def _start_fade_out(self) -> None:
         """开始淡出动画."""
-        if self._fade_animation is not None:
+        if self._fading:
             return  # 已经在执行动画
 
+        self._fading = True
+        self._close_timer.stop()
+        if self._manager is not None:
+            # 由管理器的共享动画统一驱动
+            self._manager._start_fade(self)
+            return
+
+        self._set_fade_opacity(1.0)
         self._fade_animation = QPropertyAnimation(self._opacity_effect, b"opacity")
-        self._fade_animation.setDuration(300)
+        self._fade_animation.setDuration(FADE_DURATION)
         self._fade_animation.setStartValue(1.0)
         self._fade_animation.setEndValue(0.0)
         self._fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         self._fade_animation.finished.connect(self._on_fade_finished)
         self._fade_animation.start()
 
+    def _set_fade_opacity(self, opacity: float) -> None:
+        """设置淡出透明度（按需安装透明度效果）."""
+        if self._opacity_effect is None:
+            self._opacity_effect = QGraphicsOpacityEffect(self)
+            self.setGraphicsEffect(self._opacity_effect)
+        self._opacity_effect.setOpacity(opacity)
+
+    def _clear_fade_effect(self) -> None:
+        """移除透明度效果，恢复直接绘制."""
+        if self._opacity_effect is not None:
+            # setGraphicsEffect(None) 会销毁原效果对象
+            self.setGraphicsEffect(None)
+            self._opacity_effect = None
+
     def _on_fade_finished(self) -> None:
         """淡出完成."""
+        self.hide()
+        if self._fade_animation is not None:
+            self._fade_animation.stop()
+            self._fade_animation = None
+        self._clear_fade_effect()
         self.closed.emit()
-        self.deleteLater()
+        if self._manager is None:
+            self.deleteLater()
 
     @classmethod
     def from_error(
@@ -243,18 +356,7 @@ class ToastNotification(QFrame):
         Returns:
             ToastNotification 实例
         """
-        # 映射错误级别到通知类型
-        severity_map = {
-            ErrorSeverity.INFO: ToastType.INFO,
-            ErrorSeverity.WARNING: ToastType.WARNING,
-            ErrorSeverity.ERROR: ToastType.ERROR,
-            ErrorSeverity.CRITICAL: ToastType.ERROR,
-        }
-        toast_type = severity_map.get(error.severity, ToastType.ERROR)
-
-        # 错误通知显示更长时间
-        duration = 6000 if error.severity in (ErrorSeverity.ERROR, ErrorSeverity.CRITICAL) else 4000
-
+        toast_type, duration = _error_toast_params(error)
         return cls(
             title=error.title,
             message=error.message,
@@ -264,6 +366,29 @@ class ToastNotification(QFrame):
         )
 
 
+def _error_toast_params(error: UserFriendlyError) -> tuple[ToastType, int]:
+    """根据错误级别确定通知类型和显示时长.
+
+    Args:
+        error: 用户友好的错误对象
+
+    Returns:
+        (通知类型, 显示时长) 元组
+    """
+    # 映射错误级别到通知类型
+    severity_map = {
+        ErrorSeverity.INFO: ToastType.INFO,
+        ErrorSeverity.WARNING: ToastType.WARNING,
+        ErrorSeverity.ERROR: ToastType.ERROR,
+        ErrorSeverity.CRITICAL: ToastType.ERROR,
+    }
+    toast_type = severity_map.get(error.severity, ToastType.ERROR)
+
+    # 错误通知显示更长时间
+    duration = 6000 if error.severity in (ErrorSeverity.ERROR, ErrorSeverity.CRITICAL) else 4000
+    return toast_type, duration
+
+
 class ToastManager(QWidget):
     """Toast 通知管理器.
 
@@ -284,8 +409,28 @@ class ToastManager(QWidget):
             parent: 父组件（通常是主窗口）
         """
         super().__init__(parent)
-        self._notifications: list[ToastNotification] = []
-        self._pending: list[ToastNotification] = []
+        # 以 id(toast) 为键的有序字典，成员判断和删除都是 O(1)
+        self._notifications: dict[int, ToastNotification] = {}
+        self._pending: list[_PendingToast] = []
+        # 去重键 -> 正在显示的通知，相同通知合并为一个并显示次数
+        self._active_keys: dict[tuple[str, str, ToastType], ToastNotification] = {}
+        # 已关闭通知的对象池，复用以避免重复构建 UI 和解析样式表
+        self._pool: list[ToastNotification] = []
+        # 可见通知的高度总和，增删时增量维护
+        self._total_height = 0
+
+        # 共享的淡出动画：一个循环动画作为节拍源，
+        # 每次节拍按各通知的开始时间计算透明度
+        self._fading: dict[int, ToastNotification] = {}
+        self._fade_curve = QEasingCurve(QEasingCurve.Type.OutCubic)
+        self._fade_clock = QElapsedTimer()
+        self._fade_clock.start()
+        self._fade_driver = QVariantAnimation(self)
+        self._fade_driver.setDuration(FADE_DURATION)
+        self._fade_driver.setStartValue(0.0)
+        self._fade_driver.setEndValue(1.0)
+        self._fade_driver.setLoopCount(-1)
+        self._fade_driver.valueChanged.connect(self._on_fade_tick)
 
         # 设置为透明无边框
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, False)
@@ -306,7 +451,7 @@ class ToastManager(QWidget):
         message: str = "",
         toast_type: ToastType = ToastType.INFO,
         duration: int = 4000,
-    ) -> ToastNotification:
+    ) -> Optional[ToastNotification]:
         """显示通知.
 
         Args:
@@ -316,77 +461,142 @@ class ToastManager(QWidget):
             duration: 显示时长
 
         Returns:
-            创建的通知组件
+            创建的通知组件；排队等待时返回 None
         """
-        toast = ToastNotification(
-            title=title,
-            message=message,
-            toast_type=toast_type,
-            duration=duration,
-            parent=self,
-        )
+        existing = self._active_keys.get((title, message, toast_type))
+        if existing is not None and not existing._fading:
+            self._bump_toast(existing)
+            return existing
 
         if len(self._notifications) >= self.MAX_VISIBLE:
-            # 队列等待
-            self._pending.append(toast)
-        else:
-            self._add_toast(toast)
+            # 队列等待，轮到显示时再创建组件
+            self._pending.append(_PendingToast(title, message, toast_type, duration))
+            return None
 
+        toast = self._acquire_toast(title, message, toast_type, duration)
+        self._add_toast(toast)
         return toast
 
-    def show_success(self, title: str, message: str = "") -> ToastNotification:
+    def show_success(self, title: str, message: str = "") -> Optional[ToastNotification]:
         """显示成功通知."""
         return self.show_toast(title, message, ToastType.SUCCESS)
 
-    def show_warning(self, title: str, message: str = "") -> ToastNotification:
+    def show_warning(self, title: str, message: str = "") -> Optional[ToastNotification]:
         """显示警告通知."""
         return self.show_toast(title, message, ToastType.WARNING)
 
-    def show_error(self, title: str, message: str = "") -> ToastNotification:
+    def show_error(self, title: str, message: str = "") -> Optional[ToastNotification]:
         """显示错误通知."""
         return self.show_toast(title, message, ToastType.ERROR, duration=6000)
 
-    def show_info(self, title: str, message: str = "") -> ToastNotification:
+    def show_info(self, title: str, message: str = "") -> Optional[ToastNotification]:
         """显示信息通知."""
         return self.show_toast(title, message, ToastType.INFO)
 
-    def show_user_error(self, error: UserFriendlyError) -> ToastNotification:
+    def show_user_error(self, error: UserFriendlyError) -> Optional[ToastNotification]:
         """显示用户友好的错误通知.
 
         Args:
             error: UserFriendlyError 对象
 
         Returns:
-            创建的通知组件
+            创建的通知组件；排队等待时返回 None
         """
-        toast = ToastNotification.from_error(error, parent=self)
+        toast_type, duration = _error_toast_params(error)
+        return self.show_toast(error.title, error.message, toast_type, duration)
 
-        if len(self._notifications) >= self.MAX_VISIBLE:
-            self._pending.append(toast)
-        else:
-            self._add_toast(toast)
+    def _acquire_toast(
+        self,
+        title: str,
+        message: str,
+        toast_type: ToastType,
+        duration: int,
+    ) -> ToastNotification:
+        """从对象池取出通知组件，池为空时新建."""
+        if self._pool:
+            toast = self._pool.pop()
+            toast.reconfigure(title, message, toast_type, duration)
+            return toast
 
+        toast = ToastNotification(
+            title=title,
+            message=message,
+            toast_type=toast_type,
+            duration=duration,
+            parent=self,
+        )
+        toast._manager = self
+        toast.closed.connect(partial(self._remove_toast, toast))
         return toast
 
+    def _release_toast(self, toast: ToastNotification) -> None:
+        """回收通知组件，池已满时销毁."""
+        if len(self._pool) < self.MAX_VISIBLE:
+            self._pool.append(toast)
+        else:
+            toast.deleteLater()
+
+    def _bump_toast(self, toast: ToastNotification) -> None:
+        """合并重复通知并更新高度."""
+        toast.bump_repeat()
+        height = toast.sizeHint().height()
+        self._total_height += height - toast._cached_height
+        toast._cached_height = height
+        self._update_position()
+
+    def _start_fade(self, toast: ToastNotification) -> None:
+        """将通知加入共享淡出动画."""
+        toast._fade_started_at = self._fade_clock.elapsed()
+        self._fading[id(toast)] = toast
+        if self._fade_driver.state() != QVariantAnimation.State.Running:
+            self._fade_driver.start()
+
+    def _on_fade_tick(self, _value: object = None) -> None:
+        """淡出动画节拍：更新所有淡出中通知的透明度."""
+        now = self._fade_clock.elapsed()
+        finished = []
+        for toast in self._fading.values():
+            progress = min((now - toast._fade_started_at) / FADE_DURATION, 1.0)
+            toast._set_fade_opacity(1.0 - self._fade_curve.valueForProgress(progress))
+            if progress >= 1.0:
+                finished.append(toast)
+
+        for toast in finished:
+            del self._fading[id(toast)]
+            toast._on_fade_finished()
+
+        if not self._fading:
+            self._fade_driver.stop()
+
     def _add_toast(self, toast: ToastNotification) -> None:
         """添加通知到显示区域."""
-        toast.closed.connect(lambda: self._remove_toast(toast))
-        self._notifications.append(toast)
+        self._notifications[id(toast)] = toast
+        self._active_keys[toast.dedupe_key] = toast
+        toast._cached_height = toast.sizeHint().height()
+        self._total_height += toast._cached_height
         self._layout.insertWidget(self._layout.count() - 1, toast)
+        toast.show()
         self._update_position()
         self.show()
         self.raise_()
 
     def _remove_toast(self, toast: ToastNotification) -> None:
         """移除通知."""
-        if toast in self._notifications:
-            self._notifications.remove(toast)
+        if self._notifications.pop(id(toast), None) is not None:
+            self._total_height -= toast._cached_height
+            if self._active_keys.get(toast.dedupe_key) is toast:
+                del self._active_keys[toast.dedupe_key]
             self._layout.removeWidget(toast)
+            self._release_toast(toast)
 
         # 检查是否有等待的通知
         if self._pending and len(self._notifications) < self.MAX_VISIBLE:
-            next_toast = self._pending.pop(0)
-            self._add_toast(next_toast)
+            pending = self._pending.pop(0)
+            self._add_toast(
+                self._acquire_toast(
+                    pending.title, pending.message, pending.toast_type, pending.duration
+                )
+            )
 
         # 没有通知时隐藏
         if not self._notifications:
@@ -402,10 +612,12 @@ class ToastManager(QWidget):
         parent = self.parent()
         if hasattr(parent, "geometry"):
             parent_rect = parent.geometry()
-            # 计算所需高度
-            total_height = sum(t.sizeHint().height() for t in self._notifications)
-            total_height += 8 * (len(self._notifications) - 1) if self._notifications else 0
-            total_height += 20  # 边距
+            # 计算所需高度（通知高度 + 间距 + 边距）
+            total_height = (
+                self._total_height
+                + 8 * max(len(self._notifications) - 1, 0)
+                + 20
+            )
 
             self.setGeometry(
                 parent_rect.width() - 380,  # 右侧留 20px 边距
@@ -416,7 +628,7 @@ class ToastManager(QWidget):
 
     def clear_all(self) -> None:
         """清除所有通知."""
-        for toast in list(self._notifications):
+        for toast in list(self._notifications.values()):
             toast._start_fade_out()
         self._pending.clear()
 
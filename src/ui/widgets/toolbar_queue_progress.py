@@ -5,9 +5,12 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from functools import lru_cache
 from typing import Optional
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -16,9 +19,45 @@ from PyQt6.QtWidgets import (
 )
 
 from src.utils.logger import setup_logger
+from src.utils.tick import SharedTick
 
 logger = setup_logger(__name__)
 
+# 显示刷新最小间隔（毫秒），合并高频的任务完成更新
+RENDER_INTERVAL_MS = 100
+
+# 状态文字
+_STATUS_READY = "就绪"
+_STATUS_DONE = "已完成"
+_STATUS_WAITING = "等待"
+_STATUS_PAUSED = "已暂停"
+_STATUS_PROCESSING = "处理中"
+_STATUS_TEXTS = (
+    _STATUS_READY,
+    _STATUS_DONE,
+    _STATUS_WAITING,
+    _STATUS_PAUSED,
+    _STATUS_PROCESSING,
+)
+
+# 状态标签最小宽度
+_STATUS_MIN_WIDTH = 60
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """格式化时间显示（按秒缓存）."""
+    if seconds < 60:
+        return f"{seconds}秒"
+    elif seconds < 3600:
+        minutes = seconds // 60
+        secs = seconds % 60
+        return f"{minutes}:{secs:02d}"
+    else:
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        return f"{hours}:{minutes:02d}:{seconds % 60:02d}"
+
 
 class ToolbarQueueProgress(QWidget):
     """工具栏队列进度组件.
@@ -30,23 +69,42 @@ class ToolbarQueueProgress(QWidget):
     - 用时
     """
 
+    # 工作线程请求刷新（跨线程自动排队到 GUI 线程）
+    _render_requested = pyqtSignal()
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         
-        # 状态
+        # 状态（完成/失败计数可能由工作线程更新，读写时持有锁）
+        self._lock = threading.Lock()
         self._total_tasks = 0
         self._completed_tasks = 0
         self._failed_tasks = 0
         self._is_processing = False
         self._is_paused = False
-        self._elapsed_seconds = 0
-        
-        # 计时器
-        self._timer = QTimer(self)
-        self._timer.timeout.connect(self._on_timer_tick)
-        
+        # 用时：暂停前累计的秒数 + 本段开始时刻（未在计时则为 None）
+        self._accumulated = 0.0
+        self._start_monotonic: Optional[float] = None
+
+        # 处理中通过应用级共享定时器刷新用时显示（用时按单调时钟计算）
+        self._tick = SharedTick.instance()
+
+        # 刷新节流：状态变化只标记脏，由单次计时器统一刷新
+        self._dirty = False
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(RENDER_INTERVAL_MS)
+        self._render_timer.timeout.connect(self._flush_display)
+
+        # 工作线程的刷新请求合并为一次投递（读写时持有锁）
+        self._render_queued = False
+        self._render_requested.connect(self._on_render_requested)
+
+        # 上次写入控件的值，未变化时跳过 setter
+        self._reset_render_cache()
+
         self._setup_ui()
-        self._update_display()
+        self._render()
 
     def _setup_ui(self) -> None:
         """设置 UI."""
@@ -55,9 +113,13 @@ class ToolbarQueueProgress(QWidget):
         layout.setSpacing(12)
 
         # 状态标签
-        self._status_label = QLabel("就绪")
+        self._status_label = QLabel(_STATUS_READY)
         self._status_label.setProperty("hint", True)
-        self._status_label.setMinimumWidth(60)
+        # 按最长的状态文字固定宽度，切换状态时不触发重新布局
+        self._status_label.ensurePolished()
+        metrics = self._status_label.fontMetrics()
+        status_width = max(metrics.horizontalAdvance(text) for text in _STATUS_TEXTS)
+        self._status_label.setFixedWidth(max(status_width, _STATUS_MIN_WIDTH))
         layout.addWidget(self._status_label)
 
         # 进度条
@@ -85,76 +147,149 @@ class ToolbarQueueProgress(QWidget):
         self._time_label.setMinimumWidth(80)
         layout.addWidget(self._time_label)
 
-    def _update_display(self) -> None:
-        """更新显示内容."""
-        # 计算整体进度
-        if self._total_tasks > 0:
-            completed_progress = (self._completed_tasks + self._failed_tasks) * 100 / self._total_tasks
-            overall_progress = int(completed_progress)
-        else:
-            overall_progress = 0
+    def _reset_render_cache(self) -> None:
+        """清空已渲染值缓存，下次渲染时全部重新写入."""
+        self._last_state: Optional[tuple] = None
+        self._last_status: Optional[str] = None
+        self._last_stats: Optional[str] = None
+        self._last_time: Optional[str] = None
+        self._last_progress = -1
+        self._last_failed_text: Optional[str] = None
+        self._last_failed_visible: Optional[bool] = None
 
-        self._progress_bar.setValue(overall_progress)
+    def _update_display(self) -> None:
+        """标记显示需要更新（节流，最多每 RENDER_INTERVAL_MS 刷新一次）."""
+        self._dirty = True
+        # 工作线程中不能操作计时器，通过信号排队到 GUI 线程处理
+        if QThread.currentThread() is not self.thread():
+            with self._lock:
+                if self._render_queued:
+                    return
+                self._render_queued = True
+            self._render_requested.emit()
+            return
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
+    def _on_render_requested(self) -> None:
+        """处理工作线程的刷新请求（GUI 线程）."""
+        with self._lock:
+            self._render_queued = False
+        self._update_display()
 
-        # 更新统计
-        self._stats_label.setText(f"{self._completed_tasks}/{self._total_tasks}")
-        
-        if self._failed_tasks > 0:
-            self._failed_label.setText(f"失败: {self._failed_tasks}")
-            self._failed_label.setVisible(True)
-        else:
-            self._failed_label.setVisible(False)
+    def _flush_display(self) -> None:
+        """刷新待更新的显示内容."""
+        if self._dirty:
+            self._render()
+
+    def _render(self) -> None:
+        """立即更新显示内容."""
+        self._dirty = False
+        self._render_timer.stop()
+
+        # 采样计数快照
+        with self._lock:
+            total = self._total_tasks
+            completed = self._completed_tasks
+            failed = self._failed_tasks
+        elapsed = self.elapsed_seconds
+
+        # 显示状态指纹未变化时无需重新格式化
+        state = (total, completed, failed, self._is_processing, self._is_paused, elapsed)
+        if state == self._last_state:
+            return
+        self._last_state = state
+
+        # 计算整体进度（整数运算，总数为 0 时为 0）
+        overall_progress = (completed + failed) * 100 // total if total else 0
+
+        # 统计
+        stats_text = f"{completed}/{total}"
+        failed_visible = failed > 0
+        failed_text = f"失败: {failed}" if failed_visible else ""
 
-        # 更新状态
+        # 状态
         if not self._is_processing:
-            if self._total_tasks == 0:
-                self._status_label.setText("就绪")
-            elif self._completed_tasks + self._failed_tasks >= self._total_tasks:
-                self._status_label.setText("已完成")
+            if total == 0:
+                status_text = _STATUS_READY
+            elif completed + failed >= total:
+                status_text = _STATUS_DONE
             else:
-                self._status_label.setText("等待")
+                status_text = _STATUS_WAITING
         else:
             if self._is_paused:
-                self._status_label.setText("已暂停")
+                status_text = _STATUS_PAUSED
             else:
-                self._status_label.setText("处理中")
+                status_text = _STATUS_PROCESSING
 
-        # 更新时间显示
-        if self._is_processing and self._elapsed_seconds > 0:
-            elapsed_str = self._format_time(self._elapsed_seconds)
+        # 时间显示
+        if self._is_processing and elapsed > 0:
+            elapsed_str = _format_seconds(elapsed)
             # 预估剩余时间
-            if self._completed_tasks > 0:
-                avg_time = self._elapsed_seconds / self._completed_tasks
-                remaining_tasks = self._total_tasks - self._completed_tasks - self._failed_tasks
+            if completed > 0:
+                avg_time = elapsed / completed
+                remaining_tasks = total - completed - failed
                 estimated_remaining = int(avg_time * remaining_tasks)
-                remaining_str = self._format_time(estimated_remaining)
-                self._time_label.setText(f"{elapsed_str} / 剩余 {remaining_str}")
+                remaining_str = _format_seconds(estimated_remaining)
+                time_text = f"{elapsed_str} / 剩余 {remaining_str}"
             else:
-                self._time_label.setText(elapsed_str)
-        elif self._elapsed_seconds > 0 and not self._is_processing:
-            elapsed_str = self._format_time(self._elapsed_seconds)
-            self._time_label.setText(f"总计 {elapsed_str}")
-        else:
-            self._time_label.setText("")
-
-    def _format_time(self, seconds: int) -> str:
-        """格式化时间显示."""
-        if seconds < 60:
-            return f"{seconds}秒"
-        elif seconds < 3600:
-            minutes = seconds // 60
-            secs = seconds % 60
-            return f"{minutes}:{secs:02d}"
+                time_text = elapsed_str
+        elif elapsed > 0 and not self._is_processing:
+            elapsed_str = _format_seconds(elapsed)
+            time_text = f"总计 {elapsed_str}"
         else:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            return f"{hours}:{minutes:02d}:{seconds % 60:02d}"
-
-    def _on_timer_tick(self) -> None:
-        """计时器触发."""
-        if self._is_processing and not self._is_paused:
-            self._elapsed_seconds += 1
-            self._update_display()
+            time_text = ""
+
+        # 只写入发生变化的值（相同文本的 setText 也会触发布局和重绘），
+        # 并暂停更新，使多个控件的变化合并为一次重绘
+        self.setUpdatesEnabled(False)
+        try:
+            if overall_progress != self._last_progress:
+                self._progress_bar.setValue(overall_progress)
+                self._last_progress = overall_progress
+            if stats_text != self._last_stats:
+                self._stats_label.setText(stats_text)
+                self._last_stats = stats_text
+            if failed_visible and failed_text != self._last_failed_text:
+                self._failed_label.setText(failed_text)
+                self._last_failed_text = failed_text
+            if failed_visible != self._last_failed_visible:
+                self._failed_label.setVisible(failed_visible)
+                self._last_failed_visible = failed_visible
+            if status_text != self._last_status:
+                self._status_label.setText(status_text)
+                self._last_status = status_text
+            if time_text != self._last_time:
+                self._time_label.setText(time_text)
+                self._last_time = time_text
+        finally:
+            # 恢复更新时会自动调用 update()
+            self.setUpdatesEnabled(True)
+
+    @property
+    def elapsed_seconds(self) -> int:
+        """已用时间（秒），不含暂停时间."""
+        running = 0.0
+        if self._start_monotonic is not None:
+            running = time.monotonic() - self._start_monotonic
+        return int(self._accumulated + running)
+
+    def _on_tick(self) -> None:
+        """共享定时器回调：刷新用时（秒数未变化时渲染直接返回）."""
+        self._render()
+
+    def _start_clock(self) -> None:
+        """开始/继续计时."""
+        if self._start_monotonic is None:
+            self._start_monotonic = time.monotonic()
+        self._tick.register(self._on_tick)
+
+    def _stop_clock(self) -> None:
+        """暂停/停止计时，累计本段用时."""
+        if self._start_monotonic is not None:
+            self._accumulated += time.monotonic() - self._start_monotonic
+            self._start_monotonic = None
+        self._tick.unregister(self._on_tick)
 
     # ========================
     # 公共方法
@@ -182,44 +317,52 @@ class ToolbarQueueProgress(QWidget):
 
         if is_processing and not was_processing:
             # 开始处理
-            self._elapsed_seconds = 0
-            self._timer.start(1000)
+            self._accumulated = 0.0
+            self._start_monotonic = None
+            if not is_paused:
+                self._start_clock()
         elif not is_processing and was_processing:
             # 停止处理
-            self._timer.stop()
+            self._stop_clock()
         elif is_processing and is_paused:
             # 暂停
-            self._timer.stop()
+            self._stop_clock()
         elif is_processing and not is_paused and was_processing:
             # 继续
-            self._timer.start(1000)
+            self._start_clock()
 
-        self._update_display()
+        # 状态切换需要立即反映
+        self._render()
 
     def update_task_completed(self, success: bool = True) -> None:
-        """更新任务完成状态.
+        """更新任务完成状态（可在工作线程中调用）.
 
         Args:
             success: 是否成功完成
         """
-        if success:
-            self._completed_tasks += 1
-        else:
-            self._failed_tasks += 1
+        with self._lock:
+            if success:
+                self._completed_tasks += 1
+            else:
+                self._failed_tasks += 1
         self._update_display()
 
     def reset(self) -> None:
         """重置状态."""
-        self._total_tasks = 0
-        self._completed_tasks = 0
-        self._failed_tasks = 0
+        with self._lock:
+            self._total_tasks = 0
+            self._completed_tasks = 0
+            self._failed_tasks = 0
         self._is_processing = False
         self._is_paused = False
-        self._elapsed_seconds = 0
-        self._timer.stop()
-        self._update_display()
+        self._accumulated = 0.0
+        self._start_monotonic = None
+        self._tick.unregister(self._on_tick)
+        self._reset_render_cache()
+        self._render()
 
     def increment_completed(self) -> None:
-        """增加完成数."""
-        self._completed_tasks += 1
+        """增加完成数（可在工作线程中调用）."""
+        with self._lock:
+            self._completed_tasks += 1
         self._update_display()
@@ -42,8 +42,9 @@ DEFAULT_OUTPUT_SIZE = (DEFAULT_OUTPUT_WIDTH, DEFAULT_OUTPUT_HEIGHT)
 # 默认输出质量 (1-100)
 DEFAULT_OUTPUT_QUALITY = 85
 
-# 支持的图片格式
-SUPPORTED_IMAGE_FORMATS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".gif"}
+# 支持的图片格式（不可变，扩展名均为小写，判断前需先转小写，
+# 统一使用 file_utils.is_image_file）
+SUPPORTED_IMAGE_FORMATS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".bmp", ".gif"})
 
 # 最大图片文件大小 (50MB)
 MAX_IMAGE_FILE_SIZE = 50 * 1024 * 1024
@@ -5,8 +5,10 @@
 
 from __future__ import annotations
 
+import inspect
+import logging
 import traceback
-from typing import Any, Callable, Optional, Type, TypeVar
+from typing import Any, Awaitable, Callable, Iterator, Optional, Type, TypeVar, Union
 
 from src.utils.exceptions import (
     AIServiceError,
@@ -25,6 +27,9 @@ logger = setup_logger(__name__)
 
 T = TypeVar("T")
 
+# ErrorCollector 默认最多保存的错误数量
+DEFAULT_MAX_COLLECTED_ERRORS = 1000
+
 
 # 错误消息映射
 ERROR_MESSAGES = {
@@ -39,6 +44,15 @@ ERROR_MESSAGES = {
 }
 
 
+def _lookup(exception: Exception) -> Optional[str]:
+    """沿异常类型的 MRO 查找错误消息（最具体的类型优先）."""
+    for cls in type(exception).__mro__:
+        message = ERROR_MESSAGES.get(cls)
+        if message is not None:
+            return message
+    return None
+
+
 def get_user_friendly_message(exception: Exception) -> str:
     """获取用户友好的错误消息.
 
@@ -49,9 +63,9 @@ def get_user_friendly_message(exception: Exception) -> str:
         用户友好的错误消息
     """
     # 检查是否是已知的应用异常
-    for exc_type, message in ERROR_MESSAGES.items():
-        if isinstance(exception, exc_type):
-            return message
+    message = _lookup(exception)
+    if message is not None:
+        return message
 
     # 如果是 AppException，使用其消息
     if isinstance(exception, AppException):
@@ -145,8 +159,29 @@ def safe_execute(
         return default
 
 
+def safe_call(func: Callable[..., T], *args: Any, **kwargs: Any) -> Optional[T]:
+    """安全执行函数，失败时记录警告并返回 None.
+
+    safe_execute 的精简版本，没有默认值和错误回调参数，
+    适合在循环等频繁调用的场景中使用。
+
+    Args:
+        func: 要执行的函数
+        *args: 位置参数
+        **kwargs: 关键字参数
+
+    Returns:
+        函数返回值，失败时为 None
+    """
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        logger.warning(f"函数 {func.__name__} 执行失败: {e}")
+        return None
+
+
 async def safe_execute_async(
-    func: Callable[..., T],
+    func: Callable[..., Union[T, Awaitable[T]]],
     *args: Any,
     default: Optional[T] = None,
     on_error: Optional[Callable[[Exception], None]] = None,
@@ -154,8 +189,11 @@ async def safe_execute_async(
 ) -> Optional[T]:
     """安全执行异步函数，捕获异常.
 
+    func 可以是协程函数，也可以是普通函数；返回值不可等待时直接使用，
+    不再额外等待。
+
     Args:
-        func: 要执行的异步函数
+        func: 要执行的异步函数或普通函数
         *args: 位置参数
         default: 发生异常时的默认返回值
         on_error: 错误回调函数
@@ -165,7 +203,10 @@ async def safe_execute_async(
         函数返回值或默认值
     """
     try:
-        return await func(*args, **kwargs)
+        result = func(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
     except Exception as e:
         logger.warning(f"异步函数 {func.__name__} 执行失败: {e}")
         if on_error:
@@ -176,7 +217,8 @@ async def safe_execute_async(
 class ErrorCollector:
     """错误收集器.
 
-    用于批量操作时收集所有错误。
+    用于批量操作时收集所有错误。最多保存 max_errors 个错误，超出部分只计数；
+    不逐个记录警告日志，在生成摘要或抛出异常时汇总记录一次。
 
     Example:
         >>> collector = ErrorCollector()
@@ -189,8 +231,18 @@ class ErrorCollector:
         ...     print(collector.summary)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_errors: int = DEFAULT_MAX_COLLECTED_ERRORS) -> None:
+        """初始化.
+
+        Args:
+            max_errors: 最多保存的错误数量
+        """
+        self._max_errors = max_errors
         self._errors: list[tuple[Exception, str]] = []
+        # 超出上限未保存的错误数量
+        self._dropped = 0
+        # 已汇总记录到日志的错误数量
+        self._logged = 0
 
     def add(self, exception: Exception, context: str = "") -> None:
         """添加错误.
@@ -199,23 +251,36 @@ class ErrorCollector:
             exception: 异常对象
             context: 上下文描述
         """
-        self._errors.append((exception, context))
-        logger.warning(f"收集到错误 [{context}]: {exception}")
+        if len(self._errors) < self._max_errors:
+            self._errors.append((exception, context))
+        else:
+            # 超出上限不再保存异常对象（及其堆栈），只计数
+            self._dropped += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"收集到错误 [{context}]: {exception}")
 
     @property
     def has_errors(self) -> bool:
         """是否有错误."""
-        return len(self._errors) > 0
+        return self.error_count > 0
 
     @property
     def error_count(self) -> int:
-        """错误数量."""
-        return len(self._errors)
+        """错误数量（含超出上限未保存的）."""
+        return len(self._errors) + self._dropped
 
     @property
-    def errors(self) -> list[tuple[Exception, str]]:
-        """所有错误."""
-        return self._errors.copy()
+    def errors(self) -> tuple[tuple[Exception, str], ...]:
+        """已保存的错误（只读快照）."""
+        return tuple(self._errors)
+
+    def __iter__(self) -> Iterator[tuple[Exception, str]]:
+        """遍历已保存的错误（无需复制）."""
+        return iter(self._errors)
+
+    def __len__(self) -> int:
+        """已保存的错误数量（不含超出上限的，总数见 error_count）."""
+        return len(self._errors)
 
     @property
     def summary(self) -> str:
@@ -223,16 +288,36 @@ class ErrorCollector:
         if not self._errors:
             return "无错误"
 
-        lines = [f"共 {len(self._errors)} 个错误:"]
+        self._log_new_errors()
+
+        lines = [f"共 {self.error_count} 个错误:"]
+        # 错误较多时在 GUI 线程生成，循环内避免重复的属性查找
+        append = lines.append
         for i, (exc, ctx) in enumerate(self._errors, 1):
             ctx_str = f" ({ctx})" if ctx else ""
-            lines.append(f"  {i}. {type(exc).__name__}{ctx_str}: {exc}")
+            append(f"  {i}. {type(exc).__name__}{ctx_str}: {exc}")
+        if self._dropped:
+            append(f"  ... 另有 {self._dropped} 个错误未记录详情")
 
         return "\n".join(lines)
 
+    def _log_new_errors(self) -> None:
+        """汇总记录自上次记录以来新增的错误."""
+        count = self.error_count
+        new_count = count - self._logged
+        if new_count <= 0:
+            return
+        self._logged = count
+        exc, ctx = self._errors[0]
+        logger.warning(
+            f"收集到 {new_count} 个错误（共 {count} 个），首个错误 [{ctx}]: {exc}"
+        )
+
     def clear(self) -> None:
         """清除所有错误."""
         self._errors.clear()
+        self._dropped = 0
+        self._logged = 0
 
     def raise_if_errors(self, message: str = "批量操作中发生错误") -> None:
         """如果有错误则抛出异常.
@@ -11,7 +11,8 @@ Features:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import errno
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Optional
 
@@ -45,10 +46,12 @@ class ErrorSeverity(str, Enum):
     CRITICAL = "critical"  # 严重错误
 
 
-@dataclass
+@dataclass(frozen=True)
 class UserFriendlyError:
     """用户友好的错误信息.
 
+    实例不可变，预定义的错误信息可直接共享返回。
+
     Attributes:
         title: 错误标题
         message: 错误描述
@@ -66,7 +69,17 @@ class UserFriendlyError:
     details: Optional[str] = None
 
     def to_dict(self) -> dict:
-        """转换为字典."""
+        """转换为字典.
+
+        预定义的共享实例返回预先生成结果的副本。
+        """
+        cached = _DICTS.get(self.error_code)
+        if cached is not None and ERROR_MESSAGES[self.error_code] is self:
+            return cached.copy()
+        return self._build_dict()
+
+    def _build_dict(self) -> dict:
+        """构建字典."""
         return {
             "title": self.title,
             "message": self.message,
@@ -227,6 +240,62 @@ ERROR_MESSAGES = {
     ),
 }
 
+# 预定义错误信息的字典形式（实例不可变，只需生成一次）
+_DICTS: dict[str, dict] = {
+    code: error._build_dict() for code, error in ERROR_MESSAGES.items()
+}
+
+
+# 异常类型 -> 错误信息（沿 MRO 查找，最具体的类型优先）
+_TYPE_TO_ERROR: dict[type, UserFriendlyError] = {
+    APIKeyNotFoundError: ERROR_MESSAGES["API_KEY_NOT_FOUND"],
+    APITimeoutError: ERROR_MESSAGES["API_TIMEOUT"],
+    APIRequestError: ERROR_MESSAGES["API_REQUEST_ERROR"],
+    ImageNotFoundError: ERROR_MESSAGES["IMAGE_NOT_FOUND"],
+    UnsupportedImageFormatError: ERROR_MESSAGES["UNSUPPORTED_FORMAT"],
+    ImageTooLargeError: ERROR_MESSAGES["IMAGE_TOO_LARGE"],
+    ImageCorruptedError: ERROR_MESSAGES["IMAGE_CORRUPTED"],
+    ImageProcessError: ERROR_MESSAGES["IMAGE_PROCESS_FAILED"],
+    QueueFullError: ERROR_MESSAGES["QUEUE_FULL"],
+    TaskNotFoundError: ERROR_MESSAGES["TASK_NOT_FOUND"],
+    InvalidConfigValueError: ERROR_MESSAGES["INVALID_CONFIG"],
+    ConfigError: ERROR_MESSAGES["CONFIG_ERROR"],
+    DatabaseConnectionError: ERROR_MESSAGES["DATABASE_CONNECTION_ERROR"],
+    DatabaseError: ERROR_MESSAGES["DATABASE_ERROR"],
+    AIServiceError: ERROR_MESSAGES["API_REQUEST_ERROR"],
+    ConnectionError: ERROR_MESSAGES["NETWORK_ERROR"],
+    OSError: ERROR_MESSAGES["UNKNOWN_ERROR"],
+}
+
+# 特定 HTTP 状态码对应的错误信息
+_API_STATUS_ERRORS: dict[int, UserFriendlyError] = {
+    429: ERROR_MESSAGES["API_RATE_LIMIT"],
+    402: ERROR_MESSAGES["API_QUOTA_EXCEEDED"],
+}
+
+# 常见系统错误码对应的错误信息（按 errno 判断，不依赖系统语言）
+_OS_ERRNO_ERRORS: dict[int, UserFriendlyError] = {
+    errno.ENOSPC: ERROR_MESSAGES["DISK_FULL"],
+    errno.EACCES: ERROR_MESSAGES["PERMISSION_DENIED"],
+    errno.EPERM: ERROR_MESSAGES["PERMISSION_DENIED"],
+}
+
+# 已解析的异常类型缓存（异常类型有限，无需淘汰）
+_resolved_cache: dict[type, UserFriendlyError] = {}
+
+
+def _resolve(exc_type: type) -> UserFriendlyError:
+    """解析异常类型对应的错误信息，结果按类型缓存."""
+    error = _resolved_cache.get(exc_type)
+    if error is None:
+        error = ERROR_MESSAGES["UNKNOWN_ERROR"]
+        for cls in exc_type.__mro__:
+            if cls in _TYPE_TO_ERROR:
+                error = _TYPE_TO_ERROR[cls]
+                break
+        _resolved_cache[exc_type] = error
+    return error
+
 
 def get_user_friendly_error(
     exception: Exception,
@@ -244,67 +313,20 @@ def get_user_friendly_error(
     details = str(exception) if include_details else None
 
     # 根据异常类型匹配错误消息
-    if isinstance(exception, APIKeyNotFoundError):
-        error = ERROR_MESSAGES["API_KEY_NOT_FOUND"]
-    elif isinstance(exception, APITimeoutError):
-        error = ERROR_MESSAGES["API_TIMEOUT"]
-    elif isinstance(exception, APIRequestError):
+    error = _resolve(type(exception))
+
+    # 依赖异常实例属性的特殊情况
+    if isinstance(exception, APIRequestError):
         # 检查是否是特定的 HTTP 错误
-        if hasattr(exception, "status_code"):
-            if exception.status_code == 429:
-                error = ERROR_MESSAGES["API_RATE_LIMIT"]
-            elif exception.status_code == 402:
-                error = ERROR_MESSAGES["API_QUOTA_EXCEEDED"]
-            else:
-                error = ERROR_MESSAGES["API_REQUEST_ERROR"]
-        else:
-            error = ERROR_MESSAGES["API_REQUEST_ERROR"]
-    elif isinstance(exception, ImageNotFoundError):
-        error = ERROR_MESSAGES["IMAGE_NOT_FOUND"]
-    elif isinstance(exception, UnsupportedImageFormatError):
-        error = ERROR_MESSAGES["UNSUPPORTED_FORMAT"]
-    elif isinstance(exception, ImageTooLargeError):
-        error = ERROR_MESSAGES["IMAGE_TOO_LARGE"]
-    elif isinstance(exception, ImageCorruptedError):
-        error = ERROR_MESSAGES["IMAGE_CORRUPTED"]
-    elif isinstance(exception, ImageProcessError):
-        error = ERROR_MESSAGES["IMAGE_PROCESS_FAILED"]
-    elif isinstance(exception, QueueFullError):
-        error = ERROR_MESSAGES["QUEUE_FULL"]
-    elif isinstance(exception, TaskNotFoundError):
-        error = ERROR_MESSAGES["TASK_NOT_FOUND"]
-    elif isinstance(exception, InvalidConfigValueError):
-        error = ERROR_MESSAGES["INVALID_CONFIG"]
-    elif isinstance(exception, ConfigError):
-        error = ERROR_MESSAGES["CONFIG_ERROR"]
-    elif isinstance(exception, DatabaseConnectionError):
-        error = ERROR_MESSAGES["DATABASE_CONNECTION_ERROR"]
-    elif isinstance(exception, DatabaseError):
-        error = ERROR_MESSAGES["DATABASE_ERROR"]
-    elif isinstance(exception, AIServiceError):
-        error = ERROR_MESSAGES["API_REQUEST_ERROR"]
-    elif isinstance(exception, OSError):
+        error = _API_STATUS_ERRORS.get(exception.status_code, error)
+    elif error is ERROR_MESSAGES["UNKNOWN_ERROR"] and isinstance(exception, OSError):
         # 处理常见的系统错误
-        if "No space left" in str(exception):
-            error = ERROR_MESSAGES["DISK_FULL"]
-        elif "Permission denied" in str(exception):
-            error = ERROR_MESSAGES["PERMISSION_DENIED"]
-        else:
-            error = ERROR_MESSAGES["UNKNOWN_ERROR"]
-    elif isinstance(exception, ConnectionError):
-        error = ERROR_MESSAGES["NETWORK_ERROR"]
-    else:
-        error = ERROR_MESSAGES["UNKNOWN_ERROR"]
+        error = _OS_ERRNO_ERRORS.get(exception.errno, error)
 
-    # 创建新的错误对象，包含详细信息
-    return UserFriendlyError(
-        title=error.title,
-        message=error.message,
-        suggestion=error.suggestion,
-        severity=error.severity,
-        error_code=error.error_code,
-        details=details,
-    )
+    # 不含详细信息时直接返回共享实例，否则复制并附加详细信息
+    if details is None:
+        return error
+    return replace(error, details=details)
 
 
 def format_error_message(error: UserFriendlyError) -> str:
@@ -7,8 +7,11 @@ from __future__ import annotations
 
 import os
 import shutil
+import stat
 import tempfile
+import time
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Generator, List, Optional, Set
 
@@ -17,6 +20,9 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# 路径分隔符（用于去掉末尾分隔符）
+_PATH_SEPARATORS = os.sep + (os.altsep or "")
+
 
 def ensure_directory(path: Path) -> Path:
     """确保目录存在.
@@ -40,7 +46,18 @@ def get_file_extension(path: Path | str) -> str:
     Returns:
         小写扩展名（含点号）
     """
-    return Path(path).suffix.lower()
+    return _extension_of(os.fspath(path))
+
+
+@lru_cache(maxsize=4096)
+def _extension_of(path: str) -> str:
+    """解析路径字符串的小写扩展名（同一文件在流水线中会被多次检查，结果缓存）."""
+    # 与 Path.suffix 规则一致，但直接处理字符串，不创建 Path 对象
+    name = os.path.basename(path.rstrip(_PATH_SEPARATORS))
+    dot = name.rfind(".")
+    if dot <= 0 or dot == len(name) - 1:
+        return ""
+    return name[dot:].lower()
 
 
 def is_image_file(path: Path | str) -> bool:
@@ -65,7 +82,7 @@ def get_file_size(path: Path | str) -> int:
     Returns:
         文件大小
     """
-    return Path(path).stat().st_size
+    return os.stat(path).st_size
 
 
 def list_image_files(
@@ -81,17 +98,38 @@ def list_image_files(
     Returns:
         图片文件路径列表
     """
-    directory = Path(directory)
-    if not directory.is_dir():
+    directory = os.fspath(directory)
+    if not os.path.isdir(directory):
         return []
 
-    files = []
-    pattern = "**/*" if recursive else "*"
-
-    for path in directory.glob(pattern):
-        if path.is_file() and is_image_file(path):
-            files.append(path)
+    files: List[Path] = []
 
+    def _walk(current: str) -> None:
+        # os.scandir 的 DirEntry 自带文件类型，普通文件无需额外 stat，
+        # 只为匹配的文件创建 Path 对象
+        try:
+            with os.scandir(current) as entries:
+                subdirs = []
+                for entry in entries:
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if (
+                        dot > 0
+                        and name[dot:].lower() in SUPPORTED_IMAGE_FORMATS
+                        and entry.is_file()
+                    ):
+                        files.append(Path(entry.path))
+                    # 与 Path.glob("**") 一致，不进入符号链接目录（避免循环）
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError as e:
+            # 无权限等无法读取的目录直接跳过
+            logger.debug(f"跳过无法读取的目录: {current}, {e}")
+            return
+        for subdir in subdirs:
+            _walk(subdir)
+
+    _walk(directory)
     return sorted(files)
 
 
@@ -209,8 +247,6 @@ def cleanup_temp_files(max_age_hours: int = 24) -> int:
     Returns:
         删除的文件数量
     """
-    import time
-
     if not TEMP_DIR.exists():
         return 0
 
@@ -218,16 +254,18 @@ def cleanup_temp_files(max_age_hours: int = 24) -> int:
     now = time.time()
     max_age_seconds = max_age_hours * 3600
 
-    for path in TEMP_DIR.iterdir():
-        try:
-            if now - path.stat().st_mtime > max_age_seconds:
-                if path.is_file():
-                    path.unlink()
-                elif path.is_dir():
-                    shutil.rmtree(path)
-                deleted += 1
-        except Exception as e:
-            logger.warning(f"清理临时文件失败: {path}, {e}")
+    # DirEntry 缓存 stat 结果和文件类型，每个条目只需一次系统调用
+    with os.scandir(TEMP_DIR) as entries:
+        for entry in entries:
+            try:
+                if now - entry.stat(follow_symlinks=False).st_mtime > max_age_seconds:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                    deleted += 1
+            except Exception as e:
+                logger.warning(f"清理临时文件失败: {entry.path}, {e}")
 
     if deleted > 0:
         logger.info(f"清理了 {deleted} 个过期临时文件")
@@ -248,10 +286,55 @@ def copy_file(src: Path | str, dst: Path | str) -> Path:
     src = Path(src)
     dst = Path(dst)
     ensure_directory(dst.parent)
-    shutil.copy2(src, dst)
+    if _copy_file_range(src, dst):
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
     return dst
 
 
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    """尝试用 os.copy_file_range 在内核中复制文件内容.
+
+    支持 reflink 的文件系统（btrfs、XFS 等）上只复制元数据。
+    平台或文件系统不支持时返回 False，由调用方回退到普通复制。
+
+    Args:
+        src: 源文件路径
+        dst: 目标文件路径
+
+    Returns:
+        是否复制成功
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        with open(src, "rb") as fsrc:
+            src_stat = os.fstat(fsrc.fileno())
+            # 先不截断打开目标，确认不是同一个文件后再截断
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT, 0o666)
+            try:
+                dst_stat = os.fstat(dst_fd)
+                if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+                    return False
+                # st_size 为 0 时可能是内容长度未知的伪文件，交给普通复制
+                remaining = src_stat.st_size
+                if remaining == 0:
+                    return False
+                os.ftruncate(dst_fd, 0)
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            finally:
+                os.close(dst_fd)
+        # 提前返回 0（文件系统不支持或复制期间文件变短）时内容不完整，回退到普通复制
+        return remaining == 0
+    except OSError:
+        return False
+
+
 def move_file(src: Path | str, dst: Path | str) -> Path:
     """移动文件.
 
@@ -280,10 +363,15 @@ def safe_delete(path: Path | str) -> bool:
     """
     path = Path(path)
     try:
-        if path.is_file():
-            path.unlink()
-        elif path.is_dir():
+        # 单次 lstat 判断类型；符号链接只删除链接本身
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            return True
+        if stat.S_ISDIR(mode):
             shutil.rmtree(path)
+        else:
+            os.unlink(path)
         return True
     except Exception as e:
         logger.warning(f"删除失败: {path}, {e}")
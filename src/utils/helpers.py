@@ -6,10 +6,14 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional
 
 
 def generate_uuid() -> str:
@@ -33,23 +37,93 @@ def generate_short_id(length: int = 8) -> str:
     return uuid.uuid4().hex[:length]
 
 
+# 计算文件哈希时每次读取的块大小（1MB）
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 超过该大小的文件使用内存映射一次性计算哈希（16MB）
+HASH_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+
+def _new_hasher(algorithm: str) -> Any:
+    """创建哈希对象.
+
+    blake3 为可选依赖，未安装时抛出 ValueError（与 hashlib 不支持的算法一致）。
+    """
+    if algorithm == "blake3":
+        try:
+            import blake3
+        except ImportError:
+            raise ValueError("blake3 哈希需要安装 blake3 包") from None
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.new(algorithm)
+
+
+def _update_from_mmap(hash_func: Any, fileno: int) -> None:
+    """通过内存映射将整个文件送入哈希对象."""
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+        # 提示内核顺序预读（madvise 仅部分平台可用）
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        # 视图须在映射关闭前释放
+        with memoryview(mapped) as view:
+            hash_func.update(view)
+
+
 def calculate_file_hash(file_path: Path, algorithm: str = "md5") -> str:
     """计算文件哈希值.
 
     Args:
         file_path: 文件路径
-        algorithm: 哈希算法 (md5, sha256)
+        algorithm: 哈希算法 (md5, sha256, 已安装 blake3 包时可用 blake3)
 
     Returns:
         哈希值字符串
     """
-    hash_func = hashlib.new(algorithm)
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hash_func.update(chunk)
+    hash_func = _new_hasher(algorithm)
+    with open(file_path, "rb", buffering=0) as f:
+        # 大文件映射到内存，省去内核到用户缓冲区的拷贝
+        if os.fstat(f.fileno()).st_size >= HASH_MMAP_THRESHOLD:
+            _update_from_mmap(hash_func, f.fileno())
+            return hash_func.hexdigest()
+
+        # 复用同一缓冲区读取，无缓冲打开避免二次拷贝
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(view)
+            if not size:
+                break
+            hash_func.update(view[:size])
     return hash_func.hexdigest()
 
 
+def calculate_file_hashes(
+    file_paths: Iterable[Path],
+    algorithm: str = "md5",
+    workers: Optional[int] = None,
+) -> Dict[Path, str]:
+    """并发计算多个文件的哈希值.
+
+    hashlib 在计算时释放 GIL，多线程可同时进行磁盘读取和哈希计算。
+
+    Args:
+        file_paths: 文件路径列表
+        algorithm: 哈希算法，同 calculate_file_hash
+        workers: 线程数，默认为 CPU 核心数
+
+    Returns:
+        文件路径到哈希值的映射
+    """
+    paths = list(file_paths)
+    hash_one = partial(calculate_file_hash, algorithm=algorithm)
+    if len(paths) <= 1:
+        return {path: hash_one(path) for path in paths}
+
+    max_workers = min(workers or os.cpu_count() or 1, len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(hash_one, paths)))
+
+
 def format_file_size(size_bytes: int) -> str:
     """格式化文件大小.
 
@@ -148,9 +222,16 @@ def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
 
     Returns:
         RGB 元组
+
+    Raises:
+        ValueError: 不足 6 位或含非十六进制字符
     """
-    hex_color = hex_color.lstrip("#")
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    # 只取前 6 位（与逐段解析一致，8 位 RGBA 颜色忽略透明度）
+    digits = hex_color.lstrip("#")[:6]
+    if len(digits) != 6:
+        raise ValueError(f"无效的 HEX 颜色格式: {hex_color}")
+    value = int(digits, 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
 
 
 def truncate_string(s: str, max_length: int, suffix: str = "...") -> str:
@@ -169,6 +250,10 @@ def truncate_string(s: str, max_length: int, suffix: str = "...") -> str:
     return s[:max_length - len(suffix)] + suffix
 
 
+# 文件名中的不安全字符替换表（一次遍历完成全部替换）
+_UNSAFE_FILENAME_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
+
 def safe_filename(filename: str) -> str:
     """生成安全的文件名.
 
@@ -180,11 +265,7 @@ def safe_filename(filename: str) -> str:
     Returns:
         安全的文件名
     """
-    # 不安全字符
-    unsafe_chars = '<>:"/\\|?*'
-    for char in unsafe_chars:
-        filename = filename.replace(char, "_")
-    return filename.strip()
+    return filename.translate(_UNSAFE_FILENAME_TABLE).strip()
 
 
 def merge_dicts(base: dict, override: dict) -> dict:
@@ -198,9 +279,16 @@ def merge_dicts(base: dict, override: dict) -> dict:
         合并后的字典
     """
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    # 用显式栈代替递归，嵌套字典先复制再原地合并，不修改 base
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = current.copy()
+                target[key] = merged
+                stack.append((merged, value))
+            else:
+                target[key] = value
     return result
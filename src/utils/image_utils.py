@@ -6,7 +6,10 @@
 from __future__ import annotations
 
 import base64
+import binascii
 import io
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
@@ -24,11 +27,32 @@ from src.utils.exceptions import (
     ImageTooLargeError,
     UnsupportedImageFormatError,
 )
-from src.utils.file_utils import get_file_extension, get_file_size
+from src.utils.file_utils import get_file_extension
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# 保存时按扩展名确定的编码格式
+_SUFFIX_FORMATS = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG", ".webp": "WEBP"}
+
+# 支持 quality 参数的编码格式
+_QUALITY_FORMATS = frozenset({"JPEG", "WEBP"})
+
+# 快速编码参数：PNG 压缩级别 4 比 optimize（强制级别 9）快数倍，体积仅略增；
+# WebP method 2 比默认的 4 快约一倍
+PNG_FAST_COMPRESS_LEVEL = 4
+WEBP_FAST_METHOD = 2
+
+# 缩放时先用 reduce() 整数倍缩小再精确重采样的阈值（Pillow 的 reducing_gap）。
+# 3.0 时与直接重采样的结果肉眼无差别，大幅缩小时速度快数倍
+RESIZE_REDUCING_GAP = 3.0
+
+# Base64 分块解码长度（字符数，须为 4 的倍数）
+_BASE64_DECODE_CHUNK = 256 * 1024
+
+# 缩略图重采样方法：小尺寸下与 LANCZOS 肉眼无差别，速度快数倍
+THUMBNAIL_RESAMPLE = Image.Resampling.BILINEAR
+
 
 def validate_image_file(path: Path | str) -> None:
     """验证图片文件.
@@ -42,11 +66,15 @@ def validate_image_file(path: Path | str) -> None:
         ImageTooLargeError: 文件过大
         ImageCorruptedError: 文件损坏
     """
-    path = Path(path)
+    # 全程使用字符串路径，批量校验时不为每个文件创建 Path 对象
+    path = os.fspath(path)
 
-    # 检查文件存在
-    if not path.exists():
-        raise ImageNotFoundError(str(path))
+    # 检查文件存在（同一次 stat 结果用于大小检查和缓存键）
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise ImageNotFoundError(path)
+    size = st.st_size
 
     # 检查格式
     ext = get_file_extension(path)
@@ -54,27 +82,41 @@ def validate_image_file(path: Path | str) -> None:
         raise UnsupportedImageFormatError(ext)
 
     # 检查大小
-    size = get_file_size(path)
     if size > MAX_IMAGE_FILE_SIZE:
         raise ImageTooLargeError(size, MAX_IMAGE_FILE_SIZE)
 
     # 检查是否可读
+    _verify_image(path, st.st_mtime_ns, size)
+
+
+@lru_cache(maxsize=1024)
+def _verify_image(path: str, mtime_ns: int, size: int) -> None:
+    """校验图片内容（按路径、修改时间和大小缓存，文件变化后自动失效）.
+
+    校验失败抛出异常，不会被缓存。
+
+    Raises:
+        ImageCorruptedError: 文件损坏
+    """
     try:
         with Image.open(path) as img:
             img.verify()
     except Exception:
-        raise ImageCorruptedError(str(path))
+        raise ImageCorruptedError(path)
 
 
 def load_image(
     path: Path | str,
     use_cache: bool = False,
+    max_size: Optional[Tuple[int, int]] = None,
 ) -> Image.Image:
     """加载图片.
 
     Args:
         path: 图片文件路径
         use_cache: 是否使用缓存（默认 False）
+        max_size: 预期使用的最大尺寸。JPEG 会在解码时直接按 1/2、1/4、1/8
+            缩小到不小于该尺寸的最接近规格，其他格式忽略
 
     Returns:
         PIL Image 对象
@@ -85,6 +127,8 @@ def load_image(
     """
     path = Path(path)
     cache_key = str(path.absolute())
+    if max_size is not None:
+        cache_key = f"{cache_key}@{max_size[0]}x{max_size[1]}"
 
     if not path.exists():
         raise ImageNotFoundError(str(path))
@@ -103,6 +147,9 @@ def load_image(
 
     try:
         img = Image.open(path)
+        if max_size is not None:
+            # 仅 JPEG 生效：由 libjpeg 在 DCT 域缩放，跳过大部分像素的解码
+            img.draft(img.mode, max_size)
         img.load()  # 强制加载到内存
 
         # 存入缓存
@@ -120,19 +167,46 @@ def load_image(
         raise ImageCorruptedError(str(path))
 
 
+def load_image_for_resize(
+    path: Path | str,
+    target: Tuple[int, int],
+    maintain_aspect: bool = True,
+) -> Image.Image:
+    """加载图片并缩放到目标尺寸.
+
+    JPEG 先以接近目标的尺寸解码，再做精确缩放，避免解码完整分辨率。
+
+    Args:
+        path: 图片文件路径
+        target: 目标尺寸 (宽, 高)
+        maintain_aspect: 是否保持纵横比
+
+    Returns:
+        调整后的图片
+
+    Raises:
+        ImageNotFoundError: 文件不存在
+        ImageCorruptedError: 文件损坏
+    """
+    image = load_image(path, max_size=target)
+    return resize_image(image, target, maintain_aspect=maintain_aspect)
+
+
 def save_image(
     image: Image.Image,
     path: Path | str,
     quality: int = DEFAULT_OUTPUT_QUALITY,
     optimize: bool = True,
+    fast: bool = True,
 ) -> Path:
     """保存图片.
 
     Args:
         image: PIL Image 对象
         path: 保存路径
-        quality: JPEG 质量 (1-100)
+        quality: JPEG/WebP 质量 (1-100)
         optimize: 是否优化
+        fast: 是否使用快速编码参数（PNG 较低压缩级别、WebP 较快的 method）
 
     Returns:
         保存的文件路径
@@ -140,17 +214,14 @@ def save_image(
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    fmt = _SUFFIX_FORMATS.get(path.suffix.lower())
+
     # 确保是 RGB 模式（用于 JPEG）
-    if path.suffix.lower() in {".jpg", ".jpeg"}:
-        if image.mode in ("RGBA", "P"):
-            image = image.convert("RGB")
+    if fmt == "JPEG" and image.mode in ("RGBA", "P"):
+        image = image.convert("RGB")
 
     # 保存
-    save_kwargs = {"optimize": optimize}
-    if path.suffix.lower() in {".jpg", ".jpeg"}:
-        save_kwargs["quality"] = quality
-
-    image.save(path, **save_kwargs)
+    image.save(path, **_encoder_kwargs(fmt, quality, optimize, fast))
     logger.debug(f"图片已保存: {path}")
 
     return path
@@ -177,7 +248,7 @@ def resize_image(
         image.thumbnail(size, resample)
         return image
     else:
-        return image.resize(size, resample)
+        return image.resize(size, resample, reducing_gap=RESIZE_REDUCING_GAP)
 
 
 def fit_to_size(
@@ -206,7 +277,13 @@ def fit_to_size(
     # 缩放
     new_w = int(img_w * scale)
     new_h = int(img_h * scale)
-    resized = image.resize((new_w, new_h), Image.Resampling.LANCZOS)
+    resized = image.resize(
+        (new_w, new_h), Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP
+    )
+
+    # 缩放后恰好铺满且无透明通道时没有留白，直接返回，省去背景画布和粘贴
+    if (new_w, new_h) == (target_w, target_h) and resized.mode != "RGBA":
+        return ensure_rgb(resized)
 
     # 创建背景并粘贴
     result = Image.new("RGB", size, background_color)
@@ -222,10 +299,41 @@ def fit_to_size(
     return result
 
 
+def _encoder_kwargs(
+    fmt: Optional[str],
+    quality: int,
+    optimize: bool,
+    fast: bool,
+) -> dict:
+    """生成 Image.save 的编码参数.
+
+    Args:
+        fmt: 编码格式 (JPEG, PNG, WEBP)，未知格式为 None
+        quality: JPEG/WebP 质量
+        optimize: 是否优化
+        fast: 是否使用快速编码参数
+
+    Returns:
+        编码参数字典
+    """
+    kwargs = {}
+    if fast and fmt == "PNG":
+        # optimize 会强制使用最高压缩级别，快速模式改用较低级别
+        kwargs["compress_level"] = PNG_FAST_COMPRESS_LEVEL
+    elif optimize:
+        kwargs["optimize"] = True
+    if fmt in _QUALITY_FORMATS:
+        kwargs["quality"] = quality
+    if fast and fmt == "WEBP":
+        kwargs["method"] = WEBP_FAST_METHOD
+    return kwargs
+
+
 def convert_format(
     image: Image.Image,
     format: str,
     quality: int = DEFAULT_OUTPUT_QUALITY,
+    fast: bool = True,
 ) -> bytes:
     """转换图片格式.
 
@@ -233,22 +341,40 @@ def convert_format(
         image: PIL Image 对象
         format: 目标格式 (JPEG, PNG, WEBP)
         quality: 质量
+        fast: 是否使用快速编码参数
 
     Returns:
         图片字节数据
     """
+    return _encode_to_buffer(image, format, quality, fast).getvalue()
+
+
+def _encode_to_buffer(
+    image: Image.Image,
+    format: str,
+    quality: int = DEFAULT_OUTPUT_QUALITY,
+    fast: bool = True,
+) -> io.BytesIO:
+    """将图片编码到内存缓冲区.
+
+    Args:
+        image: PIL Image 对象
+        format: 目标格式 (JPEG, PNG, WEBP)
+        quality: 质量
+        fast: 是否使用快速编码参数
+
+    Returns:
+        包含编码数据的缓冲区
+    """
     buffer = io.BytesIO()
+    fmt = format.upper()
 
     # 确保格式正确
-    if format.upper() == "JPEG" and image.mode in ("RGBA", "P"):
+    if fmt == "JPEG" and image.mode in ("RGBA", "P"):
         image = image.convert("RGB")
 
-    save_kwargs = {}
-    if format.upper() in ("JPEG", "WEBP"):
-        save_kwargs["quality"] = quality
-
-    image.save(buffer, format=format.upper(), **save_kwargs)
-    return buffer.getvalue()
+    image.save(buffer, format=fmt, **_encoder_kwargs(fmt, quality, False, fast))
+    return buffer
 
 
 def image_to_base64(
@@ -266,8 +392,10 @@ def image_to_base64(
     Returns:
         Base64 字符串
     """
-    data = convert_format(image, format, quality)
-    return base64.b64encode(data).decode("utf-8")
+    # 直接编码缓冲区视图，省去 getvalue() 的整图拷贝；Base64 只含 ASCII 字符
+    buffer = _encode_to_buffer(image, format, quality)
+    with buffer.getbuffer() as view:
+        return base64.b64encode(view).decode("ascii")
 
 
 def base64_to_image(base64_str: str) -> Image.Image:
@@ -279,12 +407,23 @@ def base64_to_image(base64_str: str) -> Image.Image:
     Returns:
         PIL Image 对象
     """
-    # 移除可能的前缀
-    if "," in base64_str:
-        base64_str = base64_str.split(",")[1]
+    # 移除可能的前缀（data URL）
+    start = base64_str.find(",") + 1
+    end = base64_str.find(",", start)
+    if end < 0:
+        end = len(base64_str)
 
-    data = base64.b64decode(base64_str)
-    return Image.open(io.BytesIO(data))
+    # 含空白字符时分块会破坏 4 字符对齐，整体解码
+    if any(c in base64_str for c in "\n\r\t "):
+        return Image.open(io.BytesIO(base64.b64decode(base64_str[start:end])))
+
+    # 分块解码写入缓冲区，避免整段 ASCII 副本和完整解码结果同时驻留内存
+    buffer = io.BytesIO()
+    for offset in range(start, end, _BASE64_DECODE_CHUNK):
+        chunk = base64_str[offset:min(offset + _BASE64_DECODE_CHUNK, end)]
+        buffer.write(binascii.a2b_base64(chunk))
+    buffer.seek(0)
+    return Image.open(buffer)
 
 
 def bytes_to_image(data: bytes) -> Image.Image:
@@ -326,20 +465,34 @@ def get_image_info(path: Path | str) -> dict:
     Returns:
         图片信息字典
     """
-    path = Path(path)
-    with Image.open(path) as img:
+    st = os.stat(path)
+    # 缓存中的字典是共享的，返回副本
+    return dict(_read_image_info(os.fspath(path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=1024)
+def _read_image_info(path: str, mtime_ns: int, size: int) -> dict:
+    """读取图片信息（按路径、修改时间和大小缓存，文件变化后自动失效）."""
+    file_path = Path(path)
+    with Image.open(file_path) as img:
         return {
-            "path": str(path),
-            "filename": path.name,
+            "path": str(file_path),
+            "filename": file_path.name,
             "format": img.format,
             "mode": img.mode,
             "size": img.size,
             "width": img.width,
             "height": img.height,
-            "file_size": get_file_size(path),
+            "file_size": size,
         }
 
 
+def clear_image_cache() -> None:
+    """清空图片信息和校验结果缓存."""
+    _read_image_info.cache_clear()
+    _verify_image.cache_clear()
+
+
 def create_thumbnail(
     image: Image.Image,
     size: Tuple[int, int] = (150, 150),
@@ -354,7 +507,7 @@ def create_thumbnail(
         缩略图
     """
     thumb = image.copy()
-    thumb.thumbnail(size, Image.Resampling.LANCZOS)
+    thumb.thumbnail(size, THUMBNAIL_RESAMPLE)
     return thumb
 
 
@@ -402,6 +555,28 @@ def ensure_rgba(image: Image.Image) -> Image.Image:
     return image
 
 
+def _paste_with_alpha(
+    background: Image.Image,
+    image: Image.Image,
+    position: Tuple[int, int],
+) -> None:
+    """按透明度将图片粘贴到背景上.
+
+    不含透明信息的图片直接粘贴（由 paste 转换模式），
+    省去转换 RGBA 和逐像素 alpha 合成。
+
+    Args:
+        background: 背景图片（原地修改）
+        image: 要粘贴的图片
+        position: 粘贴位置 (x, y)
+    """
+    if "A" not in image.getbands() and "transparency" not in image.info:
+        background.paste(image, position)
+        return
+    image = ensure_rgba(image)
+    background.paste(image, position, image.getchannel("A"))
+
+
 def add_solid_background(
     image: Image.Image,
     color: Tuple[int, int, int],
@@ -419,15 +594,11 @@ def add_solid_background(
     Returns:
         添加背景后的 RGB 模式图片
     """
-    # 确保是 RGBA 模式以处理透明度
-    if image.mode != "RGBA":
-        image = image.convert("RGBA")
-
     # 创建背景
     background = Image.new("RGB", image.size, color)
 
     # 使用 alpha 通道作为蒙版合成
-    background.paste(image, (0, 0), image.split()[3])
+    _paste_with_alpha(background, image, (0, 0))
 
     return background
 
@@ -450,12 +621,11 @@ def create_background_preview(
         预览图片
     """
     if with_checkerboard:
-        # 创建棋盘格背景
+        # 创建棋盘格背景（RGB）
         preview = _create_checkerboard(size)
-        # 叠加半透明颜色层
-        color_layer = Image.new("RGBA", size, (*color, 200))
-        preview.paste(color_layer, (0, 0), color_layer)
-        return preview.convert("RGB")
+        # 以恒定透明度蒙版直接填充颜色，无需创建 RGBA 颜色层和转换副本
+        preview.paste(color, None, Image.new("L", size, 200))
+        return preview
     else:
         return Image.new("RGB", size, color)
 
@@ -479,13 +649,24 @@ def _create_checkerboard(
     """
     w, h = size
     img = Image.new("RGB", size, color1)
+    if w <= 0 or h <= 0:
+        return img
 
-    for y in range(0, h, cell_size):
-        for x in range(0, w, cell_size):
-            if (x // cell_size + y // cell_size) % 2 == 0:
-                for dy in range(min(cell_size, h - y)):
-                    for dx in range(min(cell_size, w - x)):
-                        img.putpixel((x + dx, y + dy), color2)
+    # 先按格子生成奇偶蒙版（每个格子一个像素，行列之和为偶数的格子为 255），
+    # 再最近邻放大到像素尺寸，整个填充在 PIL 的 C 代码中完成
+    cols = -(-w // cell_size)
+    rows = -(-h // cell_size)
+    even_row = (b"\xff\x00" * (cols // 2 + 1))[:cols]
+    odd_row = (b"\x00\xff" * (cols // 2 + 1))[:cols]
+    grid = Image.frombytes(
+        "L",
+        (cols, rows),
+        b"".join(odd_row if row % 2 else even_row for row in range(rows)),
+    )
+    mask = grid.resize(
+        (cols * cell_size, rows * cell_size), Image.Resampling.NEAREST
+    ).crop((0, 0, w, h))
+    img.paste(color2, None, mask)
 
     return img
 
@@ -541,7 +722,7 @@ def composite_with_background(
         y = (bg_h - fg_h) // 2
 
     # 合成
-    result.paste(foreground, (x, y), foreground.split()[3])
+    result.paste(foreground, (x, y), foreground.getchannel("A"))
 
     return result
 
@@ -561,8 +742,6 @@ def apply_background_with_padding(
     Returns:
         添加背景和边距后的图片
     """
-    image = ensure_rgba(image)
-
     # 解析边距
     if isinstance(padding, int):
         top = right = bottom = left = padding
@@ -578,7 +757,7 @@ def apply_background_with_padding(
     result = Image.new("RGB", (new_w, new_h), background_color)
 
     # 粘贴原图
-    result.paste(image, (left, top), image.split()[3])
+    _paste_with_alpha(result, image, (left, top))
 
     return result
 
@@ -604,25 +783,95 @@ def add_solid_border(
     Returns:
         添加边框后的图片
     """
-    from PIL import ImageDraw
+    # 确保是 RGB 模式（转换结果即为副本，不会修改原图）
+    result = image.convert("RGB") if image.mode != "RGB" else image.copy()
+    _fill_frame(result, 0, width, color)
+    return result
 
-    # 确保是 RGB 模式
-    if image.mode != "RGB":
-        image = image.convert("RGB")
 
-    # 复制图片以避免修改原图
-    result = image.copy()
-    draw = ImageDraw.Draw(result)
-    w, h = result.size
+def _fill_frame(
+    image: Image.Image,
+    start: int,
+    end: int,
+    color: Tuple[int, int, int],
+) -> None:
+    """填充第 start 到 end - 1 层（从外向内）的矩形框（原地修改）.
 
-    # 绘制边框（多层矩形）
-    for i in range(width):
-        draw.rectangle(
-            [i, i, w - 1 - i, h - 1 - i],
-            outline=color,
-        )
+    上下左右四个色块各一次 paste，代替逐层绘制矩形。
 
-    return result
+    Args:
+        image: RGB 图片
+        start: 起始层（含）
+        end: 结束层（不含）
+        color: 填充颜色
+    """
+    w, h = image.size
+    boxes = (
+        (start, start, w - start, min(end, h - start)),  # 上
+        (start, max(h - end, start), w - start, h - start),  # 下
+        (start, start, min(end, w - start), h - start),  # 左
+        (max(w - end, start), start, w - start, h - start),  # 右
+    )
+    for x0, y0, x1, y1 in boxes:
+        if x1 > x0 and y1 > y0:
+            image.paste(color, (x0, y0, x1, y1))
+
+
+def _pattern_band(length: int, layers: int, on: int, period: int) -> Image.Image:
+    """生成边框一条边的图案蒙版.
+
+    第 i 行从第 i 个像素开始、到倒数第 i 个像素结束，按周期重复
+    「on 个点亮像素 + 其余熄灭像素」的图案，对应向内第 i 层边框。
+
+    Args:
+        length: 边的长度
+        layers: 层数（边框宽度）
+        on: 每个周期中点亮的像素数
+        period: 图案周期
+
+    Returns:
+        尺寸为 (length, layers) 的 L 模式蒙版
+    """
+    on = min(on, period)
+    unit = b"\xff" * on + b"\x00" * (period - on)
+    pattern = unit * (length // period + 1)
+    rows = []
+    for layer in range(layers):
+        lead = min(layer, length)
+        inner = max(length - 2 * layer, 0)
+        rows.append(b"\x00" * lead + pattern[:inner] + b"\x00" * (length - lead - inner))
+    return Image.frombytes("L", (length, layers), b"".join(rows))
+
+
+def _paste_pattern_border(
+    image: Image.Image,
+    width: int,
+    color: Tuple[int, int, int],
+    on: int,
+    period: int,
+) -> None:
+    """按重复图案绘制边框（原地修改）.
+
+    每条边生成一张蒙版，四次 paste 完成全部层，代替逐段绘制。
+
+    Args:
+        image: RGB 图片
+        width: 边框宽度
+        color: 边框颜色
+        on: 每个周期中点亮的像素数
+        period: 图案周期
+    """
+    w, h = image.size
+    if width <= 0 or w == 0 or h == 0:
+        return
+
+    horizontal = _pattern_band(w, width, on, period)
+    image.paste(color, (0, 0), horizontal)
+    image.paste(color, (0, h - width), horizontal.transpose(Image.Transpose.FLIP_TOP_BOTTOM))
+
+    vertical = _pattern_band(h, width, on, period).transpose(Image.Transpose.TRANSPOSE)
+    image.paste(color, (0, 0), vertical)
+    image.paste(color, (w - width, 0), vertical.transpose(Image.Transpose.FLIP_LEFT_RIGHT))
 
 
 def add_dashed_border(
@@ -644,43 +893,10 @@ def add_dashed_border(
     Returns:
         添加边框后的图片
     """
-    from PIL import ImageDraw
-
-    if image.mode != "RGB":
-        image = image.convert("RGB")
-
-    result = image.copy()
-    draw = ImageDraw.Draw(result)
-    w, h = result.size
-
-    # 绘制虚线边框
-    for layer in range(width):
-        offset = layer
-        # 上边
-        x = offset
-        while x < w - offset:
-            x_end = min(x + dash_length, w - 1 - offset)
-            draw.line([(x, offset), (x_end, offset)], fill=color, width=1)
-            x += dash_length + gap_length
-        # 下边
-        x = offset
-        while x < w - offset:
-            x_end = min(x + dash_length, w - 1 - offset)
-            draw.line([(x, h - 1 - offset), (x_end, h - 1 - offset)], fill=color, width=1)
-            x += dash_length + gap_length
-        # 左边
-        y = offset
-        while y < h - offset:
-            y_end = min(y + dash_length, h - 1 - offset)
-            draw.line([(offset, y), (offset, y_end)], fill=color, width=1)
-            y += dash_length + gap_length
-        # 右边
-        y = offset
-        while y < h - offset:
-            y_end = min(y + dash_length, h - 1 - offset)
-            draw.line([(w - 1 - offset, y), (w - 1 - offset, y_end)], fill=color, width=1)
-            y += dash_length + gap_length
+    result = image.convert("RGB") if image.mode != "RGB" else image.copy()
 
+    # 每段虚线包含两端端点，共 dash_length + 1 个像素
+    _paste_pattern_border(result, width, color, dash_length + 1, dash_length + gap_length)
     return result
 
 
@@ -701,27 +917,9 @@ def add_dotted_border(
     Returns:
         添加边框后的图片
     """
-    from PIL import ImageDraw
-
-    if image.mode != "RGB":
-        image = image.convert("RGB")
-
-    result = image.copy()
-    draw = ImageDraw.Draw(result)
-    w, h = result.size
-
-    # 绘制点线边框
-    for layer in range(width):
-        offset = layer
-        # 上边和下边
-        for x in range(offset, w - offset, dot_spacing):
-            draw.point((x, offset), fill=color)
-            draw.point((x, h - 1 - offset), fill=color)
-        # 左边和右边
-        for y in range(offset, h - offset, dot_spacing):
-            draw.point((offset, y), fill=color)
-            draw.point((w - 1 - offset, y), fill=color)
+    result = image.convert("RGB") if image.mode != "RGB" else image.copy()
 
+    _paste_pattern_border(result, width, color, 1, dot_spacing)
     return result
 
 
@@ -740,14 +938,7 @@ def add_double_border(
     Returns:
         添加边框后的图片
     """
-    from PIL import ImageDraw
-
-    if image.mode != "RGB":
-        image = image.convert("RGB")
-
-    result = image.copy()
-    draw = ImageDraw.Draw(result)
-    w, h = result.size
+    result = image.convert("RGB") if image.mode != "RGB" else image.copy()
 
     # 双线边框：外线 + 间隔 + 内线
     outer_width = max(1, width // 3)
@@ -755,14 +946,11 @@ def add_double_border(
     gap = max(1, width - outer_width - inner_width)
 
     # 外线
-    for i in range(outer_width):
-        draw.rectangle([i, i, w - 1 - i, h - 1 - i], outline=color)
+    _fill_frame(result, 0, outer_width, color)
 
     # 内线
     inner_offset = outer_width + gap
-    for i in range(inner_width):
-        offset = inner_offset + i
-        draw.rectangle([offset, offset, w - 1 - offset, h - 1 - offset], outline=color)
+    _fill_frame(result, inner_offset, inner_offset + inner_width, color)
 
     return result
 
@@ -784,13 +972,7 @@ def add_3d_border(
     Returns:
         添加边框后的图片
     """
-    from PIL import ImageDraw
-
-    if image.mode != "RGB":
-        image = image.convert("RGB")
-
-    result = image.copy()
-    draw = ImageDraw.Draw(result)
+    result = image.convert("RGB") if image.mode != "RGB" else image.copy()
     w, h = result.size
 
     # 计算亮色和暗色
@@ -814,25 +996,69 @@ def add_3d_border(
 
     half_width = width // 2
 
-    # 绘制外层
-    for i in range(half_width):
-        # 上边和左边
-        draw.line([(i, i), (w - 1 - i, i)], fill=top_left_outer)  # 上
-        draw.line([(i, i), (i, h - 1 - i)], fill=top_left_outer)  # 左
-        # 下边和右边
-        draw.line([(i, h - 1 - i), (w - 1 - i, h - 1 - i)], fill=bottom_right_outer)  # 下
-        draw.line([(w - 1 - i, i), (w - 1 - i, h - 1 - i)], fill=bottom_right_outer)  # 右
-
-    # 绘制内层
-    for i in range(half_width, width):
-        draw.line([(i, i), (w - 1 - i, i)], fill=top_left_inner)
-        draw.line([(i, i), (i, h - 1 - i)], fill=top_left_inner)
-        draw.line([(i, h - 1 - i), (w - 1 - i, h - 1 - i)], fill=bottom_right_inner)
-        draw.line([(w - 1 - i, i), (w - 1 - i, h - 1 - i)], fill=bottom_right_inner)
+    if w < 2 * width or h < 2 * width:
+        # 边框相互重叠的小图逐层画线
+        from PIL import ImageDraw
+
+        draw = ImageDraw.Draw(result)
+        for i in range(width):
+            top_left, bottom_right = (
+                (top_left_outer, bottom_right_outer)
+                if i < half_width
+                else (top_left_inner, bottom_right_inner)
+            )
+            draw.line([(i, i), (w - 1 - i, i)], fill=top_left)  # 上
+            draw.line([(i, i), (i, h - 1 - i)], fill=top_left)  # 左
+            draw.line([(i, h - 1 - i), (w - 1 - i, h - 1 - i)], fill=bottom_right)  # 下
+            draw.line([(w - 1 - i, i), (w - 1 - i, h - 1 - i)], fill=bottom_right)  # 右
+        return result
+
+    # 外层和内层各自整段填充
+    _fill_bevel(result, 0, half_width, top_left_outer, bottom_right_outer)
+    _fill_bevel(result, half_width, width, top_left_inner, bottom_right_inner)
 
     return result
 
 
+def _fill_bevel(
+    image: Image.Image,
+    start: int,
+    end: int,
+    top_left: Tuple[int, int, int],
+    bottom_right: Tuple[int, int, int],
+) -> None:
+    """填充第 start 到 end - 1 层的斜角边框（原地修改）.
+
+    上边和左边为 top_left，下边和右边为 bottom_right，左下角和右上角
+    沿对角线分界。调用方需保证图片尺寸不小于 2 * end。
+
+    Args:
+        image: RGB 图片
+        start: 起始层（含）
+        end: 结束层（不含）
+        top_left: 上边和左边颜色
+        bottom_right: 下边和右边颜色
+    """
+    n = end - start
+    if n <= 0:
+        return
+    w, h = image.size
+
+    image.paste(top_left, (start, start, w - start, end))  # 上
+    image.paste(top_left, (start, start, end, h - start))  # 左
+    image.paste(bottom_right, (end, h - end, w - start, h - start))  # 下（不含左下角）
+    image.paste(bottom_right, (w - end, end, w - start, h - start))  # 右（不含右上角）
+
+    # 左下角和右上角：对角线 u + v >= n - 1 的一侧属于下边/右边
+    corner = Image.frombytes(
+        "L",
+        (n, n),
+        b"".join(b"\x00" * (n - 1 - v) + b"\xff" * (v + 1) for v in range(n)),
+    )
+    image.paste(bottom_right, (start, h - end), corner)
+    image.paste(bottom_right, (w - end, start), corner)
+
+
 def add_border(
     image: Image.Image,
     width: int,
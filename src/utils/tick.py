@@ -0,0 +1,125 @@
+"""共享定时器模块.
+
+多个需要周期刷新的组件共用一个应用级 QTimer，避免每个组件各自持有定时器。
+
+Features:
+    - 全局单例，按需启动/停止
+    - 回调弱引用，组件销毁（含 C++ 对象被删除）后自动失效
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Callable, Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import QCoreApplication, QObject, QTimer
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 共享定时器间隔（毫秒）
+TICK_INTERVAL_MS = 100
+
+
+def _make_ref(callback: Callable[[], None]) -> weakref.ref:
+    """创建回调的弱引用（绑定方法需使用 WeakMethod）."""
+    if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+        return weakref.WeakMethod(callback)
+    return weakref.ref(callback)
+
+
+class SharedTick(QObject):
+    """应用级共享定时器.
+
+    注册的回调每 TICK_INTERVAL_MS 被调用一次。只持有回调的弱引用，
+    没有已注册的回调时定时器停止。
+
+    Example:
+        >>> tick = SharedTick.instance()
+        >>> tick.register(widget.on_tick)
+        >>> tick.unregister(widget.on_tick)
+    """
+
+    _instance: Optional["SharedTick"] = None
+
+    def __init__(
+        self,
+        interval_ms: int = TICK_INTERVAL_MS,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """初始化共享定时器.
+
+        Args:
+            interval_ms: 定时间隔（毫秒）
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._callbacks: list[weakref.ref] = []
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_timeout)
+
+    @classmethod
+    def instance(cls) -> "SharedTick":
+        """获取全局实例（挂在 QApplication 下，随应用销毁）."""
+        if cls._instance is None:
+            cls._instance = cls(parent=QCoreApplication.instance())
+        return cls._instance
+
+    @property
+    def is_active(self) -> bool:
+        """定时器是否运行中."""
+        return self._timer.isActive()
+
+    def register(self, callback: Callable[[], None]) -> None:
+        """注册回调（重复注册无效）.
+
+        Args:
+            callback: 无参回调
+        """
+        if self._find(callback) < 0:
+            self._callbacks.append(_make_ref(callback))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unregister(self, callback: Callable[[], None]) -> None:
+        """取消注册回调.
+
+        Args:
+            callback: 已注册的回调
+        """
+        index = self._find(callback)
+        if index >= 0:
+            del self._callbacks[index]
+        if not self._callbacks:
+            self._timer.stop()
+
+    def _find(self, callback: Callable[[], None]) -> int:
+        """查找回调的位置，未注册返回 -1."""
+        for i, ref in enumerate(self._callbacks):
+            if ref() == callback:
+                return i
+        return -1
+
+    def _on_timeout(self) -> None:
+        """调用所有存活的回调，清理已失效的引用."""
+        # 遍历快照，回调中可以注册/取消注册
+        dead = set()
+        for ref in tuple(self._callbacks):
+            callback = ref()
+            # 绑定方法所属的 Qt 对象已被删除时同样视为失效
+            owner = getattr(callback, "__self__", None)
+            if callback is None or (isinstance(owner, QObject) and sip.isdeleted(owner)):
+                dead.add(id(ref))
+                continue
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"共享定时器回调执行失败: {e}")
+        if dead:
+            self._callbacks = [ref for ref in self._callbacks if id(ref) not in dead]
+        if not self._callbacks:
+            self._timer.stop()
@@ -427,6 +427,20 @@ class TestTemplateConfig:
         template = TemplateConfig()
         assert template.get_layer_by_id("nonexistent") is None
 
+    def test_find_layer_index_with_hint(self):
+        """索引提示失效时应回退到遍历查找."""
+        template = TemplateConfig()
+        first = TextLayer.create("A")
+        second = TextLayer.create("B")
+        template.add_layer(first)
+        template.add_layer(second)
+
+        assert template.find_layer_index(second.id) == 1
+        assert template.find_layer_index(second.id, hint=1) == 1
+        assert template.find_layer_index(second.id, hint=0) == 1
+        assert template.find_layer_index(second.id, hint=99) == 1
+        assert template.find_layer_index("nonexistent", hint=0) == -1
+
     def test_remove_layer(self):
         """测试删除图层."""
         template = TemplateConfig()
@@ -621,6 +635,15 @@ class TestLayerDeserialization:
         assert isinstance(layers[0], ImageLayer)
         assert layers[0].image_path == "/path/to/image.png"
 
+    def test_deserialize_enum_layer_type(self):
+        """枚举类型值也应能反序列化."""
+        template = TemplateConfig()
+        template.layers.append({"type": LayerType.ELLIPSE, "width": 50, "height": 50})
+
+        layers = template.get_layers()
+        assert len(layers) == 1
+        assert isinstance(layers[0], ShapeLayer)
+
     def test_skip_invalid_layer(self):
         """应跳过无效的图层数据."""
         template = TemplateConfig()
@@ -249,6 +249,33 @@ class TestTemplateManager:
         # ID 应该不同
         assert imported.id != template.id
 
+    def test_get_all_metas(self, manager):
+        """测试一次获取预设和用户模板元数据."""
+        template = TemplateConfig.create("我的模板")
+        manager.save_template(template)
+
+        presets, mine = manager.get_all_metas()
+
+        assert len(presets) == 4
+        assert all(m.is_preset for m in presets)
+        assert [m.id for m in mine] == [template.id]
+
+    def test_get_all_metas_caches_presets(self, manager, monkeypatch):
+        """测试预设模板元数据被缓存."""
+        manager.get_all_metas()
+        calls = []
+        monkeypatch.setattr(
+            manager, "get_preset_templates", lambda: calls.append(1) or []
+        )
+
+        presets, _ = manager.get_all_metas()
+        assert calls == []
+        assert len(presets) == 4
+
+        presets, _ = manager.get_all_metas(reload_presets=True)
+        assert calls == [1]
+        assert presets == []
+
 
 # ===================
 # 预设模板测试
@@ -163,11 +163,63 @@ class TestTemplateCanvasLayerManagement:
         layer.x = 100
         layer.y = 200
         canvas.update_layer(layer.id)
+        app.processEvents()
 
         item = canvas.get_layer_item(layer.id)
         assert item.pos().x() == 100
         assert item.pos().y() == 200
 
+    def test_should_defer_updates_in_batch(self, app):
+        """批量更新期间应延迟到最外层结束时刷新."""
+        canvas = TemplateCanvas()
+        canvas.set_template(TemplateConfig())
+        layer = TextLayer(x=0, y=0)
+        canvas.add_layer(layer)
+        item = canvas.get_layer_item(layer.id)
+
+        canvas.begin_batch()
+        canvas.begin_batch()
+        layer.x = 50
+        canvas.update_layer(layer.id)
+        canvas.update_layer(layer.id)
+        canvas.end_batch()
+        assert item.pos().x() == 0
+
+        canvas.end_batch()
+        assert item.pos().x() == 50
+
+    def test_should_coalesce_updates_per_event_loop_turn(self, app):
+        """同一轮事件循环内的多次更新应合并为一次刷新."""
+        canvas = TemplateCanvas()
+        canvas.set_template(TemplateConfig())
+        layer = TextLayer(x=0, y=0)
+        canvas.add_layer(layer)
+        item = canvas.get_layer_item(layer.id)
+
+        with patch.object(
+            item, "update_from_layer", wraps=item.update_from_layer
+        ) as update:
+            layer.x = 30
+            canvas.update_layer(layer.id)
+            canvas.update_layer(layer.id)
+            assert update.call_count == 0
+
+            app.processEvents()
+            assert update.call_count == 1
+        assert item.pos().x() == 30
+
+    def test_flush_layer_updates(self, app):
+        """应能立即刷新延迟的更新."""
+        canvas = TemplateCanvas()
+        canvas.set_template(TemplateConfig())
+        layer = TextLayer(x=0, y=0)
+        canvas.add_layer(layer)
+
+        layer.x = 70
+        canvas.update_layer(layer.id)
+        canvas.flush_layer_updates()
+        assert canvas.get_layer_item(layer.id).pos().x() == 70
+
 
 # ===================
 # 缩放测试
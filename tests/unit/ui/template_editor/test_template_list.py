@@ -0,0 +1,204 @@
+"""模板列表组件单元测试."""
+
+import shutil
+import tempfile
+
+import pytest
+from PyQt6.QtWidgets import QDialog, QInputDialog, QListView
+
+from src.models.template_config import TemplateConfig
+from src.services.template_manager import TemplateManager, TemplateMetadata
+from src.ui.widgets.template_editor.template_list import (
+    TEMPLATE_ID_ROLE,
+    TemplateListWidget,
+)
+
+
+@pytest.fixture
+def manager():
+    """创建使用临时目录的模板管理器."""
+    temp = tempfile.mkdtemp()
+    yield TemplateManager(templates_dir=temp)
+    shutil.rmtree(temp, ignore_errors=True)
+
+
+@pytest.fixture
+def widget(app, manager):
+    """创建模板列表组件."""
+    w = TemplateListWidget(manager=manager)
+    yield w
+    w.deleteLater()
+
+
+def _ids(list_widget):
+    """获取列表中的模板 ID."""
+    return [
+        list_widget.item(i).data(TEMPLATE_ID_ROLE) for i in range(list_widget.count())
+    ]
+
+
+# ===================
+# 加载测试
+# ===================
+
+
+class TestTemplateListLoading:
+    """测试列表加载."""
+
+    def test_should_defer_loading_until_shown(self, widget):
+        """隐藏时不应加载列表."""
+        assert widget._preset_list.count() == 0
+
+    def test_lists_use_uniform_batched_layout(self, widget):
+        """列表应使用统一行高和分批布局."""
+        for list_widget in (widget._preset_list, widget._my_list):
+            assert list_widget.uniformItemSizes() is True
+            assert list_widget.layoutMode() == QListView.LayoutMode.Batched
+
+    def test_should_load_on_show(self, app, widget):
+        """显示时应加载预设模板."""
+        widget.show()
+        app.processEvents()
+        assert widget._preset_list.count() == 4
+
+    def test_should_coalesce_refresh_requests(self, app, widget, manager):
+        """多次刷新请求应合并为一次."""
+        widget.show()
+        app.processEvents()
+        calls = []
+        original = manager.get_template_list
+        manager.get_template_list = lambda *a, **kw: calls.append(1) or original(*a, **kw)
+        widget.refresh()
+        widget.refresh()
+        widget.refresh()
+        app.processEvents()
+        assert len(calls) == 1
+
+    def test_should_cache_presets(self, app, widget, manager):
+        """刷新时应复用预设缓存，刷新按钮时重新加载."""
+        widget.show()
+        app.processEvents()
+        calls = []
+        original = manager.get_preset_templates
+        manager.get_preset_templates = lambda: calls.append(1) or original()
+        widget.refresh()
+        app.processEvents()
+        assert calls == []
+        widget._on_refresh()
+        app.processEvents()
+        assert calls == [1]
+        assert widget._preset_list.count() == 4
+
+    def test_refresh_while_hidden_is_deferred(self, app, widget, manager):
+        """隐藏时刷新应推迟到显示."""
+        widget.show()
+        app.processEvents()
+        widget.hide()
+        template = TemplateConfig.create("隐藏时新增")
+        manager.save_template(template)
+        widget.refresh()
+        assert template.id not in _ids(widget._my_list)
+        widget.show()
+        app.processEvents()
+        assert template.id in _ids(widget._my_list)
+
+    def test_select_template_loads_pending_list(self, widget, manager):
+        """选中模板前应补做刷新."""
+        template = TemplateConfig.create("待选中")
+        manager.save_template(template)
+        widget.select_template(template.id)
+        assert widget.get_selected_template_id() == template.id
+
+
+# ===================
+# 增量更新测试
+# ===================
+
+
+class TestTemplateListIncremental:
+    """测试增量更新."""
+
+    def test_insert_row_at_top(self, widget, manager):
+        """新模板应插入顶部并选中."""
+        widget.show()
+        template = TemplateConfig.create("新模板")
+        manager.save_template(template)
+        widget._add_and_select(template)
+        assert _ids(widget._my_list)[0] == template.id
+        assert widget.get_selected_template_id() == template.id
+
+    def test_remove_row(self, widget, manager):
+        """应能移除行."""
+        widget.show()
+        template = TemplateConfig.create("待删除")
+        manager.save_template(template)
+        widget._add_and_select(template)
+        assert widget._remove_row(template.id) is True
+        assert template.id not in _ids(widget._my_list)
+        assert widget._remove_row(template.id) is False
+
+    def test_update_row(self, widget, manager):
+        """应能更新行显示."""
+        widget.show()
+        template = TemplateConfig.create("旧名称")
+        manager.save_template(template)
+        item = widget._insert_row(TemplateMetadata.from_template(template))
+        meta = item.metadata
+        meta.name = "新名称"
+        assert widget._update_row(template.id, meta) is True
+        assert "新名称" in item.text()
+
+    def test_select_preset_template(self, app, widget, manager):
+        """应能通过 ID 选中预设模板."""
+        widget.show()
+        app.processEvents()
+        preset_id = _ids(widget._preset_list)[-1]
+        widget.select_template(preset_id)
+        assert widget.get_selected_template_id() == preset_id
+        assert widget._preset_list.currentRow() == widget._preset_list.count() - 1
+
+
+# ===================
+# 操作测试
+# ===================
+
+
+class TestTemplateListActions:
+    """测试列表操作."""
+
+    def test_new_template_reuses_name_dialog(self, app, widget, monkeypatch):
+        """新建模板应复用同一个名称对话框."""
+        monkeypatch.setattr(
+            QInputDialog, "exec", lambda self: QDialog.DialogCode.Accepted.value
+        )
+        widget.show()
+        app.processEvents()
+
+        widget._on_new_template()
+        dialog = widget._name_dialog
+        widget._on_new_template()
+
+        assert widget._name_dialog is dialog
+        assert widget._my_list.count() == 2
+        assert widget._my_list.item(0).metadata.name == "未命名模板"
+
+    def test_rename_unchanged_skips_manager(self, app, widget, manager, monkeypatch):
+        """名称未变化时不应调用管理器."""
+        template = TemplateConfig.create("原名称")
+        manager.save_template(template)
+        widget.show()
+        app.processEvents()
+        item = widget._my_index[template.id]
+
+        calls = []
+        monkeypatch.setattr(
+            manager, "rename_template", lambda *args: calls.append(args) or True
+        )
+        monkeypatch.setattr(widget, "_prompt_name", lambda *a, **kw: ("原名称 ", True))
+        widget._on_rename(item)
+        assert calls == []
+
+        monkeypatch.setattr(widget, "_prompt_name", lambda *a, **kw: ("新名称", True))
+        widget._on_rename(item)
+        assert calls == [(template.id, "新名称")]
+        assert "新名称" in item.text()
@@ -36,6 +36,14 @@ class TestTextEditWidget:
         assert widget.font().pointSize() == 24
         assert widget.font().bold() is True
 
+    def test_should_reset_font_between_layers(self, app):
+        """复用字体时应重置上一个图层的样式."""
+        widget = TextEditWidget()
+        widget.setup_from_layer(TextLayer(content="A", font_size=30, bold=True))
+        widget.setup_from_layer(TextLayer(content="B", font_size=12, bold=False))
+        assert widget.font().pointSize() == 12
+        assert widget.font().bold() is False
+
     def test_should_have_signals(self, app):
         """应有信号."""
         widget = TextEditWidget()
@@ -100,6 +108,43 @@ class TestTextEditOverlay:
         assert overlay.is_editing is False
         assert overlay.isVisible() is False
 
+    def test_should_restore_content_when_reediting_same_layer(self, app):
+        """重新编辑未变化的图层时应恢复原内容."""
+        overlay = TextEditOverlay()
+        layer = TextLayer(content="Test")
+        item = TextLayerItem(layer)
+
+        overlay.start_editing(item)
+        overlay._editor.setPlainText("Changed")
+        overlay.cancel_editing()
+        overlay.start_editing(item)
+
+        assert overlay.is_editing is True
+        assert overlay.finish_editing() == "Test"
+
+    def test_should_reconfigure_when_layer_changes(self, app):
+        """图层样式变化时应重新配置编辑器."""
+        overlay = TextEditOverlay()
+        layer = TextLayer(content="Test", font_size=20)
+        item = TextLayerItem(layer)
+
+        overlay.start_editing(item)
+        overlay.cancel_editing()
+        layer.font_size = 40
+        overlay.start_editing(item)
+
+        assert overlay._editor.font().pointSize() == 40
+
+    def test_should_align_position_with_layer_item(self, app):
+        """开始编辑时覆盖层位置应与图层项一致（内边距由几何区域处理）."""
+        overlay = TextEditOverlay()
+        layer = TextLayer(content="Test", x=30, y=40, background_padding=10)
+        item = TextLayerItem(layer)
+
+        overlay.start_editing(item)
+
+        assert overlay.pos() == item.pos()
+
     def test_should_have_signals(self, app):
         """应有信号."""
         overlay = TextEditOverlay()
@@ -255,6 +255,26 @@ class TestCommandStack:
         command_stack.undo()
         assert True in can_redo_changes  # can_redo became True
 
+    def test_signals_only_on_transition(
+        self,
+        command_stack: CommandStack,
+        mock_canvas: MagicMock,
+    ) -> None:
+        """测试 can_undo_changed 仅在状态翻转时发射."""
+        can_undo_changes = []
+        stack_changes = []
+        command_stack.can_undo_changed.connect(can_undo_changes.append)
+        command_stack.stack_changed.connect(lambda: stack_changes.append(True))
+
+        for i in range(3):
+            command_stack.push(
+                ModifyLayerCommand(mock_canvas, "id", "name", "a", str(i)),
+                execute=False,
+            )
+
+        assert can_undo_changes == [True]
+        assert len(stack_changes) == 3
+
 
 # ===================
 # AddLayerCommand Tests
@@ -294,6 +314,29 @@ class TestAddLayerCommand:
         cmd = AddLayerCommand(mock_canvas, text_layer)
         assert "添加图层" in cmd.description
 
+    def test_redo_restores_added_state(
+        self,
+        command_stack: CommandStack,
+        mock_canvas: MagicMock,
+        text_layer: TextLayer,
+    ) -> None:
+        """测试图层被拖动后撤销两次再重做，恢复添加时的位置."""
+        template = mock_canvas.template
+        text_layer.x, text_layer.y = 0, 0
+        command_stack.push(AddLayerCommand(mock_canvas, text_layer))
+
+        # 图形项拖拽会直接修改传入的图层对象
+        text_layer.x, text_layer.y = 150, 90
+        command_stack.push(MoveLayerCommand(mock_canvas, text_layer.id, 0, 0, 150, 90))
+
+        command_stack.undo()
+        command_stack.undo()
+        command_stack.redo()
+
+        layer = template.get_layer_by_id(text_layer.id)
+        assert (layer.x, layer.y) == (0, 0)
+        assert command_stack.can_redo
+
 
 # ===================
 # RemoveLayerCommand Tests
@@ -337,6 +380,27 @@ class TestRemoveLayerCommand:
         cmd = RemoveLayerCommand(mock_canvas, text_layer.id)
         assert "删除图层" in cmd.description
 
+    def test_undo_redo_cycles_restore_independent_layers(
+        self, mock_canvas: MagicMock, text_layer: TextLayer
+    ) -> None:
+        """测试多次撤销/重做时恢复的图层互不影响快照."""
+        template = mock_canvas.template
+        template.add_layer(text_layer)
+        cmd = RemoveLayerCommand(mock_canvas, text_layer.id)
+
+        cmd.execute()
+        cmd.undo()
+        # 模拟图形项修改恢复出的图层对象
+        mock_canvas._add_layer_item = lambda layer: setattr(layer, "content", "已修改")
+        cmd.execute()
+        cmd.undo()
+        cmd.execute()
+        mock_canvas._add_layer_item = lambda layer: None
+        cmd.undo()
+
+        assert template.get_layer_by_id(text_layer.id).content == "测试文字"
+        assert text_layer.name in cmd.description
+
 
 # ===================
 # ModifyLayerCommand Tests
@@ -404,6 +468,68 @@ class TestModifyLayerCommand:
         layer = template.get_layer_by_id(text_layer.id)
         assert layer.x == 100
 
+    def test_tracks_layer_index_after_reorder(
+        self, mock_canvas: MagicMock, text_layer: TextLayer, shape_layer: ShapeLayer
+    ) -> None:
+        """测试图层位置变化后仍能找到目标图层."""
+        template = mock_canvas.template
+        template.add_layer(text_layer)
+        template.add_layer(shape_layer)
+        cmd = ModifyLayerCommand(mock_canvas, shape_layer.id, "x", 200, 250)
+        cmd.execute()
+
+        template.remove_layer(text_layer.id)
+        cmd.undo()
+
+        assert template.get_layer_by_id(shape_layer.id).x == 200
+
+    def test_merge_consecutive_edits(
+        self,
+        command_stack: CommandStack,
+        mock_canvas: MagicMock,
+        text_layer: TextLayer,
+    ) -> None:
+        """测试连续修改同一属性时合并为一条命令."""
+        template = mock_canvas.template
+        template.add_layer(text_layer)
+
+        old_value = text_layer.content
+        for new_value in ("a", "ab", "abc"):
+            command_stack.push(
+                ModifyLayerCommand(
+                    mock_canvas, text_layer.id, "content", old_value, new_value
+                )
+            )
+            old_value = new_value
+
+        assert command_stack.undo_count == 1
+        command_stack.undo()
+        assert template.get_layer_by_id(text_layer.id).content == "测试文字"
+        command_stack.redo()
+        assert template.get_layer_by_id(text_layer.id).content == "abc"
+
+    def test_no_merge_after_interval(
+        self,
+        command_stack: CommandStack,
+        mock_canvas: MagicMock,
+        text_layer: TextLayer,
+    ) -> None:
+        """测试超过合并时间窗口后不再合并."""
+        mock_canvas.template.add_layer(text_layer)
+
+        with patch(
+            "src.ui.widgets.template_editor.undo_redo.time.monotonic",
+            side_effect=[10.0, 11.0],
+        ):
+            command_stack.push(
+                ModifyLayerCommand(mock_canvas, text_layer.id, "x", 100, 110)
+            )
+            command_stack.push(
+                ModifyLayerCommand(mock_canvas, text_layer.id, "x", 110, 120)
+            )
+
+        assert command_stack.undo_count == 2
+
 
 # ===================
 # MoveLayerCommand Tests
@@ -444,6 +570,26 @@ class TestMoveLayerCommand:
         assert layer.x == 100
         assert layer.y == 100
 
+    def test_merge_drag_sequence(
+        self,
+        command_stack: CommandStack,
+        mock_canvas: MagicMock,
+        text_layer: TextLayer,
+    ) -> None:
+        """测试连续拖拽合并为一条命令."""
+        template = mock_canvas.template
+        template.add_layer(text_layer)
+
+        for step in range(1, 4):
+            x = 100 + step * 10
+            command_stack.push(
+                MoveLayerCommand(mock_canvas, text_layer.id, x - 10, 100, x, 100)
+            )
+
+        assert command_stack.undo_count == 1
+        command_stack.undo()
+        assert template.get_layer_by_id(text_layer.id).x == 100
+
 
 # ===================
 # ResizeLayerCommand Tests
@@ -488,6 +634,36 @@ class TestResizeLayerCommand:
         assert layer.width == old_width
         assert layer.height == old_height
 
+    def test_merge_consecutive_resizes(
+        self,
+        command_stack: CommandStack,
+        mock_canvas: MagicMock,
+        text_layer: TextLayer,
+    ) -> None:
+        """测试连续调整大小合并，坐标记录方式不同时不合并."""
+        template = mock_canvas.template
+        template.add_layer(text_layer)
+        old_width = text_layer.width
+
+        command_stack.push(
+            ResizeLayerCommand(mock_canvas, text_layer.id, old_width, 100, 300, 100)
+        )
+        command_stack.push(
+            ResizeLayerCommand(mock_canvas, text_layer.id, 300, 100, 350, 120)
+        )
+        assert command_stack.undo_count == 1
+
+        command_stack.push(
+            ResizeLayerCommand(
+                mock_canvas, text_layer.id, 350, 120, 360, 120, 100, 100, 90, 100
+            )
+        )
+        assert command_stack.undo_count == 2
+
+        command_stack.undo()
+        command_stack.undo()
+        assert template.get_layer_by_id(text_layer.id).width == old_width
+
 
 # ===================
 # BatchCommand Tests
@@ -543,6 +719,64 @@ class TestBatchCommand:
         batch = BatchCommand([cmd1, cmd2], "添加多个图层")
         assert batch.description == "添加多个图层"
 
+    def test_wraps_canvas_batch(
+        self, mock_canvas: MagicMock, text_layer: TextLayer
+    ) -> None:
+        """测试执行/撤销时包裹画布批量更新."""
+        mock_canvas.template.add_layer(text_layer)
+        batch = BatchCommand(
+            [
+                MoveLayerCommand(mock_canvas, text_layer.id, 100, 100, 110, 110),
+                MoveLayerCommand(mock_canvas, text_layer.id, 110, 110, 120, 120),
+            ]
+        )
+
+        batch.execute()
+        batch.undo()
+
+        assert mock_canvas.begin_batch.call_count == 2
+        assert mock_canvas.end_batch.call_count == 2
+
+    def test_single_command_is_unwrapped(
+        self, mock_canvas: MagicMock, text_layer: TextLayer
+    ) -> None:
+        """测试只有一个命令且描述相同时直接返回该命令."""
+        cmd = AddLayerCommand(mock_canvas, text_layer)
+        assert BatchCommand([cmd], cmd.description) is cmd
+
+    def test_single_command_keeps_batch_description(
+        self, mock_canvas: MagicMock, text_layer: TextLayer
+    ) -> None:
+        """测试只有一个命令但描述不同时保留批量描述."""
+        cmd = AddLayerCommand(mock_canvas, text_layer)
+        batch = BatchCommand([cmd], "单个")
+
+        assert isinstance(batch, BatchCommand)
+        assert batch.description == "单个"
+
+    def test_empty_batch_is_not_pushed(self, command_stack: CommandStack) -> None:
+        """测试空批量命令不入栈."""
+        command_stack.push(BatchCommand([], "空"))
+        assert not command_stack.can_undo
+
+    def test_nested_batch_is_kept(
+        self,
+        mock_canvas: MagicMock,
+        text_layer: TextLayer,
+        shape_layer: ShapeLayer,
+    ) -> None:
+        """测试只包含一个批量命令时仍正常包装."""
+        inner = BatchCommand(
+            [
+                AddLayerCommand(mock_canvas, text_layer),
+                AddLayerCommand(mock_canvas, shape_layer),
+            ]
+        )
+        outer = BatchCommand([inner], "外层")
+        assert outer is not inner
+        outer.execute()
+        assert len(mock_canvas.template.get_layers()) == 2
+
 
 # ===================
 # ModifyCanvasCommand Tests
@@ -586,6 +820,21 @@ class TestModifyCanvasCommand:
 
         assert template.background_color == (200, 200, 200)
 
+    def test_execute_height_updates_scene(self, mock_canvas: MagicMock) -> None:
+        """测试修改画布高度时同步场景尺寸."""
+        cmd = ModifyCanvasCommand(mock_canvas, "canvas_height", 600, 900)
+        cmd.execute()
+
+        mock_canvas._scene.set_canvas_size.assert_called_with(800, 900)
+
+    def test_unknown_property_is_ignored(self, mock_canvas: MagicMock) -> None:
+        """测试未知属性不做任何修改."""
+        cmd = ModifyCanvasCommand(mock_canvas, "unknown", 1, 2)
+        cmd.execute()
+
+        mock_canvas._scene.set_canvas_size.assert_not_called()
+        mock_canvas._scene.set_background_color.assert_not_called()
+
 
 # ===================
 # UndoRedoManager Tests
@@ -637,6 +886,23 @@ class TestUndoRedoManager:
         assert not manager.can_undo
         assert not manager.can_redo
 
+    def test_coalesces_state_changed(
+        self, app, mock_canvas: MagicMock, text_layer: TextLayer
+    ) -> None:
+        """测试同一轮事件循环内的多次变化只发出一次 state_changed."""
+        manager = UndoRedoManager(mock_canvas)
+        mock_canvas.template.add_layer(text_layer)
+        emitted = []
+        manager.state_changed.connect(lambda: emitted.append(1))
+
+        manager.record_move_layer(text_layer.id, 100, 100, 110, 110)
+        manager.record_move_layer(text_layer.id, 110, 110, 120, 120)
+        manager.undo()
+        assert emitted == []
+
+        app.processEvents()
+        assert emitted == [1]
+
 
 # ===================
 # Integration Tests
@@ -728,3 +994,30 @@ class TestUndoRedoIntegration:
         # 一次重做恢复所有
         stack.redo()
         assert len(template.get_layers()) == 3
+
+
+# ===================
+# 内存布局测试
+# ===================
+
+
+class TestCommandSlots:
+    """命令内存布局测试."""
+
+    def test_commands_have_no_instance_dict(
+        self, mock_canvas: MagicMock, text_layer: TextLayer
+    ) -> None:
+        """测试所有命令都使用 __slots__，不创建实例字典."""
+        mock_canvas.template.add_layer(text_layer)
+        move = MoveLayerCommand(mock_canvas, text_layer.id, 0, 0, 1, 1)
+        commands = [
+            AddLayerCommand(mock_canvas, text_layer),
+            RemoveLayerCommand(mock_canvas, text_layer.id),
+            ModifyLayerCommand(mock_canvas, text_layer.id, "x", 0, 1),
+            move,
+            ResizeLayerCommand(mock_canvas, text_layer.id, 0, 0, 10, 10, 0, 0, 20, 20),
+            BatchCommand([move, move], "批量"),
+            ModifyCanvasCommand(mock_canvas, "canvas_width", 800, 1000),
+        ]
+        for cmd in commands:
+            assert not hasattr(cmd, "__dict__"), type(cmd).__name__
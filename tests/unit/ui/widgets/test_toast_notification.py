@@ -0,0 +1,147 @@
+"""Toast 通知组件单元测试."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.ui.widgets.toast_notification import (
+    FADE_DURATION,
+    ToastManager,
+    ToastNotification,
+    ToastType,
+)
+
+
+@pytest.fixture
+def manager(qtbot) -> ToastManager:
+    """创建通知管理器."""
+    m = ToastManager()
+    qtbot.addWidget(m)
+    return m
+
+
+def _close_now(toast: ToastNotification) -> None:
+    """跳过淡出动画直接关闭通知."""
+    toast._on_fade_finished()
+
+
+class TestToastNotification:
+    """ToastNotification 组件测试."""
+
+    def test_reconfigure(self, qtbot) -> None:
+        """测试复用时重新配置内容."""
+        toast = ToastNotification("标题", "内容", ToastType.ERROR)
+        qtbot.addWidget(toast)
+
+        toast.reconfigure("新标题", "", ToastType.SUCCESS, duration=0, closable=False)
+
+        assert toast._title_label.text() == "新标题"
+        assert toast._message_label.isHidden()
+        assert toast._close_btn.isHidden()
+        assert toast._icon_label.text() == "✓"
+        assert toast._fading is False
+
+    def test_uses_precomputed_stylesheet(self, qtbot) -> None:
+        """测试使用预先生成的样式表."""
+        toast = ToastNotification("标题", "", ToastType.WARNING)
+        qtbot.addWidget(toast)
+
+        assert "#fffbe6" in toast.styleSheet()
+        assert "#faad14" in toast._icon_label.styleSheet()
+
+
+class TestToastManager:
+    """ToastManager 组件测试."""
+
+    def test_reuses_closed_toast(self, manager) -> None:
+        """测试关闭的通知会被回收复用."""
+        first = manager.show_info("第一条")
+        _close_now(first)
+
+        assert manager._pool == [first]
+
+        second = manager.show_error("第二条", "错误")
+        assert second is first
+        assert manager._pool == []
+        assert second._title_label.text() == "第二条"
+        assert second._toast_type == ToastType.ERROR
+
+    def test_pending_promoted_on_close(self, manager) -> None:
+        """测试超出上限的通知只排队参数，关闭后才创建组件补位."""
+        toasts = [manager.show_info(f"通知{i}") for i in range(manager.MAX_VISIBLE)]
+        queued = manager.show_warning("排队通知")
+
+        assert queued is None
+        assert len(manager._notifications) == manager.MAX_VISIBLE
+        assert manager._pending[0].title == "排队通知"
+
+        _close_now(toasts[0])
+
+        assert len(manager._notifications) == manager.MAX_VISIBLE
+        assert manager._pending == []
+        promoted = list(manager._notifications.values())[-1]
+        assert promoted._title_label.text() == "排队通知"
+        assert promoted._toast_type == ToastType.WARNING
+
+    def test_total_height_tracks_visible_toasts(self, manager) -> None:
+        """测试可见通知高度总和随增删更新."""
+        first = manager.show_info("第一条")
+        second = manager.show_info("第二条", "内容")
+
+        assert manager._total_height == first._cached_height + second._cached_height
+
+        _close_now(first)
+        assert manager._total_height == second._cached_height
+
+        _close_now(second)
+        assert manager._total_height == 0
+
+    def test_shared_fade_driver(self, manager) -> None:
+        """测试多个通知共用一个淡出动画."""
+        first = manager.show_info("第一条")
+        second = manager.show_info("第二条")
+
+        first._start_fade_out()
+        second._start_fade_out()
+
+        assert set(manager._fading) == {id(first), id(second)}
+        assert first._fade_animation is None
+        assert second._fade_animation is None
+
+        # 模拟动画时间已过
+        first._fade_started_at -= FADE_DURATION
+        second._fade_started_at -= FADE_DURATION
+        manager._on_fade_tick()
+
+        assert manager._fading == {}
+        assert manager._notifications == {}
+        assert manager._fade_driver.state() != manager._fade_driver.State.Running
+
+    def test_duplicate_toasts_are_merged(self, manager) -> None:
+        """测试相同通知合并为一个并显示次数."""
+        first = manager.show_error("保存失败", "磁盘已满")
+        second = manager.show_error("保存失败", "磁盘已满")
+        third = manager.show_error("保存失败", "磁盘已满")
+
+        assert first is second is third
+        assert len(manager._notifications) == 1
+        assert first._title_label.text() == "保存失败 (×3)"
+
+        _close_now(first)
+        assert manager._active_keys == {}
+
+        fresh = manager.show_error("保存失败", "磁盘已满")
+        assert fresh._title_label.text() == "保存失败"
+
+    def test_opacity_effect_only_while_fading(self, manager) -> None:
+        """测试透明度效果只在淡出期间安装."""
+        toast = manager.show_info("通知")
+        assert toast.graphicsEffect() is None
+
+        toast._start_fade_out()
+        manager._on_fade_tick()
+        assert toast.graphicsEffect() is not None
+
+        toast._fade_started_at -= FADE_DURATION
+        manager._on_fade_tick()
+        assert toast.graphicsEffect() is None
@@ -0,0 +1,190 @@
+"""ToolbarQueueProgress 组件单元测试."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.ui.widgets.toolbar_queue_progress import ToolbarQueueProgress, _format_seconds
+
+
+@pytest.fixture
+def progress(qtbot) -> ToolbarQueueProgress:
+    """创建工具栏进度组件."""
+    widget = ToolbarQueueProgress()
+    qtbot.addWidget(widget)
+    return widget
+
+
+class TestToolbarQueueProgress:
+    """ToolbarQueueProgress 组件测试."""
+
+    def test_init_default(self, progress) -> None:
+        """测试默认初始化."""
+        assert progress._status_label.text() == "就绪"
+        assert progress._stats_label.text() == "0/0"
+        assert progress._progress_bar.value() == 0
+
+    def test_completions_are_throttled(self, qtbot, progress) -> None:
+        """测试连续完成只在节流刷新时更新显示."""
+        progress.set_total_tasks(10)
+        progress.set_processing_state(True)
+        for _ in range(5):
+            progress.update_task_completed()
+
+        assert progress._stats_label.text() == "0/10"
+
+        qtbot.waitUntil(lambda: progress._stats_label.text() == "5/10", timeout=1000)
+        assert progress._progress_bar.value() == 50
+
+    def test_state_change_renders_immediately(self, progress) -> None:
+        """测试状态切换立即刷新."""
+        progress.set_total_tasks(3)
+        progress.set_processing_state(True)
+        assert progress._status_label.text() == "处理中"
+
+        progress.set_processing_state(True, is_paused=True)
+        assert progress._status_label.text() == "已暂停"
+
+    def test_failed_label(self, progress) -> None:
+        """测试失败数显示."""
+        progress.set_total_tasks(2)
+        progress.update_task_completed(success=False)
+        progress._flush_display()
+
+        assert not progress._failed_label.isHidden()
+        assert progress._failed_label.text() == "失败: 1"
+        assert progress._status_label.text() == "等待"
+
+    def test_reset(self, progress) -> None:
+        """测试重置."""
+        progress.set_total_tasks(2)
+        progress.increment_completed()
+        progress.update_task_completed(success=False)
+        progress._flush_display()
+        progress.reset()
+
+        assert progress._stats_label.text() == "0/0"
+        assert progress._status_label.text() == "就绪"
+        assert progress._failed_label.isHidden()
+
+    def test_unchanged_values_skip_setters(self, progress, monkeypatch) -> None:
+        """测试未变化的值不重复写入控件."""
+        progress.set_total_tasks(4)
+        progress._flush_display()
+
+        calls = []
+        monkeypatch.setattr(progress._stats_label, "setText", calls.append)
+        progress._render()
+        assert calls == []
+
+        progress.increment_completed()
+        progress._flush_display()
+        assert calls == ["1/4"]
+
+    def test_elapsed_excludes_pause(self, progress, monkeypatch) -> None:
+        """测试用时按单调时钟计算且不含暂停时间."""
+        now = [100.0]
+        monkeypatch.setattr(
+            "src.ui.widgets.toolbar_queue_progress.time.monotonic", lambda: now[0]
+        )
+        progress.set_total_tasks(2)
+        progress.set_processing_state(True)
+        now[0] += 5
+        progress.set_processing_state(True, is_paused=True)
+        now[0] += 60
+        assert progress.elapsed_seconds == 5
+
+        progress.set_processing_state(True)
+        now[0] += 3
+        progress.set_processing_state(False)
+        now[0] += 10
+
+        assert progress.elapsed_seconds == 8
+        assert progress._time_label.text() == "总计 8秒"
+
+    def test_worker_thread_increments(self, progress) -> None:
+        """测试工作线程中计数不操作控件，刷新时采样."""
+        progress.set_total_tasks(400)
+        progress._flush_display()
+        workers = [
+            threading.Thread(
+                target=lambda: [progress.increment_completed() for _ in range(100)]
+            )
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert not progress._render_timer.isActive()
+        progress._flush_display()
+        assert progress._stats_label.text() == "400/400"
+
+    def test_worker_updates_shown_while_paused(self, qtbot, progress) -> None:
+        """测试暂停期间工作线程的完成更新也会显示."""
+        progress.set_total_tasks(4)
+        progress.set_processing_state(True)
+        progress.set_processing_state(True, is_paused=True)
+        assert progress._tick._find(progress._on_tick) < 0
+
+        worker = threading.Thread(
+            target=lambda: [progress.increment_completed() for _ in range(2)]
+        )
+        worker.start()
+        worker.join()
+
+        qtbot.waitUntil(lambda: progress._stats_label.text() == "2/4", timeout=1000)
+        assert progress._render_queued is False
+
+    def test_clock_uses_shared_tick(self, qtbot, progress) -> None:
+        """测试处理中注册共享定时器，停止后取消注册."""
+        other = ToolbarQueueProgress()
+        qtbot.addWidget(other)
+        progress.set_processing_state(True)
+        other.set_processing_state(True)
+
+        tick = progress._tick
+        assert tick is other._tick
+        assert tick.is_active
+        assert tick._find(progress._on_tick) >= 0
+
+        progress.set_processing_state(False)
+        assert tick._find(progress._on_tick) < 0
+        other.reset()
+        assert not tick.is_active
+
+    def test_status_label_has_fixed_width(self, progress) -> None:
+        """测试状态标签按最长状态文字固定宽度."""
+        label = progress._status_label
+        width = label.width()
+        assert label.minimumWidth() == label.maximumWidth()
+        assert label.fontMetrics().horizontalAdvance("已暂停") <= width
+
+        progress.set_total_tasks(1)
+        progress.set_processing_state(True, is_paused=True)
+        assert label.width() == width
+
+    def test_render_skips_when_state_unchanged(self, progress, monkeypatch) -> None:
+        """测试显示状态未变化时直接返回."""
+        progress.set_total_tasks(3)
+        progress._flush_display()
+
+        calls = []
+        monkeypatch.setattr(progress, "setUpdatesEnabled", calls.append)
+        progress._render()
+        assert calls == []
+
+
+class TestFormatSeconds:
+    """时间格式化测试."""
+
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [(0, "0秒"), (59, "59秒"), (61, "1:01"), (3725, "1:02:05")],
+    )
+    def test_format(self, seconds: int, expected: str) -> None:
+        """测试各区间的格式."""
+        assert _format_seconds(seconds) == expected
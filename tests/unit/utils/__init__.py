@@ -0,0 +1 @@
+"""工具模块单元测试."""
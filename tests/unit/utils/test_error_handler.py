@@ -0,0 +1,127 @@
+"""错误处理工具单元测试."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from src.utils.error_handler import ErrorCollector, safe_call, safe_execute_async
+from src.utils.exceptions import AppException
+
+
+class TestErrorCollector:
+    """错误收集器测试."""
+
+    def test_collect_and_summary(self) -> None:
+        """测试收集错误并生成摘要."""
+        collector = ErrorCollector()
+        collector.add(ValueError("坏值"), context="任务1")
+        collector.add(KeyError("k"))
+
+        assert collector.has_errors
+        assert collector.error_count == 2
+        assert collector.summary == (
+            "共 2 个错误:\n  1. ValueError (任务1): 坏值\n  2. KeyError: 'k'"
+        )
+
+    def test_empty_summary(self) -> None:
+        """测试无错误时的摘要."""
+        collector = ErrorCollector()
+        assert not collector.has_errors
+        assert collector.summary == "无错误"
+        collector.raise_if_errors()
+
+    def test_caps_stored_errors(self) -> None:
+        """测试超出上限的错误只计数不保存."""
+        collector = ErrorCollector(max_errors=2)
+        for i in range(5):
+            collector.add(ValueError(str(i)))
+
+        assert collector.error_count == 5
+        assert [str(exc) for exc, _ in collector.errors] == ["0", "1"]
+        assert collector.summary.endswith("另有 3 个错误未记录详情")
+
+    def test_logs_once_in_aggregate(self, caplog) -> None:
+        """测试添加时不逐条记录警告，摘要时汇总记录一次."""
+        collector = ErrorCollector()
+        with caplog.at_level(logging.WARNING, logger="src.utils.error_handler"):
+            for i in range(3):
+                collector.add(ValueError(str(i)))
+            assert caplog.records == []
+
+            assert collector.summary == collector.summary
+
+        assert len(caplog.records) == 1
+        assert "收集到 3 个错误" in caplog.records[0].getMessage()
+
+    def test_iterate_without_copy(self) -> None:
+        """测试直接遍历收集器，errors 返回只读元组."""
+        collector = ErrorCollector(max_errors=2)
+        for i in range(3):
+            collector.add(ValueError(str(i)), context=f"任务{i}")
+
+        assert len(collector) == 2
+        assert [ctx for _, ctx in collector] == ["任务0", "任务1"]
+        assert isinstance(collector.errors, tuple)
+        assert collector.errors == tuple(collector)
+
+    def test_raise_if_errors(self) -> None:
+        """测试有错误时抛出异常."""
+        collector = ErrorCollector()
+        collector.add(ValueError("坏值"))
+
+        with pytest.raises(AppException, match="坏值"):
+            collector.raise_if_errors()
+
+    def test_clear(self) -> None:
+        """测试清除错误."""
+        collector = ErrorCollector(max_errors=1)
+        collector.add(ValueError("a"))
+        collector.add(ValueError("b"))
+        collector.clear()
+
+        assert collector.error_count == 0
+        assert not collector.has_errors
+
+
+def _fail() -> None:
+    """总是失败的函数."""
+    raise ValueError("失败")
+
+
+class TestSafeCall:
+    """安全调用测试."""
+
+    def test_returns_result(self) -> None:
+        """测试正常返回结果."""
+        assert safe_call(max, 1, 2) == 2
+        assert safe_call(dict, a=1) == {"a": 1}
+
+    def test_returns_none_on_error(self) -> None:
+        """测试失败时返回 None."""
+        assert safe_call(_fail) is None
+
+
+class TestSafeExecuteAsync:
+    """异步安全执行测试."""
+
+    async def test_awaits_coroutine(self) -> None:
+        """测试等待协程函数结果."""
+
+        async def compute(x: int) -> int:
+            return x * 2
+
+        assert await safe_execute_async(compute, 3) == 6
+
+    async def test_plain_function(self) -> None:
+        """测试普通函数直接返回结果."""
+        assert await safe_execute_async(max, 1, 2) == 2
+
+    async def test_default_on_error(self) -> None:
+        """测试失败时返回默认值并回调."""
+        errors = []
+        result = await safe_execute_async(_fail, default=0, on_error=errors.append)
+
+        assert result == 0
+        assert isinstance(errors[0], ValueError)
@@ -0,0 +1,152 @@
+"""错误消息模块单元测试."""
+
+from __future__ import annotations
+
+import errno
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.utils import error_messages
+from src.utils.error_handler import get_user_friendly_message
+from src.utils.error_messages import get_user_friendly_error
+from src.utils.exceptions import (
+    AIServiceError,
+    APIKeyNotFoundError,
+    APIRequestError,
+    APITimeoutError,
+    DatabaseConnectionError,
+    ImageNotFoundError,
+    ImageProcessError,
+    InvalidConfigValueError,
+)
+
+
+class _CustomImageError(ImageNotFoundError):
+    """未登记的图片异常子类."""
+
+
+class TestGetUserFriendlyError:
+    """异常到错误信息的分派测试."""
+
+    @pytest.mark.parametrize(
+        ("exception", "expected"),
+        [
+            (APIKeyNotFoundError(), "API_KEY_NOT_FOUND"),
+            (APITimeoutError(30), "API_TIMEOUT"),
+            (AIServiceError("服务异常"), "API_REQUEST_ERROR"),
+            (ImageProcessError("处理失败"), "IMAGE_PROCESS_FAILED"),
+            (InvalidConfigValueError("key", "value"), "INVALID_CONFIG"),
+            (DatabaseConnectionError("连接失败"), "DATABASE_CONNECTION_ERROR"),
+        ],
+    )
+    def test_most_specific_type_wins(self, exception, expected) -> None:
+        """测试子类优先于父类匹配."""
+        assert get_user_friendly_error(exception).error_code == expected
+
+    def test_unregistered_subclass_uses_parent(self) -> None:
+        """测试未登记的子类沿 MRO 匹配父类."""
+        error = get_user_friendly_error(_CustomImageError("a.png"))
+        assert error.error_code == "IMAGE_NOT_FOUND"
+
+    @pytest.mark.parametrize(
+        ("status_code", "expected"),
+        [(429, "API_RATE_LIMIT"), (402, "API_QUOTA_EXCEEDED"), (500, "API_REQUEST_ERROR")],
+    )
+    def test_api_status_codes(self, status_code: int, expected: str) -> None:
+        """测试特定 HTTP 状态码."""
+        error = get_user_friendly_error(APIRequestError("失败", status_code))
+        assert error.error_code == expected
+
+    def test_connection_error_is_network_error(self) -> None:
+        """测试 ConnectionError 归类为网络错误（不被 OSError 分支吞掉）."""
+        error = get_user_friendly_error(ConnectionResetError())
+        assert error.error_code == "NETWORK_ERROR"
+
+    @pytest.mark.parametrize(
+        ("exception", "expected"),
+        [
+            (OSError(errno.ENOSPC, "设备上没有空间"), "DISK_FULL"),
+            (PermissionError(errno.EACCES, "拒绝访问"), "PERMISSION_DENIED"),
+            (OSError(errno.EPERM, "不允许的操作"), "PERMISSION_DENIED"),
+            (FileNotFoundError(errno.ENOENT, "找不到文件"), "UNKNOWN_ERROR"),
+            (OSError("没有错误码"), "UNKNOWN_ERROR"),
+        ],
+    )
+    def test_os_errors_by_errno(self, exception: OSError, expected: str) -> None:
+        """测试系统错误按 errno 分类（与错误消息语言无关）."""
+        assert get_user_friendly_error(exception).error_code == expected
+
+    def test_unknown_type(self) -> None:
+        """测试未知异常类型."""
+        error = get_user_friendly_error(ValueError("bad"))
+        assert error.error_code == "UNKNOWN_ERROR"
+
+    def test_resolution_is_cached_per_type(self) -> None:
+        """测试按异常类型缓存解析结果."""
+        error_messages._resolved_cache.pop(_CustomImageError, None)
+
+        get_user_friendly_error(_CustomImageError("a.png"))
+
+        assert (
+            error_messages._resolved_cache[_CustomImageError]
+            is error_messages.ERROR_MESSAGES["IMAGE_NOT_FOUND"]
+        )
+
+    def test_include_details(self) -> None:
+        """测试包含详细信息时返回新实例，不修改共享实例."""
+        shared = error_messages.ERROR_MESSAGES["UNKNOWN_ERROR"]
+        error = get_user_friendly_error(ValueError("bad"), include_details=True)
+
+        assert error.details == "bad"
+        assert error is not shared
+        assert shared.details is None
+
+    def test_returns_shared_instance_without_details(self) -> None:
+        """测试不含详细信息时直接返回共享实例."""
+        error = get_user_friendly_error(ValueError("bad"))
+        assert error is error_messages.ERROR_MESSAGES["UNKNOWN_ERROR"]
+
+    def test_error_is_frozen(self) -> None:
+        """测试错误信息不可修改."""
+        error = get_user_friendly_error(ValueError("bad"))
+        with pytest.raises(FrozenInstanceError):
+            error.title = "修改"
+
+
+class TestGetUserFriendlyMessage:
+    """error_handler 消息查找测试."""
+
+    def test_subclass_precedence(self) -> None:
+        """测试子类消息优先于父类."""
+        assert get_user_friendly_message(APITimeoutError(30)).startswith("网络请求超时")
+        assert get_user_friendly_message(AIServiceError("x")) == "AI 服务异常，请稍后重试"
+
+    def test_unregistered_subclass_uses_parent(self) -> None:
+        """测试未登记的子类使用父类消息."""
+        message = get_user_friendly_message(_CustomImageError("a.png"))
+        assert message == "图片处理失败，请检查图片文件"
+
+    def test_unknown_type(self) -> None:
+        """测试未知异常."""
+        assert get_user_friendly_message(ValueError("bad")) == "操作失败，请稍后重试"
+
+
+class TestUserFriendlyErrorToDict:
+    """错误信息字典转换测试."""
+
+    def test_shared_instance_uses_precomputed_dict(self) -> None:
+        """测试共享实例返回预生成字典的副本."""
+        error = error_messages.ERROR_MESSAGES["DISK_FULL"]
+        data = error.to_dict()
+
+        assert data == error._build_dict()
+        assert data["severity"] == "critical"
+
+        data["title"] = "修改"
+        assert error.to_dict()["title"] == "磁盘空间不足"
+
+    def test_instance_with_details(self) -> None:
+        """测试带详细信息的实例按字段构建."""
+        error = get_user_friendly_error(ValueError("bad"), include_details=True)
+        assert error.to_dict()["details"] == "bad"
@@ -0,0 +1,276 @@
+"""文件工具函数单元测试."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from src.utils.constants import SUPPORTED_IMAGE_FORMATS
+from src.utils.file_utils import (
+    cleanup_temp_files,
+    copy_file,
+    get_file_extension,
+    is_image_file,
+    list_image_files,
+    safe_delete,
+)
+
+
+class TestGetFileExtension:
+    """扩展名获取测试."""
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "a.PNG",
+            "dir.d/file",
+            "dir/archive.tar.GZ",
+            ".bashrc",
+            "a.",
+            "..png",
+            "noext",
+            "photo.jpg/",
+            "",
+        ],
+    )
+    def test_matches_path_suffix(self, name: str) -> None:
+        """测试与 Path.suffix 的结果一致."""
+        assert get_file_extension(name) == Path(name).suffix.lower()
+        assert get_file_extension(Path(name)) == Path(name).suffix.lower()
+
+    def test_repeated_lookup_is_cached(self) -> None:
+        """测试同一路径（str 或 Path）重复查询命中缓存."""
+        from src.utils.file_utils import _extension_of
+
+        _extension_of.cache_clear()
+        get_file_extension("cached_photo.JPG")
+        get_file_extension(Path("cached_photo.JPG"))
+
+        info = _extension_of.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestIsImageFile:
+    """图片文件判断测试."""
+
+    @pytest.mark.parametrize("name", ["a.png", "B.JPG", "c.Jpeg", "d.webp"])
+    def test_supported_case_insensitive(self, name: str) -> None:
+        """测试扩展名不区分大小写."""
+        assert is_image_file(Path(name))
+        assert is_image_file(name)
+
+    @pytest.mark.parametrize("name", ["a.txt", "b", "c.png.bak"])
+    def test_unsupported(self, name: str) -> None:
+        """测试不支持的文件."""
+        assert not is_image_file(name)
+
+    def test_formats_are_immutable(self) -> None:
+        """测试支持格式集合不可修改."""
+        assert isinstance(SUPPORTED_IMAGE_FORMATS, frozenset)
+        assert all(ext == ext.lower() for ext in SUPPORTED_IMAGE_FORMATS)
+
+
+class TestListImageFiles:
+    """列出图片文件测试."""
+
+    @pytest.fixture
+    def tree(self, tmp_path: Path) -> Path:
+        """创建测试目录结构."""
+        (tmp_path / "a.png").write_bytes(b"")
+        (tmp_path / "B.JPG").write_bytes(b"")
+        (tmp_path / "notes.txt").write_bytes(b"")
+        (tmp_path / ".png").write_bytes(b"")
+        (tmp_path / "dir.png").mkdir()
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "c.webp").write_bytes(b"")
+        return tmp_path
+
+    def test_flat(self, tree: Path) -> None:
+        """测试只列出当前目录的图片文件."""
+        assert list_image_files(tree) == [tree / "B.JPG", tree / "a.png"]
+
+    def test_recursive(self, tree: Path) -> None:
+        """测试递归列出子目录中的图片文件."""
+        assert list_image_files(tree, recursive=True) == [
+            tree / "B.JPG",
+            tree / "a.png",
+            tree / "sub" / "c.webp",
+        ]
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        """测试目录不存在时返回空列表."""
+        assert list_image_files(tmp_path / "missing") == []
+
+    def test_unreadable_subdirectory_is_skipped(self, tree: Path, monkeypatch) -> None:
+        """测试无法读取的子目录被跳过，不影响其他结果."""
+        locked = tree / "locked"
+        locked.mkdir()
+        (locked / "hidden.png").write_bytes(b"")
+        original_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == str(locked):
+                raise PermissionError(13, "Permission denied", str(path))
+            return original_scandir(path)
+
+        monkeypatch.setattr("src.utils.file_utils.os.scandir", scandir)
+
+        assert list_image_files(tree, recursive=True) == [
+            tree / "B.JPG",
+            tree / "a.png",
+            tree / "sub" / "c.webp",
+        ]
+
+    @pytest.mark.skipif(os.name == "nt", reason="需要符号链接支持")
+    def test_symlinks_match_glob(self, tree: Path, tmp_path_factory) -> None:
+        """测试与 Path.glob("**/*") 一致：列出符号链接文件，不进入符号链接目录."""
+        outside = tmp_path_factory.mktemp("outside")
+        (outside / "far.png").write_bytes(b"")
+        (tree / "linked_dir").symlink_to(outside, target_is_directory=True)
+        (tree / "linked.png").symlink_to(tree / "a.png")
+
+        expected = sorted(p for p in tree.glob("**/*") if p.is_file() and is_image_file(p))
+
+        assert list_image_files(tree, recursive=True) == expected
+        assert tree / "linked.png" in expected
+        assert tree / "linked_dir" / "far.png" not in expected
+
+
+class TestCleanupTempFiles:
+    """过期临时文件清理测试."""
+
+    def test_removes_only_expired_entries(self, tmp_path: Path, monkeypatch) -> None:
+        """测试只删除过期的文件和目录."""
+        monkeypatch.setattr("src.utils.file_utils.TEMP_DIR", tmp_path)
+        old = time.time() - 48 * 3600
+
+        expired_file = tmp_path / "old.png"
+        expired_file.write_bytes(b"x")
+        expired_dir = tmp_path / "old_dir"
+        expired_dir.mkdir()
+        (expired_dir / "inner.png").write_bytes(b"x")
+        fresh_file = tmp_path / "new.png"
+        fresh_file.write_bytes(b"x")
+        for path in (expired_file, expired_dir):
+            os.utime(path, (old, old))
+
+        assert cleanup_temp_files(max_age_hours=24) == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["new.png"]
+
+    def test_missing_temp_dir(self, tmp_path: Path, monkeypatch) -> None:
+        """测试临时目录不存在时返回 0."""
+        monkeypatch.setattr("src.utils.file_utils.TEMP_DIR", tmp_path / "missing")
+        assert cleanup_temp_files() == 0
+
+
+class TestSafeDelete:
+    """安全删除测试."""
+
+    def test_deletes_file_and_directory(self, tmp_path: Path) -> None:
+        """测试删除文件和非空目录."""
+        file_path = tmp_path / "a.txt"
+        file_path.write_text("x")
+        dir_path = tmp_path / "dir"
+        dir_path.mkdir()
+        (dir_path / "inner.txt").write_text("x")
+
+        assert safe_delete(file_path) is True
+        assert safe_delete(dir_path) is True
+        assert list(tmp_path.iterdir()) == []
+
+    def test_missing_path(self, tmp_path: Path) -> None:
+        """测试路径不存在视为成功."""
+        assert safe_delete(tmp_path / "missing") is True
+
+    @pytest.mark.skipif(not hasattr(os, "symlink") or os.name == "nt", reason="需要符号链接支持")
+    def test_symlink_to_directory_removes_link_only(self, tmp_path: Path) -> None:
+        """测试指向目录的符号链接只删除链接本身."""
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "keep.txt").write_text("x")
+        link = tmp_path / "link"
+        link.symlink_to(target, target_is_directory=True)
+
+        assert safe_delete(link) is True
+        assert not link.exists()
+        assert (target / "keep.txt").exists()
+
+
+class TestCopyFile:
+    """文件复制测试."""
+
+    @pytest.fixture
+    def source(self, tmp_path: Path) -> Path:
+        path = tmp_path / "src.bin"
+        path.write_bytes(bytes(range(256)) * 1000)
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+        return path
+
+    def test_copies_content_and_metadata(self, source: Path, tmp_path: Path) -> None:
+        """测试复制内容并保留修改时间，目标目录自动创建."""
+        dst = copy_file(source, tmp_path / "out" / "dst.bin")
+
+        assert dst.read_bytes() == source.read_bytes()
+        assert dst.stat().st_mtime == pytest.approx(source.stat().st_mtime, abs=1)
+
+    def test_overwrites_longer_target(self, source: Path, tmp_path: Path) -> None:
+        """测试覆盖已存在且更长的目标文件."""
+        dst = tmp_path / "dst.bin"
+        dst.write_bytes(b"x" * 500_000)
+
+        copy_file(source, dst)
+
+        assert dst.read_bytes() == source.read_bytes()
+
+    def test_same_file_is_not_truncated(self, source: Path) -> None:
+        """测试复制到自身时报错且不破坏源文件."""
+        data = source.read_bytes()
+
+        with pytest.raises(shutil.SameFileError):
+            copy_file(source, source)
+        assert source.read_bytes() == data
+
+    def test_falls_back_when_unsupported(self, source: Path, tmp_path: Path, monkeypatch) -> None:
+        """测试内核复制不可用时回退到 shutil.copy2."""
+
+        def unsupported(*args):
+            raise OSError("not supported")
+
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+
+        dst = copy_file(source, tmp_path / "dst.bin")
+
+        assert dst.read_bytes() == source.read_bytes()
+
+    @pytest.mark.skipif(not hasattr(os, "pread"), reason="需要 os.pread")
+    def test_falls_back_on_short_copy(self, source: Path, tmp_path: Path, monkeypatch) -> None:
+        """测试内核复制提前返回 0 时回退并得到完整副本."""
+        calls = []
+
+        def short_copy(src_fd, dst_fd, count, *args):
+            calls.append(count)
+            if len(calls) == 1:
+                return os.write(dst_fd, os.pread(src_fd, 100, 0))
+            return 0
+
+        monkeypatch.setattr(os, "copy_file_range", short_copy, raising=False)
+
+        dst = copy_file(source, tmp_path / "dst.bin")
+
+        assert len(calls) == 2
+        assert dst.read_bytes() == source.read_bytes()
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """测试空文件（st_size 为 0）走普通复制."""
+        src = tmp_path / "empty.bin"
+        src.write_bytes(b"")
+
+        dst = copy_file(src, tmp_path / "out.bin")
+
+        assert dst.read_bytes() == b""
@@ -0,0 +1,163 @@
+"""辅助函数单元测试."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from src.utils import helpers
+from src.utils.helpers import (
+    HASH_CHUNK_SIZE,
+    calculate_file_hash,
+    calculate_file_hashes,
+    hex_to_rgb,
+    merge_dicts,
+    rgb_to_hex,
+    safe_filename,
+)
+
+
+class TestCalculateFileHash:
+    """文件哈希测试."""
+
+    @pytest.fixture
+    def data_file(self, tmp_path: Path) -> tuple[Path, bytes]:
+        """创建跨越多个读取块的测试文件."""
+        data = bytes(range(256)) * (HASH_CHUNK_SIZE // 256 * 2 + 3)
+        path = tmp_path / "data.bin"
+        path.write_bytes(data)
+        return path, data
+
+    @pytest.mark.parametrize("algorithm", ["md5", "sha256"])
+    def test_matches_hashlib(self, data_file, algorithm: str) -> None:
+        """测试结果与 hashlib 一致."""
+        path, data = data_file
+        expected = hashlib.new(algorithm, data).hexdigest()
+        assert calculate_file_hash(path, algorithm) == expected
+
+    def test_large_file_uses_mmap(self, data_file, monkeypatch) -> None:
+        """测试超过阈值的文件走内存映射路径且结果一致."""
+        path, data = data_file
+        monkeypatch.setattr("src.utils.helpers.HASH_MMAP_THRESHOLD", 1024)
+        calls = []
+        original = helpers._update_from_mmap
+        monkeypatch.setattr(
+            "src.utils.helpers._update_from_mmap",
+            lambda h, fd: calls.append(fd) or original(h, fd),
+        )
+
+        assert calculate_file_hash(path, "sha256") == hashlib.sha256(data).hexdigest()
+        assert len(calls) == 1
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """测试空文件."""
+        path = tmp_path / "empty"
+        path.write_bytes(b"")
+        assert calculate_file_hash(path) == hashlib.md5(b"").hexdigest()
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("blake3") is not None, reason="已安装 blake3"
+    )
+    def test_blake3_requires_package(self, data_file) -> None:
+        """测试未安装 blake3 时报错."""
+        path, _ = data_file
+        with pytest.raises(ValueError, match="blake3"):
+            calculate_file_hash(path, "blake3")
+
+
+class TestCalculateFileHashes:
+    """批量文件哈希测试."""
+
+    @pytest.mark.parametrize("count", [0, 1, 5])
+    def test_matches_single_file_hash(self, tmp_path: Path, count: int) -> None:
+        """测试批量结果与逐个计算一致且保留路径对应关系."""
+        paths = []
+        for i in range(count):
+            path = tmp_path / f"file_{i}.bin"
+            path.write_bytes(bytes([i]) * (i + 1) * 1000)
+            paths.append(path)
+
+        result = calculate_file_hashes(paths, "sha256", workers=3)
+
+        assert list(result) == paths
+        for path in paths:
+            assert result[path] == calculate_file_hash(path, "sha256")
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        """测试文件不存在时抛出异常."""
+        existing = tmp_path / "a.bin"
+        existing.write_bytes(b"a")
+
+        with pytest.raises(FileNotFoundError):
+            calculate_file_hashes([existing, tmp_path / "missing.bin"])
+
+
+class TestSafeFilename:
+    """安全文件名测试."""
+
+    def test_replaces_unsafe_chars(self) -> None:
+        """测试替换全部不安全字符并去除首尾空白."""
+        assert safe_filename(' a<b>c:d"e/f\\g|h?i*j ') == "a_b_c_d_e_f_g_h_i_j"
+
+    def test_keeps_safe_name(self) -> None:
+        """测试安全文件名保持不变."""
+        assert safe_filename("商品图_01.png") == "商品图_01.png"
+
+
+class TestHexToRgb:
+    """颜色转换测试."""
+
+    @pytest.mark.parametrize(
+        ("hex_color", "rgb"),
+        [("#000000", (0, 0, 0)), ("#FF8000", (255, 128, 0)), ("1a2b3c", (26, 43, 60))],
+    )
+    def test_hex_to_rgb(self, hex_color: str, rgb: tuple[int, int, int]) -> None:
+        """测试十六进制转 RGB."""
+        assert hex_to_rgb(hex_color) == rgb
+
+    def test_round_trip(self) -> None:
+        """测试与 rgb_to_hex 互逆."""
+        assert hex_to_rgb(rgb_to_hex(12, 200, 255)) == (12, 200, 255)
+
+    def test_eight_digits_ignore_alpha(self) -> None:
+        """测试 8 位颜色只取前 6 位."""
+        assert hex_to_rgb("#FF000080") == (255, 0, 0)
+
+    @pytest.mark.parametrize("hex_color", ["#GGGGGG", "#FFF", "#12", "", "#", "#12345"])
+    def test_invalid_raises(self, hex_color: str) -> None:
+        """测试非法字符或位数不足抛出 ValueError."""
+        with pytest.raises(ValueError):
+            hex_to_rgb(hex_color)
+
+
+class TestMergeDicts:
+    """字典深度合并测试."""
+
+    def test_deep_merge(self) -> None:
+        """测试多层嵌套合并，非字典值直接覆盖."""
+        base = {"a": 1, "b": {"c": 2, "d": {"e": 3, "f": 4}}, "g": {"h": 5}}
+        override = {"b": {"d": {"f": 40, "x": 1}, "y": 2}, "g": 6, "z": {"k": 7}}
+
+        assert merge_dicts(base, override) == {
+            "a": 1,
+            "b": {"c": 2, "d": {"e": 3, "f": 40, "x": 1}, "y": 2},
+            "g": 6,
+            "z": {"k": 7},
+        }
+
+    def test_does_not_mutate_inputs(self) -> None:
+        """测试不修改输入字典."""
+        base = {"a": {"b": {"c": 1}}}
+        override = {"a": {"b": {"d": 2}}}
+
+        merge_dicts(base, override)
+
+        assert base == {"a": {"b": {"c": 1}}}
+        assert override == {"a": {"b": {"d": 2}}}
+
+    def test_dict_replaces_none(self) -> None:
+        """测试基础值为 None 时直接使用覆盖的字典."""
+        assert merge_dicts({"a": None}, {"a": {"b": 1}}) == {"a": {"b": 1}}
@@ -0,0 +1,542 @@
+"""图片工具函数单元测试."""
+
+from __future__ import annotations
+
+import base64
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageChops, ImageDraw, ImageStat
+
+from src.utils.exceptions import (
+    ImageCorruptedError,
+    ImageNotFoundError,
+    ImageTooLargeError,
+    UnsupportedImageFormatError,
+)
+from src.utils.image_utils import (
+    PNG_FAST_COMPRESS_LEVEL,
+    WEBP_FAST_METHOD,
+    _create_checkerboard,
+    _encoder_kwargs,
+    add_3d_border,
+    add_dashed_border,
+    add_dotted_border,
+    add_double_border,
+    add_solid_background,
+    add_solid_border,
+    apply_background_with_padding,
+    base64_to_image,
+    clear_image_cache,
+    convert_format,
+    create_background_preview,
+    create_thumbnail,
+    fit_to_size,
+    get_image_info,
+    image_to_base64,
+    load_image,
+    load_image_for_resize,
+    save_image,
+    validate_image_file,
+)
+
+
+class TestCheckerboard:
+    """棋盘格生成测试."""
+
+    @pytest.mark.parametrize(
+        ("size", "cell_size"), [((100, 100), 10), ((37, 23), 10), ((64, 31), 7), ((1, 1), 4)]
+    )
+    def test_cells_alternate(self, size: tuple[int, int], cell_size: int) -> None:
+        """测试格子颜色按行列奇偶交替（含不足一格的边缘）."""
+        color1, color2 = (200, 200, 200), (255, 255, 255)
+        img = _create_checkerboard(size, cell_size, color1, color2)
+
+        assert img.mode == "RGB"
+        assert img.size == size
+        w, h = size
+        for y in range(h):
+            for x in range(w):
+                even = (x // cell_size + y // cell_size) % 2 == 0
+                assert img.getpixel((x, y)) == (color2 if even else color1)
+
+    def test_preview_with_checkerboard(self) -> None:
+        """测试带棋盘格的背景预览."""
+        preview = create_background_preview((255, 0, 0), (20, 20), with_checkerboard=True)
+
+        assert preview.mode == "RGB"
+        assert preview.size == (20, 20)
+        # 半透明红色叠加在两种格子上得到不同颜色
+        assert preview.getpixel((0, 0)) != preview.getpixel((10, 0))
+        assert preview.getpixel((0, 0))[0] > 200
+
+
+class TestImageToBase64:
+    """图片转 Base64 测试."""
+
+    @pytest.mark.parametrize("fmt", ["PNG", "JPEG"])
+    def test_matches_encoded_bytes(self, fmt: str) -> None:
+        """测试结果与编码后的字节一致且可还原."""
+        image = Image.new("RGBA", (16, 8), (10, 20, 30, 128))
+
+        encoded = image_to_base64(image, fmt)
+
+        data = base64.b64decode(encoded)
+        assert data == convert_format(image, fmt)
+        with Image.open(io.BytesIO(data)) as decoded:
+            assert decoded.size == (16, 8)
+
+
+class TestBase64ToImage:
+    """Base64 转图片测试."""
+
+    @pytest.fixture
+    def encoded(self) -> str:
+        image = Image.new("RGB", (40, 30), (200, 100, 50))
+        return image_to_base64(image, "PNG")
+
+    def _assert_decoded(self, image: Image.Image) -> None:
+        assert image.size == (40, 30)
+        assert image.convert("RGB").getpixel((5, 5)) == (200, 100, 50)
+
+    def test_plain_payload(self, encoded: str) -> None:
+        """测试纯 Base64 字符串."""
+        self._assert_decoded(base64_to_image(encoded))
+
+    def test_data_url(self, encoded: str) -> None:
+        """测试带 data URL 前缀."""
+        self._assert_decoded(base64_to_image(f"data:image/png;base64,{encoded}"))
+
+    def test_multiple_chunks(self, encoded: str, monkeypatch) -> None:
+        """测试跨越多个解码块."""
+        monkeypatch.setattr("src.utils.image_utils._BASE64_DECODE_CHUNK", 8)
+        self._assert_decoded(base64_to_image(f"data:image/png;base64,{encoded}"))
+
+    def test_payload_with_line_breaks(self, encoded: str, monkeypatch) -> None:
+        """测试含换行的 Base64（MIME 风格）."""
+        monkeypatch.setattr("src.utils.image_utils._BASE64_DECODE_CHUNK", 8)
+        wrapped = "\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+        self._assert_decoded(base64_to_image(wrapped))
+
+
+class TestLoadImageDraft:
+    """JPEG 缩小解码测试."""
+
+    @pytest.fixture
+    def jpeg_path(self, tmp_path: Path) -> Path:
+        path = tmp_path / "large.jpg"
+        Image.new("RGB", (800, 600), (120, 80, 40)).save(path, "JPEG")
+        return path
+
+    def test_load_with_max_size_decodes_smaller(self, jpeg_path: Path) -> None:
+        """测试 JPEG 按不小于目标的最接近比例解码."""
+        img = load_image(jpeg_path, max_size=(200, 150))
+
+        assert img.size == (200, 150)
+
+    def test_load_without_max_size_keeps_full_size(self, jpeg_path: Path) -> None:
+        """测试默认加载完整分辨率."""
+        assert load_image(jpeg_path).size == (800, 600)
+
+    def test_load_for_resize(self, jpeg_path: Path) -> None:
+        """测试加载后精确缩放到目标尺寸."""
+        img = load_image_for_resize(jpeg_path, (300, 300))
+
+        assert img.size == (300, 225)
+
+    def test_non_jpeg_ignores_max_size(self, tmp_path: Path) -> None:
+        """测试非 JPEG 格式不受影响."""
+        path = tmp_path / "image.png"
+        Image.new("RGB", (80, 60)).save(path)
+
+        assert load_image(path, max_size=(10, 10)).size == (80, 60)
+
+
+class TestCreateThumbnail:
+    """缩略图测试."""
+
+    def test_keeps_aspect_and_source(self) -> None:
+        """测试缩略图保持纵横比且不修改原图."""
+        image = Image.new("RGB", (600, 300), (0, 128, 255))
+
+        thumb = create_thumbnail(image)
+
+        assert thumb.size == (150, 75)
+        assert image.size == (600, 300)
+        assert thumb.getpixel((75, 37)) == (0, 128, 255)
+
+
+class TestAddSolidBackground:
+    """纯色背景合成测试."""
+
+    def test_alpha_used_as_mask(self) -> None:
+        """测试透明区域显示背景色，不透明区域保留原色."""
+        image = Image.new("RGBA", (4, 2), (0, 0, 0, 0))
+        image.putpixel((0, 0), (255, 0, 0, 255))
+
+        result = add_solid_background(image, (0, 255, 0))
+
+        assert result.mode == "RGB"
+        assert result.getpixel((0, 0)) == (255, 0, 0)
+        assert result.getpixel((3, 1)) == (0, 255, 0)
+
+    @pytest.mark.parametrize("mode", ["RGB", "L", "P", "CMYK"])
+    def test_opaque_image_pasted_as_is(self, mode: str) -> None:
+        """测试不透明图片完全覆盖背景."""
+        image = Image.new("RGB", (4, 2), (255, 255, 255)).convert(mode)
+
+        result = add_solid_background(image, (0, 255, 0))
+
+        assert result.mode == "RGB"
+        assert result.getpixel((3, 1)) == (255, 255, 255)
+
+    def test_transparency_in_la_mode(self) -> None:
+        """测试 LA 模式的透明度."""
+        image = Image.new("LA", (4, 2), (0, 0))
+        image.putpixel((0, 0), (255, 255))
+
+        result = add_solid_background(image, (0, 255, 0))
+
+        assert result.getpixel((0, 0)) == (255, 255, 255)
+        assert result.getpixel((3, 1)) == (0, 255, 0)
+
+    def test_transparency_in_palette_image(self) -> None:
+        """测试带 transparency 信息的调色板图片."""
+        image = Image.new("P", (4, 2), 0)
+        image.putpalette([0, 0, 0, 255, 255, 255])
+        image.putpixel((0, 0), 1)
+        image.info["transparency"] = 0
+
+        result = add_solid_background(image, (0, 255, 0))
+
+        assert result.getpixel((0, 0)) == (255, 255, 255)
+        assert result.getpixel((3, 1)) == (0, 255, 0)
+
+
+class TestApplyBackgroundWithPadding:
+    """带边距背景测试."""
+
+    @pytest.mark.parametrize("mode", ["RGB", "RGBA"])
+    def test_padding(self, mode: str) -> None:
+        """测试边距区域为背景色，原图区域保留."""
+        image = Image.new(mode, (4, 2), (255, 0, 0) if mode == "RGB" else (255, 0, 0, 255))
+
+        result = apply_background_with_padding(image, (0, 0, 255), (1, 2, 3, 4))
+
+        assert result.size == (10, 6)
+        assert result.getpixel((0, 0)) == (0, 0, 255)
+        assert result.getpixel((4, 1)) == (255, 0, 0)
+        assert result.getpixel((7, 2)) == (255, 0, 0)
+
+
+class TestValidateImageFile:
+    """图片文件验证测试."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_image_cache()
+        yield
+        clear_image_cache()
+
+    def test_valid_image(self, tmp_path: Path) -> None:
+        """测试有效图片通过验证."""
+        path = tmp_path / "ok.png"
+        Image.new("RGB", (4, 4)).save(path)
+
+        validate_image_file(path)
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """测试文件不存在."""
+        with pytest.raises(ImageNotFoundError):
+            validate_image_file(tmp_path / "missing.png")
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        """测试不支持的格式."""
+        path = tmp_path / "doc.txt"
+        path.write_text("x")
+
+        with pytest.raises(UnsupportedImageFormatError):
+            validate_image_file(path)
+
+    def test_too_large(self, tmp_path: Path, monkeypatch) -> None:
+        """测试文件超过大小限制."""
+        path = tmp_path / "big.png"
+        Image.new("RGB", (4, 4)).save(path)
+        monkeypatch.setattr("src.utils.image_utils.MAX_IMAGE_FILE_SIZE", 10)
+
+        with pytest.raises(ImageTooLargeError):
+            validate_image_file(path)
+
+    def test_corrupted(self, tmp_path: Path) -> None:
+        """测试文件内容损坏."""
+        path = tmp_path / "broken.png"
+        path.write_bytes(b"not an image")
+
+        with pytest.raises(ImageCorruptedError):
+            validate_image_file(path)
+
+
+    def test_verify_cached_until_file_changes(self, tmp_path: Path, monkeypatch) -> None:
+        """测试文件未变化时复用校验结果，内容变化后重新校验."""
+        path = tmp_path / "ok.png"
+        Image.new("RGB", (4, 4)).save(path)
+        opened = []
+        original_open = Image.open
+        monkeypatch.setattr(
+            "src.utils.image_utils.Image.open",
+            lambda *args, **kwargs: opened.append(args[0]) or original_open(*args, **kwargs),
+        )
+
+        validate_image_file(path)
+        validate_image_file(str(path))
+        assert len(opened) == 1
+
+        path.write_bytes(b"broken")
+        with pytest.raises(ImageCorruptedError):
+            validate_image_file(path)
+        assert len(opened) == 2
+
+
+class TestGetImageInfo:
+    """图片信息测试."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        clear_image_cache()
+        yield
+        clear_image_cache()
+
+    def test_info_refreshes_when_file_changes(self, tmp_path: Path) -> None:
+        """测试返回副本，文件变化后读取新信息."""
+        path = tmp_path / "a.png"
+        Image.new("RGB", (4, 3)).save(path)
+
+        info = get_image_info(path)
+        assert info["size"] == (4, 3)
+        assert info["filename"] == "a.png"
+        assert info["file_size"] == path.stat().st_size
+        info["size"] = None
+        assert get_image_info(path)["size"] == (4, 3)
+
+        Image.new("RGBA", (8, 8)).save(path)
+        assert get_image_info(path)["mode"] == "RGBA"
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """测试文件不存在."""
+        with pytest.raises(FileNotFoundError):
+            get_image_info(tmp_path / "missing.png")
+
+
+class TestSaveImage:
+    """图片保存测试."""
+
+    @pytest.mark.parametrize("name", ["out.jpg", "OUT.JPEG"])
+    def test_jpeg_converts_rgba(self, tmp_path: Path, name: str) -> None:
+        """测试保存 JPEG 时自动转换 RGBA 并应用质量参数."""
+        image = Image.new("RGBA", (8, 8), (255, 0, 0, 128))
+
+        path = save_image(image, tmp_path / "sub" / name, quality=50)
+
+        with Image.open(path) as saved:
+            assert saved.format == "JPEG"
+            assert saved.mode == "RGB"
+
+    def test_png_keeps_alpha(self, tmp_path: Path) -> None:
+        """测试保存 PNG 保留透明通道."""
+        image = Image.new("RGBA", (8, 8), (255, 0, 0, 128))
+
+        path = save_image(image, tmp_path / "out.png")
+
+        with Image.open(path) as saved:
+            assert saved.mode == "RGBA"
+
+
+class TestEncoderKwargs:
+    """编码参数测试."""
+
+    @pytest.mark.parametrize(
+        ("fmt", "optimize", "fast", "expected"),
+        [
+            ("PNG", True, True, {"compress_level": PNG_FAST_COMPRESS_LEVEL}),
+            ("PNG", True, False, {"optimize": True}),
+            ("PNG", False, False, {}),
+            ("WEBP", False, True, {"quality": 85, "method": WEBP_FAST_METHOD}),
+            ("WEBP", False, False, {"quality": 85}),
+            ("JPEG", True, True, {"optimize": True, "quality": 85}),
+            (None, True, True, {"optimize": True}),
+        ],
+    )
+    def test_kwargs(self, fmt, optimize: bool, fast: bool, expected: dict) -> None:
+        """测试各格式在快速/常规模式下的编码参数."""
+        assert _encoder_kwargs(fmt, 85, optimize, fast) == expected
+
+    @pytest.mark.parametrize("fast", [True, False])
+    @pytest.mark.parametrize("name", ["out.png", "out.webp"])
+    def test_save_round_trip(self, tmp_path: Path, name: str, fast: bool) -> None:
+        """测试两种模式保存的图片都可正常读取."""
+        image = Image.new("RGB", (16, 16), (10, 200, 30))
+
+        path = save_image(image, tmp_path / name, fast=fast)
+
+        with Image.open(path) as saved:
+            assert saved.size == (16, 16)
+
+
+class TestConvertFormat:
+    """格式转换测试."""
+
+    @pytest.mark.parametrize(("fmt", "expected"), [("jpeg", "JPEG"), ("webp", "WEBP"), ("png", "PNG")])
+    def test_format_case_insensitive(self, fmt: str, expected: str) -> None:
+        """测试格式名不区分大小写."""
+        image = Image.new("RGBA", (8, 8), (0, 0, 255, 255))
+
+        data = convert_format(image, fmt)
+
+        with Image.open(io.BytesIO(data)) as decoded:
+            assert decoded.format == expected
+
+
+class TestAddSolidBorder:
+    """实线边框测试."""
+
+    @pytest.mark.parametrize(("size", "width"), [((20, 10), 3), ((7, 9), 1), ((6, 4), 5), ((5, 5), 0)])
+    def test_frame_pixels(self, size: tuple[int, int], width: int) -> None:
+        """测试边框区域为边框色，内部保持原色，原图不变."""
+        image = Image.new("RGB", size, (255, 255, 255))
+
+        result = add_solid_border(image, width, (255, 0, 0))
+
+        w, h = size
+        for y in range(h):
+            for x in range(w):
+                in_border = min(x, y, w - 1 - x, h - 1 - y) < width
+                assert result.getpixel((x, y)) == ((255, 0, 0) if in_border else (255, 255, 255))
+        assert image.getpixel((0, 0)) == (255, 255, 255)
+
+    def test_converts_to_rgb(self) -> None:
+        """测试非 RGB 输入输出为 RGB."""
+        result = add_solid_border(Image.new("RGBA", (6, 6), (0, 0, 255, 255)), 1, (255, 0, 0))
+
+        assert result.mode == "RGB"
+        assert result.getpixel((3, 3)) == (0, 0, 255)
+
+
+def _on_pattern_border(x: int, y: int, size: tuple[int, int], width: int, on: int, period: int) -> bool:
+    """参考实现：判断像素是否落在图案边框上."""
+    w, h = size
+    for layer in range(width):
+        if layer <= x < w - layer and y in (layer, h - 1 - layer) and (x - layer) % period < on:
+            return True
+        if layer <= y < h - layer and x in (layer, w - 1 - layer) and (y - layer) % period < on:
+            return True
+    return False
+
+
+class TestAddDoubleBorder:
+    """双线边框测试."""
+
+    @pytest.mark.parametrize(("size", "width"), [((30, 20), 9), ((25, 25), 6), ((40, 12), 3), ((10, 10), 1)])
+    def test_rings(self, size: tuple[int, int], width: int) -> None:
+        """测试外线、间隔、内线三段的像素."""
+        result = add_double_border(Image.new("RGB", size, (255, 255, 255)), width, (255, 0, 0))
+
+        line = max(1, width // 3)
+        gap = max(1, width - 2 * line)
+        w, h = size
+        for y in range(h):
+            for x in range(w):
+                depth = min(x, y, w - 1 - x, h - 1 - y)
+                expected = depth < line or line + gap <= depth < 2 * line + gap
+                assert (result.getpixel((x, y)) == (255, 0, 0)) == expected, (x, y)
+
+
+class TestAdd3dBorder:
+    """3D 边框测试."""
+
+    @staticmethod
+    def _reference(image: Image.Image, width: int, outer: tuple, inner: tuple) -> Image.Image:
+        """逐层画线的参考实现."""
+        result = image.copy()
+        draw = ImageDraw.Draw(result)
+        w, h = result.size
+        for i in range(width):
+            top_left, bottom_right = outer if i < width // 2 else inner
+            draw.line([(i, i), (w - 1 - i, i)], fill=top_left)
+            draw.line([(i, i), (i, h - 1 - i)], fill=top_left)
+            draw.line([(i, h - 1 - i), (w - 1 - i, h - 1 - i)], fill=bottom_right)
+            draw.line([(w - 1 - i, i), (w - 1 - i, h - 1 - i)], fill=bottom_right)
+        return result
+
+    @pytest.mark.parametrize(("size", "width"), [((40, 30), 8), ((21, 33), 5), ((12, 12), 6), ((9, 7), 6)])
+    def test_matches_line_drawing(self, size: tuple[int, int], width: int) -> None:
+        """测试与逐层画线结果一致（含斜角和边框重叠的小图）."""
+        image = Image.new("RGB", size, (255, 255, 255))
+        light, dark = (160, 180, 200), (40, 60, 80)
+
+        result = add_3d_border(image, width, (100, 120, 140), "groove")
+
+        expected = self._reference(image, width, (dark, light), (light, dark))
+        assert ImageChops.difference(result, expected).getbbox() is None
+
+
+class TestPatternBorders:
+    """虚线/点线边框测试."""
+
+    @pytest.mark.parametrize(
+        ("size", "width", "dash", "gap"),
+        [((40, 30), 3, 10, 5), ((17, 23), 2, 3, 4), ((9, 7), 6, 2, 1), ((12, 12), 1, 20, 5)],
+    )
+    def test_dashed(self, size, width: int, dash: int, gap: int) -> None:
+        """测试虚线像素位置（每段含两端端点）."""
+        result = add_dashed_border(Image.new("RGB", size, (255, 255, 255)), width, (255, 0, 0), dash, gap)
+
+        for y in range(size[1]):
+            for x in range(size[0]):
+                expected = _on_pattern_border(x, y, size, width, min(dash + 1, dash + gap), dash + gap)
+                assert (result.getpixel((x, y)) == (255, 0, 0)) == expected, (x, y)
+
+    @pytest.mark.parametrize(
+        ("size", "width", "spacing"), [((40, 30), 3, 4), ((11, 5), 4, 3), ((6, 6), 2, 1)]
+    )
+    def test_dotted(self, size, width: int, spacing: int) -> None:
+        """测试点线像素位置."""
+        result = add_dotted_border(Image.new("L", size, 255), width, (255, 0, 0), spacing)
+
+        assert result.mode == "RGB"
+        for y in range(size[1]):
+            for x in range(size[0]):
+                expected = _on_pattern_border(x, y, size, width, 1, spacing)
+                assert (result.getpixel((x, y)) == (255, 0, 0)) == expected, (x, y)
+
+
+class TestFitToSize:
+    """适配尺寸测试."""
+
+    def test_letterbox_and_quality(self) -> None:
+        """测试居中留白，且两级缩放结果与直接 LANCZOS 基本一致."""
+        image = Image.linear_gradient("L").resize((1024, 512)).convert("RGB")
+
+        result = fit_to_size(image, (100, 100), (0, 0, 255))
+
+        assert result.size == (100, 100)
+        assert result.getpixel((50, 0)) == (0, 0, 255)
+        reference = image.resize((100, 50), Image.Resampling.LANCZOS)
+        diff = ImageChops.difference(result.crop((0, 25, 100, 75)), reference)
+        assert max(ImageStat.Stat(diff).mean) < 1.0
+
+    @pytest.mark.parametrize("mode", ["RGB", "L", "RGBA"])
+    def test_exact_fit(self, mode: str) -> None:
+        """测试等比例缩放恰好铺满时的结果."""
+        image = Image.new("RGBA", (400, 200), (255, 0, 0, 128)).convert(mode)
+
+        result = fit_to_size(image, (200, 100), (0, 0, 255))
+
+        assert result.mode == "RGB"
+        assert result.size == (200, 100)
+        expected = {
+            "RGB": (255, 0, 0),
+            "L": image.convert("RGB").getpixel((0, 0)),
+            "RGBA": (128, 0, 127),
+        }[mode]
+        assert result.getpixel((100, 50)) == pytest.approx(expected, abs=1)
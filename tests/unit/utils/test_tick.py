@@ -0,0 +1,85 @@
+"""共享定时器单元测试."""
+
+from __future__ import annotations
+
+import gc
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject
+
+from src.utils.tick import SharedTick
+
+
+class _Receiver(QObject):
+    """记录回调次数的对象."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def on_tick(self) -> None:
+        self.count += 1
+
+
+class TestSharedTick:
+    """SharedTick 测试."""
+
+    def test_instance_is_shared(self, qapp) -> None:
+        """测试全局实例唯一."""
+        assert SharedTick.instance() is SharedTick.instance()
+
+    def test_register_and_unregister(self, qapp) -> None:
+        """测试注册后定时器启动，全部取消后停止."""
+        tick = SharedTick()
+        receiver = _Receiver()
+
+        tick.register(receiver.on_tick)
+        tick.register(receiver.on_tick)
+        assert tick.is_active
+        assert len(tick._callbacks) == 1
+
+        tick._on_timeout()
+        assert receiver.count == 1
+
+        tick.unregister(receiver.on_tick)
+        assert not tick.is_active
+
+    def test_callbacks_are_weak(self, qapp) -> None:
+        """测试回调所属对象回收后自动移除."""
+        tick = SharedTick()
+        receiver = _Receiver()
+        tick.register(receiver.on_tick)
+
+        del receiver
+        gc.collect()
+        tick._on_timeout()
+
+        assert tick._callbacks == []
+        assert not tick.is_active
+
+    def test_deleted_qobject_is_dropped(self, qapp) -> None:
+        """测试 C++ 对象已删除的回调被丢弃."""
+        tick = SharedTick()
+        receiver = _Receiver()
+        tick.register(receiver.on_tick)
+
+        sip.delete(receiver)
+        tick._on_timeout()
+
+        assert tick._callbacks == []
+
+    def test_callback_can_unregister_itself(self, qapp) -> None:
+        """测试回调中取消注册自身."""
+        tick = SharedTick()
+        receiver = _Receiver()
+
+        def once() -> None:
+            receiver.on_tick()
+            tick.unregister(once)
+
+        tick.register(once)
+        tick._on_timeout()
+        tick._on_timeout()
+
+        assert receiver.count == 1
+        assert not tick.is_active